@@ -0,0 +1,56 @@
+"""
+Benchmark dumping and loading many small NumpyModel instances one by one, and with dump_many and load_many
+
+Run from the repository root with: python -m benchmarks.bulk_io
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Final
+
+import numpy as np
+
+from pydantic_numpy.model import NumpyModel
+from pydantic_numpy.typing import Np1DArrayFp32, Np2DArrayInt64
+
+_MODEL_COUNT: Final = 1000
+_WORKERS: Final = 4
+
+
+class Record(NumpyModel):
+    position: Np1DArrayFp32
+    grid: Np2DArrayInt64
+    label: str
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    models_by_id = {
+        f"record_{index}": Record(position=rng.random(64), grid=rng.integers(0, 10, (16, 16)), label=str(index))
+        for index in range(_MODEL_COUNT)
+    }
+    print(f"{_MODEL_COUNT} models, {os.cpu_count()} CPUs")
+
+    with tempfile.TemporaryDirectory() as tmp_dirname:
+        tmp_path = Path(tmp_dirname)
+        start = time.perf_counter()
+        for object_id, model in models_by_id.items():
+            model.dump(tmp_path / "loop", object_id)
+        looped = time.perf_counter()
+        Record.dump_many(models_by_id, tmp_path / "bulk", workers=_WORKERS)
+        bulk = time.perf_counter()
+        print(f"dump | loop {looped - start:6.2f} s | dump_many, {_WORKERS} threads {bulk - looped:6.2f} s")
+
+        start = time.perf_counter()
+        for object_id in models_by_id:
+            Record.load(tmp_path / "loop", object_id)
+        looped = time.perf_counter()
+        Record.load_many(tmp_path / "bulk", list(models_by_id), workers=_WORKERS)
+        bulk = time.perf_counter()
+        print(f"load | loop {looped - start:6.2f} s | load_many, {_WORKERS} threads {bulk - looped:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark decoding of the {"data_type", "data"} dictionary against the previous implementation
+
+Run from the repository root with: python -m benchmarks.decode_data_dict
+"""
+
+import timeit
+from typing import Final
+
+import numpy as np
+import orjson
+from pydantic import BaseModel, validate_call
+
+from pydantic_numpy.helper.typing import NumpyArrayTypeData
+from pydantic_numpy.helper.validation import deserialize_numpy_array_from_data_dict
+from pydantic_numpy.typing import Np2DArrayFp32
+
+_REPEAT: Final = 5
+
+
+@validate_call
+def _previous_deserialize_numpy_array_from_data_dict(data_dict: NumpyArrayTypeData) -> np.ndarray:
+    return np.array(data_dict["data"]).astype(data_dict["data_type"])
+
+
+class _Model(BaseModel):
+    array: Np2DArrayFp32
+
+
+def _best_of(statement) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=_REPEAT))
+
+
+def main() -> None:
+    for rows in (1_000, 10_000, 100_000):
+        model = _Model(array=np.random.default_rng(0).random((rows, 10), dtype=np.float32))
+        json_str = model.model_dump_json()
+        data_dict = orjson.loads(json_str)["array"]
+
+        previous = _best_of(lambda data_dict=data_dict: _previous_deserialize_numpy_array_from_data_dict(data_dict))
+        current = _best_of(lambda data_dict=data_dict: deserialize_numpy_array_from_data_dict(data_dict))
+        model_python = _best_of(lambda data_dict=data_dict: _Model(array=data_dict))
+        model_json = _best_of(lambda json_str=json_str: _Model.model_validate_json(json_str))
+
+        print(
+            f"{rows * 10:>9} elements | previous {previous * 1e3:8.2f} ms | current {current * 1e3:8.2f} ms "
+            f"({previous / current:4.1f}x) | model (python) {model_python * 1e3:8.2f} ms "
+            f"| model (json) {model_json * 1e3:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
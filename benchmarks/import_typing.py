@@ -0,0 +1,32 @@
+"""
+Benchmark the import time of pydantic_numpy.typing, with and without resolving all type hints
+
+Every measurement imports in a fresh interpreter. Run from the repository root with: python -m benchmarks.import_typing
+"""
+
+import subprocess
+import sys
+from typing import Final
+
+_REPEAT: Final = 5
+
+_STATEMENTS: Final = {
+    "import pydantic_numpy.model": "import pydantic_numpy.model",
+    "import pydantic_numpy.typing": "import pydantic_numpy.typing",
+    "one type hint": "from pydantic_numpy.typing import Np2DArrayFp32",
+    "all type hints": "from pydantic_numpy.typing import *",
+}
+
+
+def _best_import_time(statement: str) -> float:
+    timer = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+    return min(float(subprocess.check_output([sys.executable, "-c", timer], text=True)) for _ in range(_REPEAT))
+
+
+def main() -> None:
+    for label, statement in _STATEMENTS.items():
+        print(f"{label:>28} | {_best_import_time(statement) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark validating, dumping and loading many records of one NumpyModel, one model per record or as a NumpyModelBatch
+
+Run from the repository root with: python -m benchmarks.model_batch
+"""
+
+import tempfile
+import time
+from pathlib import Path
+from typing import Final
+
+import numpy as np
+
+from pydantic_numpy.batch import NumpyModelBatch
+from pydantic_numpy.model import NumpyModel
+from pydantic_numpy.typing import Np1DArrayFp32, Np2DArrayInt64
+
+_RECORD_COUNT: Final = 10_000
+_DUMPED_RECORD_COUNT: Final = 200
+
+
+class Record(NumpyModel):
+    position: Np1DArrayFp32
+    grid: Np2DArrayInt64
+    weight: float
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    positions = rng.random((_RECORD_COUNT, 3))
+    grids = rng.integers(0, 10, (_RECORD_COUNT, 4, 4))
+    weights = rng.random(_RECORD_COUNT)
+
+    start = time.perf_counter()
+    records = [Record(position=positions[i], grid=grids[i], weight=weights[i]) for i in range(_RECORD_COUNT)]
+    per_model = time.perf_counter()
+    batch = NumpyModelBatch[Record](position=positions, grid=grids, weight=weights)
+    batched = time.perf_counter()
+    print(
+        f"validate {_RECORD_COUNT} records | per model {(per_model - start) * 1e3:8.1f} ms "
+        f"| batch {(batched - per_model) * 1e3:8.1f} ms"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dirname:
+        tmp_path = Path(tmp_dirname)
+        start = time.perf_counter()
+        for index, record in enumerate(records[:_DUMPED_RECORD_COUNT]):
+            record.dump(tmp_path, f"record_{index}")
+            Record.load(tmp_path, f"record_{index}")
+        per_model = time.perf_counter()
+        batch[:_DUMPED_RECORD_COUNT].dump(tmp_path, "batch")
+        NumpyModelBatch[Record].load(tmp_path, "batch")
+        batched = time.perf_counter()
+        print(
+            f"dump and load {_DUMPED_RECORD_COUNT} records | per model {(per_model - start) * 1e3:8.1f} ms "
+            f"| batch {(batched - per_model) * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
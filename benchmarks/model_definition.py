@@ -0,0 +1,49 @@
+"""
+Benchmark defining many NumpyModel classes, with the core schema built at definition or deferred to first use
+
+Run from the repository root with: python -m benchmarks.model_definition
+"""
+
+import time
+from typing import Final
+
+from pydantic import ConfigDict
+
+from pydantic_numpy.model import NumpyModel
+from pydantic_numpy.typing import Np1DArrayFp64, Np2DArrayInt64, NpNDArrayFp32
+
+_MODEL_COUNT: Final = 300
+_USED_MODEL_COUNT: Final = 3
+
+
+def _define_models(defer_build: bool) -> list[type[NumpyModel]]:
+    return [
+        type(
+            f"Model{index}",
+            (NumpyModel,),
+            {
+                "__annotations__": {"a": NpNDArrayFp32, "b": Np2DArrayInt64, "c": Np1DArrayFp64, "label": str},
+                "model_config": ConfigDict(defer_build=defer_build),
+            },
+        )
+        for index in range(_MODEL_COUNT)
+    ]
+
+
+def main() -> None:
+    for defer_build in (False, True):
+        start = time.perf_counter()
+        models = _define_models(defer_build)
+        defined = time.perf_counter()
+        for model in models[:_USED_MODEL_COUNT]:
+            model(a=[1.0], b=[[1]], c=[1.0], label="label")
+        used = time.perf_counter()
+
+        print(
+            f"defer_build={defer_build!s:>5} | define {_MODEL_COUNT} models {(defined - start) * 1e3:8.1f} ms "
+            f"| first use of {_USED_MODEL_COUNT} {(used - defined) * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
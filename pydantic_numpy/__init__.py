@@ -1,4 +1,21 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from pydantic_numpy.helper.annotation import np_array_pydantic_annotated_typing
-from pydantic_numpy.typing.n_dimensional import *
 
-__all__ = ["np_array_pydantic_annotated_typing", "model", "typing"]
+if TYPE_CHECKING:
+    from pydantic_numpy.typing.n_dimensional import *
+
+
+def __getattr__(name: str) -> Any:
+    # The n-dimensional type hints are re-exported from pydantic_numpy.typing, which imports them on first access;
+    # "from pydantic_numpy import typing" would call this function again until the submodule is imported
+    typing = importlib.import_module("pydantic_numpy.typing")
+
+    if typing._NAME_TO_MODULE.get(name) == "pydantic_numpy.typing.n_dimensional":
+        return getattr(typing, name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+__all__ = ["np_array_pydantic_annotated_typing", "batch", "model", "typing"]
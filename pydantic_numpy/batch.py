@@ -0,0 +1,232 @@
+import operator
+import os
+from pathlib import Path
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    ClassVar,
+    Iterator,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import annotated_types
+import numpy as np
+import numpy.typing as npt
+from pydantic import (
+    BeforeValidator,
+    FilePath,
+    TypeAdapter,
+    create_model,
+    model_validator,
+)
+from pydantic.fields import FieldInfo
+
+from pydantic_numpy.helper.annotation import NpArrayPydanticAnnotation
+from pydantic_numpy.helper.io import load_array_file
+from pydantic_numpy.model import LazyNumpyArray, MultiArrayNumpyFile, NumpyModel
+
+
+class NumpyModelBatch(NumpyModel):
+    """
+    Struct-of-arrays container for many records of the same NumpyModel, NumpyModelBatch[MyModel]
+
+    Every field of the model is one column: array fields are stacked along a new first axis, int, float and bool fields
+    are 1-D arrays, other fields are lists. A batch is a NumpyModel itself, so each column is validated for the whole
+    batch in one call, and the batch dumps and loads as a single array container. int, float and bool columns are
+    checked against the constraints of their field, e.g. Field(ge=0), element by element only when the vectorized check
+    fails or does not cover them. Records are built on demand by indexing, without validating them again.
+    """
+
+    model_class: ClassVar[Optional[type[NumpyModel]]] = None
+
+    _batch_classes: ClassVar[dict[tuple[type["NumpyModelBatch"], type[NumpyModel]], type["NumpyModelBatch"]]] = {}
+
+    def __class_getitem__(cls, model_class: type[NumpyModel]) -> type["NumpyModelBatch"]:  # type: ignore[override]
+        if cls.model_class is not None:
+            msg = f"{cls.__name__} is already a batch of {cls.model_class.__name__}"
+            raise TypeError(msg)
+        if (batch_class := cls._batch_classes.get((cls, model_class))) is None:
+            batch_class = create_model(  # type: ignore[call-overload]
+                f"{model_class.__name__}Batch",
+                __base__=cls,
+                __module__=model_class.__module__,
+                **{
+                    field_name: (_column_annotation(field_info), ...)
+                    for field_name, field_info in model_class.model_fields.items()
+                },
+            )
+            batch_class.model_class = model_class
+            batch_class = cls._batch_classes.setdefault((cls, model_class), batch_class)
+        return batch_class
+
+    @classmethod
+    def from_models(cls, models: Sequence[NumpyModel]) -> "NumpyModelBatch":
+        """
+        Stack the fields of model instances into a batch
+
+        Parameters
+        ----------
+        models: Sequence[NumpyModel]
+            Instances of model_class, at least one
+
+        Returns
+        -------
+        NumpyModelBatch
+        """
+        if cls.model_class is None:
+            msg = "Create batches from a parametrized class, e.g. NumpyModelBatch[MyModel]"
+            raise TypeError(msg)
+        if not models:
+            msg = "A batch requires at least one model, create empty batches from empty columns"
+            raise ValueError(msg)
+
+        field_to_column: dict[str, Any] = {}
+        for field_name in cls.model_class.model_fields:
+            values = [getattr(model, field_name) for model in models]
+            field_to_column[field_name] = (
+                np.stack(values) if _is_array_column(cls.model_fields[field_name]) else list(values)
+            )
+        return cls(**field_to_column)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.__dict__.values()), ()))
+
+    def __getitem__(self, index: Union[int, slice, npt.NDArray]) -> Any:
+        """
+        Record at an integer index, as a model_class instance; a batch of the selected records for a slice, an integer
+        array or a boolean mask. Slices of array columns are views.
+        """
+        if isinstance(index, (int, np.integer)):
+            return self.model_class.model_construct(  # type: ignore[union-attr]
+                **{field_name: _column_item(column, index) for field_name, column in self.__dict__.items()}
+            )
+
+        positions = None if isinstance(index, slice) else np.arange(len(self))[index]
+        field_to_column: dict[str, Any] = {
+            field_name: (
+                column[index]
+                if isinstance(column, (np.ndarray, LazyNumpyArray))
+                else column[index]
+                if positions is None
+                else [column[position] for position in positions]
+            )
+            for field_name, column in self.__dict__.items()
+        }
+        return self.model_construct(**field_to_column)
+
+    def iter_models(self) -> Iterator[NumpyModel]:
+        """
+        Build the records one by one, as model_class instances
+
+        Returns
+        -------
+        Iterator[NumpyModel]
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+    @model_validator(mode="after")
+    def _check_column_lengths(self) -> "NumpyModelBatch":
+        if len({len(column) for column in self.__dict__.values()}) > 1:
+            lengths = ", ".join(f"{field_name}: {len(column)}" for field_name, column in self.__dict__.items())
+            msg = f"All columns of a batch must have the same length; {lengths}"
+            raise ValueError(msg)
+        return self
+
+
+_SCALAR_TYPE_TO_DATA_TYPE: dict[type, type[np.generic]] = {int: np.int64, float: np.float64, bool: np.bool_}
+
+
+def _column_annotation(field_info: FieldInfo) -> Any:
+    for metadata in field_info.metadata:
+        if isinstance(metadata, type) and issubclass(metadata, NpArrayPydanticAnnotation):
+            return _array_column_annotation(
+                metadata.factory(
+                    data_type=metadata.data_type,
+                    dimensions=metadata.dimensions + 1 if metadata.dimensions else None,
+                    strict_data_typing=metadata.strict_data_typing,
+                    serialize_numpy_array_to_json=metadata.serialize_numpy_array_to_json,
+                    json_schema_from_type_data=metadata.json_schema_from_type_data,
+                    lazy=metadata.lazy,
+                    cached_file_validation=metadata.cached_file_validation,
+                )
+            )
+
+    if (data_type := _SCALAR_TYPE_TO_DATA_TYPE.get(field_info.annotation)) is not None:  # type: ignore[arg-type]
+        return Annotated[
+            _array_column_annotation(NpArrayPydanticAnnotation.factory(data_type=data_type, dimensions=1)),
+            BeforeValidator(_ScalarColumnValidator(field_info, data_type)),
+        ]
+    return _list_column_annotation(field_info)
+
+
+def _array_column_annotation(annotation: type) -> Any:
+    return Annotated[Union[np.ndarray, FilePath, MultiArrayNumpyFile], annotation]
+
+
+def _list_column_annotation(field_info: FieldInfo) -> Any:
+    if field_info.metadata:
+        return list.__class_getitem__(Annotated[(field_info.annotation, *field_info.metadata)])
+    return list.__class_getitem__(field_info.annotation)
+
+
+_CONSTRAINT_TO_CHECK: dict[type, Callable[[npt.NDArray, Any], npt.NDArray]] = {
+    annotated_types.Gt: lambda array, constraint: array > constraint.gt,
+    annotated_types.Ge: lambda array, constraint: array >= constraint.ge,
+    annotated_types.Lt: lambda array, constraint: array < constraint.lt,
+    annotated_types.Le: lambda array, constraint: array <= constraint.le,
+    annotated_types.MultipleOf: lambda array, constraint: operator.mod(array, constraint.multiple_of) == 0,
+}
+
+
+class _ScalarColumnValidator:
+    """
+    Validates the column of an int, float or bool field like the field validates each value
+
+    Columns whose dtype casts safely to the column dtype, and that pass the vectorized checks of the field constraints,
+    are passed on as they are. Any other column, e.g. floats for an int field or a constraint without a vectorized check,
+    is validated element by element with the field annotation, so that the errors are those of the model.
+    """
+
+    def __init__(self, field_info: FieldInfo, data_type: type[np.generic]):
+        self.data_type = data_type
+        self.constraints = field_info.metadata
+        self.element_adapter = TypeAdapter(_list_column_annotation(field_info))
+
+    def __call__(self, value: Any) -> Any:
+        if isinstance(value, (LazyNumpyArray, MultiArrayNumpyFile)):
+            value = value.load()
+        elif isinstance(value, (str, os.PathLike)):
+            value = load_array_file(Path(value))
+
+        array = np.asarray(value)
+        if array.ndim == 1 and np.can_cast(array.dtype, self.data_type, "safe") and self._satisfies_constraints(array):
+            return array
+        return self.element_adapter.validate_python(array.tolist() if array.ndim else value)
+
+    def _satisfies_constraints(self, array: npt.NDArray) -> bool:
+        for constraint in self.constraints:
+            if (check := _CONSTRAINT_TO_CHECK.get(type(constraint))) is None or not np.all(check(array, constraint)):
+                return False
+        return True
+
+
+def _is_array_column(field_info: FieldInfo) -> bool:
+    return any(
+        isinstance(metadata, type) and issubclass(metadata, NpArrayPydanticAnnotation)
+        for metadata in field_info.metadata
+    )
+
+
+def _column_item(column: Any, index: int) -> Any:
+    item = column[index]
+    if isinstance(column, (np.ndarray, LazyNumpyArray)) and np.ndim(item) == 0 and column.ndim == 1:
+        # The column of an int, float or bool field; 1-D array fields are 2-D columns
+        return item.item()
+    return item
+
+
+__all__ = ["NumpyModelBatch"]
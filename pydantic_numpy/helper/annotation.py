@@ -1,66 +1,29 @@
 from collections.abc import Sequence
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any, Callable, ClassVar, Iterable, Optional, Union
 
 import numpy as np
 import numpy.typing as npt
-from pydantic import FilePath, GetJsonSchemaHandler, PositiveInt, validate_call
+from pydantic import FilePath, GetJsonSchemaHandler, PositiveInt
 from pydantic.json_schema import JsonSchemaValue
 from pydantic_core import core_schema
 from typing_extensions import Annotated, Final
 
-from pydantic_numpy.helper.typing import NumpyArrayTypeData, SupportedDTypes
+from pydantic_numpy.helper.serialization import (
+    pd_np_native_numpy_array_to_data_dict_serializer,
+)
+from pydantic_numpy.helper.typing import SupportedDTypes
 from pydantic_numpy.helper.validation import (
     create_array_validator,
+    deserialize_numpy_array_from_data_dict,
+    validate_cached_numpy_array_file,
+    validate_lazy_multi_array_numpy_file,
+    validate_lazy_numpy_array_file,
     validate_multi_array_numpy_file,
     validate_numpy_array_file,
 )
-from pydantic_numpy.model import MultiArrayNumpyFile
-
-
-def pd_np_native_numpy_array_to_data_dict_serializer(array_like: npt.ArrayLike) -> NumpyArrayTypeData:
-    """
-    Serialize a NumPy array into a data dictionary format suitable for frontend display or processing.
-
-    This function converts a given NumPy array into a dictionary format, which includes the data type
-    and the data itself. If the array contains datetime or timedelta objects, it converts them into integer
-    representations. Otherwise, the array is converted to a floating-point representation. This is particularly
-    useful for preparing NumPy array data for JSON serialization or similar use cases where NumPy's native
-    data types are not directly compatible.
-
-    Note
-    ----
-    This function is intended for internal use within a package for handling specific serialization needs
-    of NumPy arrays for frontend applications or similar use cases. It should not be used as a general-purpose
-    serialization tool.
-
-    Parameters
-    ----------
-    array_like: np.ndarray
-                  The NumPy array to be serialized. This can be a standard numerical array or an array
-                  of datetime/timedelta objects.
-
-    Returns
-    -------
-    NumpyArrayTypeData
-                   A dictionary with two keys: 'data_type', a string representing the data type of the array,
-                   and 'data', a list of values converted from the array. The conversion is to integer if the
-                   original data type is datetime or timedelta, and to float for other data types.
-
-    Example
-    -------
-    >>> my_array = np.array([1, 2, 3])
-    >>> pd_np_native_numpy_array_to_data_dict_serializer(my_array)
-    {'data_type': 'int64', 'data': [1.0, 2.0, 3.0]}
-    """
-    array = np.array(array_like)
-
-    if issubclass(array.dtype.type, np.timedelta64) or issubclass(array.dtype.type, np.datetime64):
-        data = array.astype(int).tolist()
-    else:
-        data = array.astype(float).tolist()
-
-    return NumpyArrayTypeData(data_type=str(array.dtype), data=data)
+from pydantic_numpy.model import LazyNumpyArray, MultiArrayNumpyFile
 
 
 def pd_np_native_numpy_array_json_schema_from_type_data(
@@ -127,11 +90,52 @@ def pd_np_native_numpy_array_json_schema_from_type_data(
     )
 
 
+def pd_np_native_numpy_array_json_schema_from_base64_type_data(
+    _field_core_schema: core_schema.CoreSchema,
+    _handler: GetJsonSchemaHandler,
+    dimensions: Optional[PositiveInt] = None,
+    data_type: Optional[SupportedDTypes] = None,
+) -> JsonSchemaValue:
+    """
+    Generates a JSON schema for a NumPy array field serialized as a base64 envelope.
+
+    Companion of pd_np_native_numpy_array_to_base64_data_dict_serializer, see
+    pd_np_native_numpy_array_json_schema_from_type_data for the parameters.
+
+    Returns
+    -------
+    JsonSchemaValue
+        A dictionary representing the JSON schema of the base64 envelope.
+    """
+    array_shape = _dimensions_to_shape_type[dimensions] if dimensions else "Any"
+    array_data_type = data_type.__name__ if data_type and _data_type_resolver(data_type) else "Any"
+
+    shape_schema = core_schema.list_schema(
+        items_schema=core_schema.int_schema(ge=0), min_length=dimensions, max_length=dimensions
+    )
+
+    return dict(
+        title="Numpy Array",
+        type=f"np.ndarray[{array_shape}, np.dtype[{array_data_type}]]",
+        required=["data_type", "shape", "encoding", "data"],
+        properties=dict(
+            data_type={"title": "dtype", "default": array_data_type, "type": "string"},
+            shape=shape_schema,
+            encoding={"const": "base64", "type": "string"},
+            data={"title": "Base64 encoded array buffer", "type": "string"},
+        ),
+    )
+
+
 class NpArrayPydanticAnnotation:
     dimensions: ClassVar[Optional[PositiveInt]]
     data_type: ClassVar[SupportedDTypes]
 
     strict_data_typing: ClassVar[bool]
+    lazy: ClassVar[bool]
+    cached_file_validation: ClassVar[bool]
+
+    _core_schema: ClassVar[core_schema.CoreSchema]
 
     serialize_numpy_array_to_json: ClassVar[Callable[[npt.ArrayLike], Iterable]]
     json_schema_from_type_data: ClassVar[
@@ -155,12 +159,14 @@ class NpArrayPydanticAnnotation:
             [core_schema.CoreSchema, GetJsonSchemaHandler, Optional[PositiveInt], Optional[SupportedDTypes]],
             JsonSchemaValue,
         ] = pd_np_native_numpy_array_json_schema_from_type_data,
+        lazy: bool = False,
+        cached_file_validation: bool = False,
     ) -> type:
         """
         Create an instance NpArrayPydanticAnnotation that is configured for a specific dimension and dtype.
 
         The signature of the function is data_type, dimension and not dimension, data_type to reduce amount of
-        code for all the types.
+        code for all the types. Calls with the same arguments return the same class, whose core schema is built once.
 
         Parameters
         ----------
@@ -174,6 +180,12 @@ class NpArrayPydanticAnnotation:
             Json serialization function to use. Defaults to NumpyArrayTypeData serializer.
         json_schema_from_type_data: Callable
             Json schema generation function to use. Defaults to NumpyArrayTypeData schema generator.
+        lazy: bool
+            If True, FilePath and MultiArrayNumpyFile inputs are validated from the array header only (dtype and
+            dimensions); the field holds a LazyNumpyArray that loads and caches the array on first use.
+        cached_file_validation: bool
+            If True, the validated arrays of FilePath inputs are shared through validated_array_file_cache, until the
+            file is modified; the arrays are read-only. Can not be combined with lazy.
 
         Returns
         -------
@@ -182,10 +194,26 @@ class NpArrayPydanticAnnotation:
         if strict_data_typing and not data_type:
             msg = "Strict data typing requires data_type (SupportedDTypes) definition"
             raise ValueError(msg)
+        if lazy and cached_file_validation:
+            msg = "Lazy file inputs are not validated from the array data, they can not use cached_file_validation"
+            raise ValueError(msg)
+
+        key = (
+            cls,
+            data_type,
+            dimensions,
+            strict_data_typing,
+            serialize_numpy_array_to_json,
+            json_schema_from_type_data,
+            lazy,
+            cached_file_validation,
+        )
+        if (annotation_class := _annotation_classes.get(key)) is not None:
+            return annotation_class
 
-        return type(
+        annotation_class = type(
             (
-                f"Np{'Strict' if strict_data_typing else ''}{dimensions or 'N'}DArray"
+                f"Np{'Lazy' if lazy else ''}{'Strict' if strict_data_typing else ''}{dimensions or 'N'}DArray"
                 f"{data_type.__name__.capitalize() if data_type else ''}PydanticAnnotation"
             ),
             (cls,),
@@ -193,10 +221,13 @@ class NpArrayPydanticAnnotation:
                 "dimensions": dimensions,
                 "data_type": data_type,
                 "strict_data_typing": strict_data_typing,
+                "lazy": lazy,
+                "cached_file_validation": cached_file_validation,
                 "serialize_numpy_array_to_json": serialize_numpy_array_to_json,
                 "json_schema_from_type_data": json_schema_from_type_data,
             },
         )
+        return _annotation_classes.setdefault(key, annotation_class)
 
     @classmethod
     def __get_pydantic_core_schema__(
@@ -204,17 +235,40 @@ class NpArrayPydanticAnnotation:
         _source_type: Any,
         _handler: Callable[[Any], core_schema.CoreSchema],
     ) -> core_schema.CoreSchema:
+        # The schema only depends on the class, it is built once and shared, under a ref, by all fields of the class;
+        # pydantic adds metadata to the returned dict, so every field gets a shallow copy
+        if (schema := cls.__dict__.get("_core_schema")) is None:
+            schema = cls._core_schema = cls._build_core_schema()
+        return {**schema}  # type: ignore[return-value]
+
+    @classmethod
+    def _build_core_schema(cls) -> core_schema.CoreSchema:
         np_array_validator = create_array_validator(cls.dimensions, cls.data_type, cls.strict_data_typing)
         np_array_schema = core_schema.no_info_plain_validator_function(np_array_validator)
 
+        if cls.lazy:
+            common_validator = _common_lazy_numpy_array_validator
+        elif cls.cached_file_validation:
+            common_validator = _numpy_array_validator_union(
+                partial(
+                    validate_cached_numpy_array_file,
+                    array_validator=np_array_validator,
+                    target=(cls.dimensions, cls.data_type, cls.strict_data_typing),
+                ),
+                validate_multi_array_numpy_file,
+            )
+        else:
+            common_validator = _common_numpy_array_validator
+
         return core_schema.json_or_python_schema(
-            python_schema=core_schema.chain_schema([_common_numpy_array_validator, np_array_schema]),
+            python_schema=core_schema.chain_schema([common_validator, np_array_schema]),
             json_schema=np_array_schema,
             serialization=core_schema.plain_serializer_function_ser_schema(
                 cls.serialize_numpy_array_to_json,
                 is_field_serializer=False,
                 when_used="json-unless-none",
             ),
+            ref=f"{cls.__module__}.{cls.__qualname__}:{id(cls)}",
         )
 
     @classmethod
@@ -224,6 +278,7 @@ class NpArrayPydanticAnnotation:
         return cls.json_schema_from_type_data(field_core_schema, handler, cls.dimensions, cls.data_type)
 
 
+@lru_cache(maxsize=None)
 def np_array_pydantic_annotated_typing(
     data_type: Optional[SupportedDTypes] = None,
     dimensions: Optional[int] = None,
@@ -231,6 +286,12 @@ def np_array_pydantic_annotated_typing(
     serialize_numpy_array_to_json: Callable[
         [npt.ArrayLike], Iterable
     ] = pd_np_native_numpy_array_to_data_dict_serializer,
+    json_schema_from_type_data: Callable[
+        [core_schema.CoreSchema, GetJsonSchemaHandler, Optional[PositiveInt], Optional[SupportedDTypes]],
+        JsonSchemaValue,
+    ] = pd_np_native_numpy_array_json_schema_from_type_data,
+    lazy: bool = False,
+    cached_file_validation: bool = False,
 ):
     """
     Generates typing and pydantic annotation of a np.ndarray parametrized with given constraints
@@ -244,6 +305,13 @@ def np_array_pydantic_annotated_typing(
         If True, the dtype of the numpy array must be identical to the data_type. No conversion attempts.
     serialize_numpy_array_to_json: Callable[[npt.ArrayLike], Iterable]
         Json serialization function to use. Defaults to NumpyArrayTypeData serializer.
+    json_schema_from_type_data: Callable
+        Json schema generation function to use, matching serialize_numpy_array_to_json. Defaults to NumpyArrayTypeData
+        schema generator; use pd_np_native_numpy_array_json_schema_from_base64_type_data with the base64 serializer.
+    lazy: bool
+        If True, file inputs are loaded on first use instead of during validation, see LazyNumpyArray.
+    cached_file_validation: bool
+        If True, arrays validated from the same unmodified file are shared read-only, see validated_array_file_cache.
 
     Returns
     -------
@@ -252,7 +320,8 @@ def np_array_pydantic_annotated_typing(
     Note
     ----
     The function generates the type hints dynamically, and will not work with static type checkers such as mypy
-    or pyright. For that you need to create your types manually.
+    or pyright. For that you need to create your types manually. Calls with the same arguments return the same
+    type hint.
     """
     return Annotated[
         Union[
@@ -270,17 +339,18 @@ def np_array_pydantic_annotated_typing(
             dimensions=dimensions,
             strict_data_typing=strict_data_typing,
             serialize_numpy_array_to_json=serialize_numpy_array_to_json,
+            json_schema_from_type_data=json_schema_from_type_data,
+            lazy=lazy,
+            cached_file_validation=cached_file_validation,
         ),
     ]
 
 
-def _data_type_resolver(data_type: Optional[SupportedDTypes]) -> bool:
-    return data_type is not None and issubclass(data_type, np.generic)
+_annotation_classes: Final[dict[tuple, type]] = {}
 
 
-@validate_call
-def _deserialize_numpy_array_from_data_dict(data_dict: NumpyArrayTypeData) -> np.ndarray:
-    return np.array(data_dict["data"]).astype(data_dict["data_type"])
+def _data_type_resolver(data_type: Optional[SupportedDTypes]) -> bool:
+    return data_type is not None and issubclass(data_type, np.generic)
 
 
 # IN_THE_FUTURE: Only works with 3.11 and above
@@ -300,32 +370,42 @@ _dimensions_to_shape_type: Final[dict[PositiveInt, type[tuple[int, ...]]]] = {
 }
 
 
-_common_numpy_array_validator = core_schema.union_schema(
-    [
-        core_schema.chain_schema(
-            [
-                core_schema.is_instance_schema(Path),
-                core_schema.no_info_plain_validator_function(validate_numpy_array_file),
-            ]
-        ),
-        core_schema.chain_schema(
-            [
-                core_schema.is_instance_schema(MultiArrayNumpyFile),
-                core_schema.no_info_plain_validator_function(validate_multi_array_numpy_file),
-            ]
-        ),
-        core_schema.is_instance_schema(np.ndarray),
-        core_schema.chain_schema(
-            [
-                core_schema.is_instance_schema(Sequence),
-                core_schema.no_info_plain_validator_function(lambda v: np.asarray(v)),
-            ]
-        ),
-        core_schema.chain_schema(
-            [
-                core_schema.is_instance_schema(dict),
-                core_schema.no_info_plain_validator_function(_deserialize_numpy_array_from_data_dict),
-            ]
-        ),
-    ]
+def _numpy_array_validator_union(
+    validate_file_path: Callable[[FilePath], Any], validate_multi_array_file: Callable[[MultiArrayNumpyFile], Any]
+) -> core_schema.CoreSchema:
+    return core_schema.union_schema(
+        [
+            core_schema.chain_schema(
+                [
+                    core_schema.is_instance_schema(Path),
+                    core_schema.no_info_plain_validator_function(validate_file_path),
+                ]
+            ),
+            core_schema.chain_schema(
+                [
+                    core_schema.is_instance_schema(MultiArrayNumpyFile),
+                    core_schema.no_info_plain_validator_function(validate_multi_array_file),
+                ]
+            ),
+            core_schema.is_instance_schema(np.ndarray),
+            core_schema.is_instance_schema(LazyNumpyArray),
+            core_schema.chain_schema(
+                [
+                    core_schema.is_instance_schema(Sequence),
+                    core_schema.no_info_plain_validator_function(lambda v: np.asarray(v)),
+                ]
+            ),
+            core_schema.chain_schema(
+                [
+                    core_schema.is_instance_schema(dict),
+                    core_schema.no_info_plain_validator_function(deserialize_numpy_array_from_data_dict),
+                ]
+            ),
+        ]
+    )
+
+
+_common_numpy_array_validator = _numpy_array_validator_union(validate_numpy_array_file, validate_multi_array_numpy_file)
+_common_lazy_numpy_array_validator = _numpy_array_validator_union(
+    validate_lazy_numpy_array_file, validate_lazy_multi_array_numpy_file
 )
@@ -0,0 +1,104 @@
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Hashable, NamedTuple
+
+import numpy.typing as npt
+
+
+class ArrayCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+
+
+class ArrayCache:
+    """
+    Thread-safe LRU cache of loaded arrays, bounded by their total number of bytes
+
+    Entries are keyed by path and key, and are only served while the modification time and size of the file match the
+    ones seen when the array was loaded. Cached arrays are shared between callers and therefore read-only.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Parameters
+        ----------
+        max_bytes: int
+            Upper bound on the total number of bytes of the cached arrays; larger arrays are loaded but not cached
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, Hashable], _ArrayCacheEntry] = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, key: Hashable, load: Callable[[], npt.NDArray]) -> npt.NDArray:
+        """
+        Look up the array stored in path under key, loading and caching it with load on a miss
+
+        Parameters
+        ----------
+        path: Path
+            Path to the file that holds the array
+        key: Hashable
+            Key of the array within the file, or of whatever else distinguishes arrays loaded from the same file
+        load: Callable[[], NDArray]
+            Loads the array, called without holding the cache lock
+
+        Returns
+        -------
+        NDArray, read-only
+        """
+        stat = os.stat(path)
+        entry_key = (os.fspath(Path(path).resolve()), key)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if (entry := self._entries.get(entry_key)) is not None and entry.version == version:
+                self._entries.move_to_end(entry_key)
+                self._hits += 1
+                return entry.array
+            self._misses += 1
+
+        array = load()
+        array.flags.writeable = False
+        if array.nbytes > self.max_bytes:
+            return array
+
+        with self._lock:
+            if (stale_entry := self._entries.pop(entry_key, None)) is not None:
+                self._nbytes -= stale_entry.array.nbytes
+            self._entries[entry_key] = _ArrayCacheEntry(version, array)
+            self._nbytes += array.nbytes
+            while self._nbytes > self.max_bytes:
+                _, evicted_entry = self._entries.popitem(last=False)
+                self._nbytes -= evicted_entry.array.nbytes
+                self._evictions += 1
+        return array
+
+    def clear(self) -> None:
+        """Remove all cached arrays and reset the statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> ArrayCacheStats:
+        """
+        Hit, miss and eviction counts, and the number and total bytes of the cached arrays
+
+        Returns
+        -------
+        ArrayCacheStats
+        """
+        with self._lock:
+            return ArrayCacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._nbytes)
+
+
+class _ArrayCacheEntry(NamedTuple):
+    version: tuple[int, int]
+    array: npt.NDArray
@@ -0,0 +1,161 @@
+import zlib
+from typing import IO, Final, Protocol
+
+import lz4.frame
+
+
+class ArrayCodec(Protocol):
+    """
+    Streaming compression codec for per-field array files; the file of a field is named {field}.npy{suffix}
+    """
+
+    name: str
+    suffix: str
+
+    def open_writer(self, fp: IO[bytes]) -> IO[bytes]:
+        """Wrap a binary file, opened for writing, in a compressing writer; closing it does not close fp"""
+        ...
+
+    def open_reader(self, fp: IO[bytes]) -> IO[bytes]:
+        """Wrap a binary file, opened for reading, in a decompressing reader; closing it does not close fp"""
+        ...
+
+
+class NoneCodec:
+    name = "none"
+    suffix = ""
+
+    def open_writer(self, fp: IO[bytes]) -> IO[bytes]:
+        return fp
+
+    def open_reader(self, fp: IO[bytes]) -> IO[bytes]:
+        return fp
+
+
+class ZlibCodec:
+    name = "zlib"
+    suffix = ".zlib"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def open_writer(self, fp: IO[bytes]) -> IO[bytes]:
+        return _ZlibWriter(fp, self.level)  # type: ignore[return-value]
+
+    def open_reader(self, fp: IO[bytes]) -> IO[bytes]:
+        return _ZlibReader(fp)  # type: ignore[return-value]
+
+
+class Lz4Codec:
+    name = "lz4"
+    suffix = ".lz4"
+
+    def __init__(self, level: int = 0):
+        self.level = level
+
+    def open_writer(self, fp: IO[bytes]) -> IO[bytes]:
+        return lz4.frame.LZ4FrameFile(fp, "wb", compression_level=self.level)  # type: ignore[return-value]
+
+    def open_reader(self, fp: IO[bytes]) -> IO[bytes]:
+        return lz4.frame.LZ4FrameFile(fp, "rb")  # type: ignore[return-value]
+
+
+class ZstdCodec:
+    """
+    Requires the optional zstandard package, install pydantic_numpy[zstd]
+    """
+
+    name = "zstd"
+    suffix = ".zst"
+
+    def __init__(self, level: int = 3):
+        self.level = level
+
+    def open_writer(self, fp: IO[bytes]) -> IO[bytes]:
+        return _import_zstandard().ZstdCompressor(level=self.level).stream_writer(fp, closefd=False)
+
+    def open_reader(self, fp: IO[bytes]) -> IO[bytes]:
+        return _import_zstandard().ZstdDecompressor().stream_reader(fp, closefd=False)
+
+
+array_codecs: Final[dict[str, ArrayCodec]] = {
+    codec.name: codec for codec in (NoneCodec(), ZlibCodec(), Lz4Codec(), ZstdCodec())
+}
+
+
+def get_array_codec(name: str) -> ArrayCodec:
+    """
+    Look up a registered array codec by name
+
+    Parameters
+    ----------
+    name: str
+        Name of the codec, e.g. "zlib"
+
+    Returns
+    -------
+    ArrayCodec
+    """
+    try:
+        return array_codecs[name]
+    except KeyError:
+        msg = f"Unknown array codec {name!r}; available codecs: {', '.join(array_codecs)}"
+        raise ValueError(msg) from None
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        msg = "The zstd array codec requires the zstandard package, install pydantic_numpy[zstd]"
+        raise ModuleNotFoundError(msg) from None
+    return zstandard
+
+
+_READ_SIZE: Final = 2**20
+
+
+class _ZlibWriter:
+    def __init__(self, fp: IO[bytes], level: int):
+        self._fp = fp
+        self._compressor = zlib.compressobj(level)
+
+    def write(self, data: bytes) -> int:
+        self._fp.write(self._compressor.compress(data))
+        return len(data)
+
+    def close(self) -> None:
+        self._fp.write(self._compressor.flush())
+
+    def __enter__(self) -> "_ZlibWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _ZlibReader:
+    def __init__(self, fp: IO[bytes]):
+        self._fp = fp
+        self._decompressor = zlib.decompressobj()
+
+    def read(self, size: int) -> bytes:
+        chunks = []
+        missing = size
+        while missing > 0 and not self._decompressor.eof:
+            data = self._decompressor.unconsumed_tail or self._fp.read(_READ_SIZE)
+            if not data:
+                break
+            chunk = self._decompressor.decompress(data, missing)
+            chunks.append(chunk)
+            missing -= len(chunk)
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "_ZlibReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
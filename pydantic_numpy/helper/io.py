@@ -0,0 +1,1072 @@
+import hashlib
+import io
+import json
+import math
+import operator
+import os
+import shutil
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import product
+from pathlib import Path
+from typing import IO, Any, Callable, Final, Iterator, NamedTuple, Optional, TypeVar
+from uuid import uuid4
+
+import numpy as np
+import numpy.typing as npt
+from numpy.lib import format as npy_format
+
+from pydantic_numpy.helper.codec import ArrayCodec, NoneCodec, array_codecs
+from pydantic_numpy.helper.typing import ChecksumAlgorithm, MemoryMapMode
+from pydantic_numpy.util import iter_c_contiguous_blocks
+
+T = TypeVar("T")
+
+
+class NumpyArrayHeader(NamedTuple):
+    shape: tuple[int, ...]
+    fortran_order: bool
+    dtype: np.dtype
+
+
+class ArrayInfo(NamedTuple):
+    shape: tuple[int, ...]
+    dtype: np.dtype
+    nbytes: int
+    codec: str
+    checksum: Optional[str]
+    blob: Optional[str] = None
+
+
+class ArrayManifest(NamedTuple):
+    layout: str
+    arrays: dict[str, ArrayInfo]
+
+
+def read_npy_header(fp: IO[bytes]) -> NumpyArrayHeader:
+    """
+    Read the header of a .npy stream, leaves the stream positioned at the start of the array data
+
+    Parameters
+    ----------
+    fp: IO[bytes]
+        Binary stream positioned at the start of a .npy file
+
+    Returns
+    -------
+    NumpyArrayHeader
+    """
+    version = npy_format.read_magic(fp)
+    if version == (1, 0):
+        return NumpyArrayHeader(*npy_format.read_array_header_1_0(fp))
+    if version == (2, 0):
+        return NumpyArrayHeader(*npy_format.read_array_header_2_0(fp))
+
+    msg = f"Unsupported .npy format version: {version}"
+    raise ValueError(msg)
+
+
+def read_npy_file_header(path: Path) -> NumpyArrayHeader:
+    """
+    Read the header of a .npy file without reading the array data
+
+    Parameters
+    ----------
+    path: Path
+        Path to the .npy file
+
+    Returns
+    -------
+    NumpyArrayHeader
+    """
+    with open(path, "rb") as fp:
+        return read_npy_header(fp)
+
+
+def read_npz_member_header(path: Path, key: str) -> NumpyArrayHeader:
+    """
+    Read the header of one array in a .npz file, only the first bytes of the member are decompressed
+
+    Parameters
+    ----------
+    path: Path
+        Path to the .npz file
+    key: str
+        Name of the array within the file
+
+    Returns
+    -------
+    NumpyArrayHeader
+    """
+    with zipfile.ZipFile(path) as zip_file, zip_file.open(f"{key}.npy") as fp:
+        return read_npy_header(fp)
+
+
+def npz_keys(path: Path) -> list[str]:
+    """
+    List the array names of a .npz file
+
+    Parameters
+    ----------
+    path: Path
+        Path to the .npz file
+
+    Returns
+    -------
+    list[str]
+    """
+    with zipfile.ZipFile(path) as zip_file:
+        return [name.removesuffix(".npy") for name in zip_file.namelist()]
+
+
+def array_file_name(name: str, codec: ArrayCodec) -> str:
+    """
+    File name of an array stored with save_array_file
+
+    Parameters
+    ----------
+    name: str
+        Name of the array
+    codec: ArrayCodec
+
+    Returns
+    -------
+    str, {name}.npy followed by the codec suffix
+    """
+    return f"{name}.npy{codec.suffix}"
+
+
+def parse_array_file_name(file_name: str) -> Optional[tuple[str, ArrayCodec]]:
+    """
+    Inverse of array_file_name
+
+    Parameters
+    ----------
+    file_name: str
+
+    Returns
+    -------
+    Array name and codec, None if the file name does not belong to an array file
+    """
+    for codec in array_codecs.values():
+        if file_name.endswith(extension := f".npy{codec.suffix}"):
+            return file_name.removesuffix(extension), codec
+    return None
+
+
+@contextmanager
+def open_for_replace(path: Path) -> Iterator[IO[bytes]]:
+    """
+    Open a temporary file next to path for writing, and move it over path once the block exits without an error
+
+    An existing file at path is never truncated, so arrays memory-mapped from it, or read from it lazily, stay valid
+    and readers never see a partial file.
+
+    Parameters
+    ----------
+    path: Path
+
+    Returns
+    -------
+    Binary file object of the temporary file
+    """
+    temporary_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        with open(temporary_path, "wb") as fp:
+            yield fp
+        temporary_path.replace(path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+
+def save_array_file(path: Path, array: npt.NDArray, codec: ArrayCodec) -> None:
+    """
+    Save an array as a .npy file, compressed as a stream with the codec
+
+    The array is compressed block by block, so no compressed or contiguous copy of the whole array is made. The file is
+    written next to path and then moved in place, see open_for_replace.
+
+    Parameters
+    ----------
+    path: Path
+        Path of the file, see array_file_name
+    array: NDArray
+    codec: ArrayCodec
+    """
+    if isinstance(codec, NoneCodec):
+        with open_for_replace(path) as fp:
+            np.save(fp, array)
+        return
+
+    if array.dtype.hasobject:
+        msg = f"Object arrays can only be stored without compression, not with the {codec.name} codec"
+        raise ValueError(msg)
+
+    header = {"descr": npy_format.dtype_to_descr(array.dtype), "fortran_order": False, "shape": array.shape}
+    with open_for_replace(path) as fp, codec.open_writer(fp) as writer:
+        try:
+            npy_format.write_array_header_1_0(writer, header)
+        except ValueError:
+            npy_format.write_array_header_2_0(writer, header)
+
+        for block in iter_c_contiguous_blocks(array, _BLOCK_BYTES // max(array.itemsize, 1)):
+            writer.write(block.reshape(-1).view(np.uint8).data)
+
+
+def load_array_file(path: Path, mmap_mode: Optional[MemoryMapMode] = None) -> npt.NDArray:
+    """
+    Load an array saved with save_array_file, the codec is derived from the file name
+
+    Parameters
+    ----------
+    path: Path
+    mmap_mode: MemoryMapMode | None
+        Memory-map uncompressed files with this mode, see np.load; compressed files are always read into memory
+
+    Returns
+    -------
+    NDArray
+    """
+    codec = _codec_from_path(path)
+    if isinstance(codec, NoneCodec):
+        return np.load(path, mmap_mode=mmap_mode)
+
+    with open(path, "rb") as fp, codec.open_reader(fp) as reader:
+        shape, fortran_order, dtype = read_npy_header(reader)
+        array = np.empty(shape, dtype=dtype, order="F" if fortran_order else "C")
+        _read_into(reader, array, path)
+
+    return array
+
+
+def read_array_file_header(path: Path) -> NumpyArrayHeader:
+    """
+    Read the header of an array saved with save_array_file, only the start of the file is decompressed
+
+    Parameters
+    ----------
+    path: Path
+
+    Returns
+    -------
+    NumpyArrayHeader
+    """
+    with open(path, "rb") as fp, _codec_from_path(path).open_reader(fp) as reader:
+        return read_npy_header(reader)
+
+
+def save_arrays_to_directory(
+    directory: Path,
+    name_to_array: dict[str, npt.NDArray],
+    name_to_codec: dict[str, ArrayCodec],
+    workers: int = 1,
+    replace_only: bool = False,
+) -> None:
+    """
+    Save every array in its own file in the directory, stale array files are removed
+
+    Parameters
+    ----------
+    directory: Path
+        Directory to write into, created if missing
+    name_to_array: dict[str, NDArray]
+        Mapping of array name to array
+    name_to_codec: dict[str, ArrayCodec]
+        Mapping of array name to the codec it is stored with
+    workers: int
+        Number of threads that compress and write arrays concurrently
+    replace_only: bool
+        Only replace the stored arrays of the given names, the other arrays in the directory are kept
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    name_to_file_name = {name: array_file_name(name, name_to_codec[name]) for name in name_to_array}
+    _remove_stale_array_entries(
+        directory, set(name_to_file_name.values()), set(name_to_array) if replace_only else None
+    )
+
+    run_concurrently(
+        [
+            partial(save_array_file, directory / name_to_file_name[name], array, name_to_codec[name])
+            for name, array in name_to_array.items()
+        ],
+        workers,
+    )
+
+
+def append_to_array_file(path: Path, rows: npt.NDArray) -> tuple[int, ...]:
+    """
+    Append rows along axis 0 to an uncompressed, C-ordered, .npy file in place
+
+    The rows are written after the existing data and the header is rewritten with the new shape; np.save leaves room in
+    the header for axis 0 to grow, files without that room are rewritten in full.
+
+    Parameters
+    ----------
+    path: Path
+        Path to the .npy file
+    rows: NDArray
+        Rows to append, with the same shape as the stored array along the other axes; cast to the stored dtype
+
+    Returns
+    -------
+    tuple[int, ...], the new shape of the stored array
+    """
+    if not isinstance(_codec_from_path(path), NoneCodec):
+        msg = f"Rows can only be appended to uncompressed array files: {path}"
+        raise ValueError(msg)
+
+    with open(path, "r+b") as fp:
+        version = npy_format.read_magic(fp)
+        fp.seek(0)
+        shape, fortran_order, dtype = read_npy_header(fp)
+        data_offset = fp.tell()
+
+        rows = _rows_to_append(rows, shape, dtype)
+        if fortran_order and len(shape) > 1:
+            msg = f"Rows can not be appended to a Fortran-ordered array file: {path}"
+            raise ValueError(msg)
+
+        new_shape = (shape[0] + rows.shape[0], *shape[1:])
+        header = io.BytesIO()
+        header_fields = {"descr": npy_format.dtype_to_descr(dtype), "fortran_order": False, "shape": new_shape}
+        if version == (1, 0):
+            npy_format.write_array_header_1_0(header, header_fields)
+        else:
+            npy_format.write_array_header_2_0(header, header_fields)
+
+        if len(header.getvalue()) == data_offset:
+            fp.seek(data_offset + math.prod(shape) * dtype.itemsize)
+            for block in iter_c_contiguous_blocks(rows, _BLOCK_BYTES // max(dtype.itemsize, 1)):
+                fp.write(block.reshape(-1).view(np.uint8).data)
+            fp.truncate()
+            fp.seek(0)
+            fp.write(header.getvalue())
+            return new_shape
+
+    save_array_file(path, np.concatenate([np.load(path, mmap_mode="r"), rows]), NoneCodec())
+    return new_shape
+
+
+def list_array_files(directory: Path) -> dict[str, Path]:
+    """
+    Map array name to file for the array files in the directory
+
+    Parameters
+    ----------
+    directory: Path
+
+    Returns
+    -------
+    dict[str, Path]
+    """
+    name_to_path = {}
+    for path in sorted(directory.iterdir()):
+        if parsed := parse_array_file_name(path.name):
+            name_to_path[parsed[0]] = path
+    return name_to_path
+
+
+class ChunkedArrayMetadata(NamedTuple):
+    shape: tuple[int, ...]
+    chunks: tuple[int, ...]
+    dtype: np.dtype
+    codec: ArrayCodec
+
+    @property
+    def chunk_grid(self) -> tuple[int, ...]:
+        """Number of chunks along each axis"""
+        return tuple(-(-size // chunk_size) for size, chunk_size in zip(self.shape, self.chunks))
+
+
+def chunk_shape_for(shape: tuple[int, ...], itemsize: int, chunk_bytes: int) -> tuple[int, ...]:
+    """
+    Choose the chunk shape of an array, the largest chunk axis is halved until a chunk fits in chunk_bytes
+
+    Parameters
+    ----------
+    shape: tuple[int, ...]
+        Shape of the array
+    itemsize: int
+        Number of bytes per element
+    chunk_bytes: int
+        Upper bound on the number of bytes per chunk, unless a chunk is a single element
+
+    Returns
+    -------
+    tuple[int, ...]
+    """
+    chunks = [max(size, 1) for size in shape]
+    while math.prod(chunks) * itemsize > chunk_bytes and any(chunk_size > 1 for chunk_size in chunks):
+        axis = chunks.index(max(chunks))
+        chunks[axis] = -(-chunks[axis] // 2)
+    return tuple(chunks)
+
+
+def save_chunked_arrays_to_directory(
+    directory: Path,
+    name_to_array: dict[str, npt.NDArray],
+    name_to_codec: dict[str, ArrayCodec],
+    chunk_bytes: int,
+    workers: int = 1,
+    replace_only: bool = False,
+) -> None:
+    """
+    Save every array as a directory of fixed-shape chunks, each compressed on its own, with a meta.json file
+    describing shape, chunk shape, dtype and codec. Stale array files and directories are removed.
+
+    Parameters
+    ----------
+    directory: Path
+        Directory to write into, created if missing
+    name_to_array: dict[str, NDArray]
+        Mapping of array name to array
+    name_to_codec: dict[str, ArrayCodec]
+        Mapping of array name to the codec its chunks are compressed with
+    chunk_bytes: int
+        Upper bound on the uncompressed size of a chunk, see chunk_shape_for
+    workers: int
+        Number of threads that compress and write chunks concurrently
+    replace_only: bool
+        Only replace the stored arrays of the given names, the other arrays in the directory are kept
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    _remove_stale_array_entries(directory, set(name_to_array), set(name_to_array) if replace_only else None)
+
+    tasks: list[Callable[[], None]] = []
+    for name, array in name_to_array.items():
+        if array.dtype.hasobject:
+            msg = f"Object arrays can not be stored in chunks: {name}"
+            raise ValueError(msg)
+
+        metadata = ChunkedArrayMetadata(
+            shape=array.shape,
+            chunks=chunk_shape_for(array.shape, array.itemsize, chunk_bytes),
+            dtype=array.dtype,
+            codec=name_to_codec[name],
+        )
+        array_directory = directory / name
+        if array_directory.exists():
+            shutil.rmtree(array_directory)
+        array_directory.mkdir()
+        _write_chunked_array_metadata(array_directory, metadata)
+
+        for chunk_index in product(*map(range, metadata.chunk_grid)):
+            tasks.append(
+                partial(
+                    _save_chunk,
+                    array_directory / _chunk_file_name(chunk_index),
+                    array[_chunk_slices(metadata, chunk_index)],
+                    metadata.codec,
+                )
+            )
+
+    run_concurrently(tasks, workers)
+
+
+def append_to_chunked_array(directory: Path, rows: npt.NDArray, workers: int = 1) -> tuple[int, ...]:
+    """
+    Append rows along axis 0 to a chunked array in place
+
+    Only the chunks that gain rows are written: the last, partially filled, chunks are rewritten and new chunks are
+    added. The metadata is updated last, so an interrupted append leaves the array as it was.
+
+    Parameters
+    ----------
+    directory: Path
+        Directory of the chunked array
+    rows: NDArray
+        Rows to append, with the same shape as the stored array along the other axes; cast to the stored dtype
+    workers: int
+        Number of threads that compress and write chunks concurrently
+
+    Returns
+    -------
+    tuple[int, ...], the new shape of the stored array
+    """
+    metadata = read_chunked_array_metadata(directory)
+    rows = _rows_to_append(rows, metadata.shape, metadata.dtype)
+
+    old_length = metadata.shape[0]
+    new_metadata = metadata._replace(shape=(old_length + rows.shape[0], *metadata.shape[1:]))
+    first_chunk_row = old_length // metadata.chunks[0]
+
+    def write_chunk(chunk_index: tuple[int, ...]) -> None:
+        chunk_slices = _chunk_slices(new_metadata, chunk_index)
+        row_start = chunk_index[0] * metadata.chunks[0]
+        new_rows = rows[(slice(max(row_start - old_length, 0), chunk_slices[0].stop - old_length), *chunk_slices[1:])]
+        if row_start < old_length:
+            new_rows = np.concatenate([_read_chunk(directory, metadata, chunk_index), new_rows])
+
+        _save_chunk(directory / _chunk_file_name(chunk_index), new_rows, metadata.codec)
+
+    run_concurrently(
+        [
+            partial(write_chunk, chunk_index)
+            for chunk_index in product(
+                range(first_chunk_row, new_metadata.chunk_grid[0]), *map(range, new_metadata.chunk_grid[1:])
+            )
+        ],
+        workers,
+    )
+
+    _write_chunked_array_metadata(directory, new_metadata)
+    return new_metadata.shape
+
+
+def list_chunked_arrays(directory: Path) -> dict[str, Path]:
+    """
+    Map array name to directory for the chunked arrays in the directory
+
+    Parameters
+    ----------
+    directory: Path
+
+    Returns
+    -------
+    dict[str, Path]
+    """
+    return {path.name: path for path in sorted(directory.iterdir()) if _is_chunked_array_directory(path)}
+
+
+def read_chunked_array_metadata(directory: Path) -> ChunkedArrayMetadata:
+    """
+    Read the meta.json file of a chunked array
+
+    Parameters
+    ----------
+    directory: Path
+        Directory of the chunked array
+
+    Returns
+    -------
+    ChunkedArrayMetadata
+    """
+    with open(directory / _CHUNKED_ARRAY_METADATA_FILE_NAME) as fp:
+        metadata = json.load(fp)
+    return ChunkedArrayMetadata(
+        shape=tuple(metadata["shape"]),
+        chunks=tuple(metadata["chunks"]),
+        dtype=npy_format.descr_to_dtype(metadata["dtype"]),
+        codec=array_codecs[metadata["codec"]],
+    )
+
+
+def load_chunked_array(directory: Path, workers: int = 1) -> npt.NDArray:
+    """
+    Load the whole of a chunked array
+
+    Parameters
+    ----------
+    directory: Path
+        Directory of the chunked array
+    workers: int
+        Number of threads that read and decompress chunks concurrently
+
+    Returns
+    -------
+    NDArray
+    """
+    metadata = read_chunked_array_metadata(directory)
+    array = np.empty(metadata.shape, dtype=metadata.dtype)
+
+    def load_chunk(chunk_index: tuple[int, ...]) -> None:
+        array[_chunk_slices(metadata, chunk_index)] = _read_chunk(directory, metadata, chunk_index)
+
+    run_concurrently(
+        [partial(load_chunk, chunk_index) for chunk_index in product(*map(range, metadata.chunk_grid))], workers
+    )
+    return array
+
+
+def read_chunked_array_region(directory: Path, metadata: ChunkedArrayMetadata, key: Any) -> Optional[npt.NDArray]:
+    """
+    Read the region selected by a basic index (integers, slices and Ellipsis) of a chunked array, only the chunks
+    that overlap the region are read
+
+    Parameters
+    ----------
+    directory: Path
+        Directory of the chunked array
+    metadata: ChunkedArrayMetadata
+    key: Any
+        The index, as passed to __getitem__
+
+    Returns
+    -------
+    The selected region, as ndarray[key] would return it; None if key is not a basic index
+    """
+    axis_selections = _basic_index_selections(key, metadata.shape)
+    if axis_selections is None:
+        return None
+
+    region = np.empty(tuple(len(selection) for selection, _ in axis_selections), dtype=metadata.dtype)
+    axis_chunk_selections = [
+        _chunk_selections(selection, chunk_size) for (selection, _), chunk_size in zip(axis_selections, metadata.chunks)
+    ]
+    for chunk_selections in product(*axis_chunk_selections):
+        chunk = _read_chunk(directory, metadata, tuple(chunk_index for chunk_index, _, _ in chunk_selections))
+        region[tuple(region_slice for _, _, region_slice in chunk_selections)] = chunk[
+            tuple(chunk_slice for _, chunk_slice, _ in chunk_selections)
+        ]
+
+    return region[tuple(0 if is_integer else slice(None) for _, is_integer in axis_selections)]
+
+
+def array_checksum(array: npt.NDArray, algorithm: ChecksumAlgorithm = "blake2b") -> Optional[str]:
+    """
+    Checksum of the dtype, shape and data of an array, the data is hashed block by block in C order
+
+    Parameters
+    ----------
+    array: NDArray
+    algorithm: ChecksumAlgorithm
+        "blake2b", a 128-bit digest fit for content addressing, or "crc32", several times faster and enough to tell
+        whether an array changed
+
+    Returns
+    -------
+    Hex digest prefixed with the algorithm, e.g. "crc32:", None for object arrays, which have no stable byte
+    representation
+    """
+    if array.dtype.hasobject:
+        return None
+
+    header = f"{npy_format.dtype_to_descr(array.dtype)}{array.shape}".encode()
+    blocks = (
+        block.reshape(-1).view(np.uint8).data
+        for block in iter_c_contiguous_blocks(array, _BLOCK_BYTES // max(array.itemsize, 1))
+    )
+    if algorithm == "crc32":
+        crc = zlib.crc32(header)
+        for block_data in blocks:
+            crc = zlib.crc32(block_data, crc)
+        return f"crc32:{crc:08x}"
+
+    checksum = hashlib.blake2b(header, digest_size=16)
+    for block_data in blocks:
+        checksum.update(block_data)
+    return f"blake2b:{checksum.hexdigest()}"
+
+
+def write_array_manifest(path: Path, layout: str, name_to_info: dict[str, ArrayInfo]) -> None:
+    """
+    Write the manifest of the arrays of a dump as JSON
+
+    Parameters
+    ----------
+    path: Path
+        Path of the manifest file
+    layout: str
+        Layout the arrays were dumped with
+    name_to_info: dict[str, ArrayInfo]
+        Mapping of array name to its ArrayInfo
+    """
+    with open(path, "w") as fp:
+        json.dump(
+            {
+                "layout": layout,
+                "arrays": {
+                    name: {
+                        "shape": info.shape,
+                        "dtype": npy_format.dtype_to_descr(info.dtype),
+                        "nbytes": info.nbytes,
+                        "codec": info.codec,
+                        "checksum": info.checksum,
+                        "blob": info.blob,
+                    }
+                    for name, info in name_to_info.items()
+                },
+            },
+            fp,
+            indent=2,
+        )
+
+
+def read_array_manifest(path: Path) -> ArrayManifest:
+    """
+    Read a manifest written by write_array_manifest
+
+    Parameters
+    ----------
+    path: Path
+        Path of the manifest file
+
+    Returns
+    -------
+    ArrayManifest
+    """
+    with open(path) as fp:
+        manifest = json.load(fp)
+    return ArrayManifest(
+        layout=manifest["layout"],
+        arrays={
+            name: ArrayInfo(
+                shape=tuple(info["shape"]),
+                dtype=npy_format.descr_to_dtype(info["dtype"]),
+                nbytes=info["nbytes"],
+                codec=info["codec"],
+                checksum=info["checksum"],
+                blob=info.get("blob"),
+            )
+            for name, info in manifest["arrays"].items()
+        },
+    )
+
+
+def inspect_npz_file(path: Path) -> dict[str, ArrayInfo]:
+    """
+    ArrayInfo of every array in a .npz file from the member headers, without a checksum
+
+    Parameters
+    ----------
+    path: Path
+        Path to the .npz file
+
+    Returns
+    -------
+    dict[str, ArrayInfo]
+    """
+    name_to_info = {}
+    with zipfile.ZipFile(path) as zip_file:
+        for member in zip_file.infolist():
+            with zip_file.open(member) as fp:
+                shape, _, dtype = read_npy_header(fp)
+            codec = "none" if member.compress_type == zipfile.ZIP_STORED else "zlib"
+            name_to_info[member.filename.removesuffix(".npy")] = _array_info(shape, dtype, codec)
+    return name_to_info
+
+
+def inspect_array_directory(directory: Path) -> dict[str, ArrayInfo]:
+    """
+    ArrayInfo of every array file and chunked array in a directory from their headers, without a checksum
+
+    Parameters
+    ----------
+    directory: Path
+
+    Returns
+    -------
+    dict[str, ArrayInfo]
+    """
+    name_to_info = {}
+    for name, path in list_array_files(directory).items():
+        shape, _, dtype = read_array_file_header(path)
+        name_to_info[name] = _array_info(shape, dtype, _codec_from_path(path).name)
+    for name, path in list_chunked_arrays(directory).items():
+        metadata = read_chunked_array_metadata(path)
+        name_to_info[name] = _array_info(metadata.shape, metadata.dtype, metadata.codec.name)
+    return name_to_info
+
+
+def save_blob(blob_directory: Path, array: npt.NDArray, codec: ArrayCodec, checksum: Optional[str]) -> str:
+    """
+    Store an array in a content-addressed blob directory, unless a blob with the same checksum and codec exists
+
+    The blob is written to a temporary file and renamed into place, so concurrent writers of the same content are safe.
+    A reused blob has its modification time refreshed, see collect_unreferenced_blobs.
+
+    Parameters
+    ----------
+    blob_directory: Path
+        Root of the blob directory, created if missing
+    array: NDArray
+    codec: ArrayCodec
+    checksum: str | None
+        Checksum of the array, see array_checksum
+
+    Returns
+    -------
+    str, the key of the blob, see blob_path
+    """
+    if checksum is None:
+        msg = "Object arrays can not be stored as content-addressed blobs"
+        raise ValueError(msg)
+
+    key = array_file_name(checksum.partition(":")[2], codec)
+    path = blob_path(blob_directory, key)
+    if path.exists():
+        os.utime(path)
+        return key
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    save_array_file(path, array, codec)
+    return key
+
+
+def blob_path(blob_directory: Path, key: str) -> Path:
+    """
+    Path of a blob, blobs are sharded in subdirectories named after the first two characters of their key
+
+    Parameters
+    ----------
+    blob_directory: Path
+        Root of the blob directory
+    key: str
+        Key of the blob, as returned by save_blob
+
+    Returns
+    -------
+    Path
+    """
+    return blob_directory / key[:2] / key
+
+
+def collect_unreferenced_blobs(blob_directory: Path, referenced_keys: set[str], min_age: float) -> list[Path]:
+    """
+    Remove the blobs, and leftover temporary files, that are not referenced and older than min_age seconds
+
+    Parameters
+    ----------
+    blob_directory: Path
+        Root of the blob directory
+    referenced_keys: set[str]
+        Keys of the blobs in use
+    min_age: float
+        Files modified less than min_age seconds ago are kept, they may belong to a dump in progress
+
+    Returns
+    -------
+    list[Path], the removed files
+    """
+    if not blob_directory.is_dir():
+        return []
+
+    modified_before = time.time() - min_age
+    removed_paths = []
+    for shard_path in blob_directory.iterdir():
+        if not shard_path.is_dir():
+            # Not written by save_blob, e.g. .DS_Store
+            continue
+        for path in shard_path.iterdir():
+            if path.name not in referenced_keys and path.stat().st_mtime < modified_before:
+                path.unlink()
+                removed_paths.append(path)
+        if not any(shard_path.iterdir()):
+            shard_path.rmdir()
+    return removed_paths
+
+
+def replace_directory(source: Path, target: Path) -> None:
+    """
+    Move the source directory to target, replacing target if it exists; target is renamed aside before the move and
+    removed after it, so it is never left half-replaced
+
+    Parameters
+    ----------
+    source: Path
+    target: Path
+        Must be on the same file system as source
+    """
+    if not target.exists():
+        source.replace(target)
+        return
+
+    replaced_path = target.with_name(f".{target.name}.{uuid4().hex}.replaced")
+    target.replace(replaced_path)
+    source.replace(target)
+    shutil.rmtree(replaced_path)
+
+
+def run_concurrently(tasks: list[Callable[[], T]], workers: int = 1) -> list[T]:
+    """
+    Run the tasks in a thread pool of the given size, or in the calling thread if workers is 1
+
+    Parameters
+    ----------
+    tasks: list[Callable[[], T]]
+    workers: int
+
+    Returns
+    -------
+    Results of the tasks in order
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        return [task() for task in tasks]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+        return list(executor.map(lambda task: task(), tasks))
+
+
+def _array_info(shape: tuple[int, ...], dtype: np.dtype, codec: str) -> ArrayInfo:
+    return ArrayInfo(shape=shape, dtype=dtype, nbytes=math.prod(shape) * dtype.itemsize, codec=codec, checksum=None)
+
+
+def remove_array_entries(directory: Path, names: set[str]) -> None:
+    """
+    Remove the array files and chunked arrays of the given names from a directory
+
+    Parameters
+    ----------
+    directory: Path
+    names: set[str]
+        Names of the arrays to remove
+    """
+    _remove_stale_array_entries(directory, set(), names)
+
+
+def _rows_to_append(rows: npt.ArrayLike, shape: tuple[int, ...], dtype: np.dtype) -> npt.NDArray:
+    if not shape:
+        msg = "Rows can not be appended to a 0-dimensional array"
+        raise ValueError(msg)
+
+    rows = np.asarray(rows)
+    if rows.shape[1:] != shape[1:]:
+        msg = f"Rows of shape {rows.shape[1:]} can not be appended to an array of shape {shape}"
+        raise ValueError(msg)
+    return rows.astype(dtype, casting="same_kind", copy=False)
+
+
+def _remove_stale_array_entries(directory: Path, keep: set[str], names: Optional[set[str]] = None) -> None:
+    """Remove array entries that are not in keep; only those of the given array names, if names is given"""
+    if not directory.is_dir():
+        return
+
+    for path in directory.iterdir():
+        if path.name in keep:
+            continue
+        if _is_chunked_array_directory(path):
+            if names is None or path.name in names:
+                shutil.rmtree(path)
+        elif path.is_file() and (parsed := parse_array_file_name(path.name)):
+            if names is None or parsed[0] in names:
+                path.unlink()
+
+
+def _is_chunked_array_directory(path: Path) -> bool:
+    return (path / _CHUNKED_ARRAY_METADATA_FILE_NAME).is_file()
+
+
+def _write_chunked_array_metadata(directory: Path, metadata: ChunkedArrayMetadata) -> None:
+    temporary_path = directory / f".{_CHUNKED_ARRAY_METADATA_FILE_NAME}.{uuid4().hex}.tmp"
+    with open(temporary_path, "w") as fp:
+        json.dump(
+            {
+                "shape": metadata.shape,
+                "chunks": metadata.chunks,
+                "dtype": npy_format.dtype_to_descr(metadata.dtype),
+                "codec": metadata.codec.name,
+            },
+            fp,
+        )
+    temporary_path.replace(directory / _CHUNKED_ARRAY_METADATA_FILE_NAME)
+
+
+def _chunk_file_name(chunk_index: tuple[int, ...]) -> str:
+    return ".".join(map(str, chunk_index)) or "0"
+
+
+def _chunk_slices(metadata: ChunkedArrayMetadata, chunk_index: tuple[int, ...]) -> tuple[slice, ...]:
+    return tuple(
+        slice(index * chunk_size, (index + 1) * chunk_size) for index, chunk_size in zip(chunk_index, metadata.chunks)
+    )
+
+
+def _save_chunk(path: Path, chunk: npt.NDArray, codec: ArrayCodec) -> None:
+    with open_for_replace(path) as fp, codec.open_writer(fp) as writer:
+        writer.write(np.ascontiguousarray(chunk).reshape(-1).view(np.uint8).data)
+
+
+def _read_chunk(directory: Path, metadata: ChunkedArrayMetadata, chunk_index: tuple[int, ...]) -> npt.NDArray:
+    shape = tuple(
+        min(chunk_size, size - index * chunk_size)
+        for index, chunk_size, size in zip(chunk_index, metadata.chunks, metadata.shape)
+    )
+    chunk = np.empty(shape, dtype=metadata.dtype)
+    path = directory / _chunk_file_name(chunk_index)
+    with open(path, "rb") as fp, metadata.codec.open_reader(fp) as reader:
+        _read_into(reader, chunk, path)
+    return chunk
+
+
+def _basic_index_selections(key: Any, shape: tuple[int, ...]) -> Optional[list[tuple[range, bool]]]:
+    """Selected positions per axis and whether the axis is dropped (integer index); None if not a basic index"""
+    key = key if isinstance(key, tuple) else (key,)
+    if any(not _is_basic_index_item(item) for item in key):
+        return None
+
+    if (ellipsis_count := sum(item is Ellipsis for item in key)) > 1:
+        msg = "an index can only have a single ellipsis ('...')"
+        raise IndexError(msg)
+    if len(key) - ellipsis_count > len(shape):
+        index_count = len(key) - ellipsis_count
+        msg = f"too many indices for array: array is {len(shape)}-dimensional, but {index_count} were indexed"
+        raise IndexError(msg)
+    if ellipsis_count:
+        ellipsis_position = key.index(Ellipsis)
+        fill = (slice(None),) * (len(shape) - len(key) + 1)
+        key = key[:ellipsis_position] + fill + key[ellipsis_position + 1 :]
+    key = key + (slice(None),) * (len(shape) - len(key))
+
+    selections = []
+    for axis, (item, size) in enumerate(zip(key, shape)):
+        if isinstance(item, slice):
+            selections.append((range(*item.indices(size)), False))
+            continue
+
+        index = operator.index(item)
+        if not -size <= index < size:
+            msg = f"index {index} is out of bounds for axis {axis} with size {size}"
+            raise IndexError(msg)
+        index %= size
+        selections.append((range(index, index + 1), True))
+    return selections
+
+
+def _is_basic_index_item(item: Any) -> bool:
+    return (
+        isinstance(item, slice)
+        or item is Ellipsis
+        or (isinstance(item, (int, np.integer)) and not isinstance(item, (bool, np.bool_)))
+    )
+
+
+def _chunk_selections(selection: range, chunk_size: int) -> list[tuple[int, slice, slice]]:
+    """Chunk index, slice within the chunk and slice within the region, for every chunk the selection overlaps"""
+    if not (length := len(selection)):
+        return []
+
+    reverse = selection.step < 0
+    ascending = selection[::-1] if reverse else selection
+    start, step = ascending.start, ascending.step
+
+    chunk_selections = []
+    for chunk_index in range(ascending[0] // chunk_size, ascending[-1] // chunk_size + 1):
+        chunk_start = chunk_index * chunk_size
+        first = max(0, -(-(chunk_start - start) // step))
+        stop = min(length, -(-(chunk_start + chunk_size - start) // step))
+        if first >= stop:
+            continue
+
+        chunk_slice = slice(start + first * step - chunk_start, start + (stop - 1) * step - chunk_start + 1, step)
+        if reverse:
+            region_stop = length - 1 - stop
+            region_slice = slice(length - 1 - first, region_stop if region_stop >= 0 else None, -1)
+        else:
+            region_slice = slice(first, stop)
+        chunk_selections.append((chunk_index, chunk_slice, region_slice))
+    return chunk_selections
+
+
+def _read_into(reader: IO[bytes], array: npt.NDArray, path: Path) -> None:
+    buffer = array.reshape(-1, order="A").view(np.uint8).data
+    offset = 0
+    while offset < len(buffer):
+        data = reader.read(min(len(buffer) - offset, _BLOCK_BYTES))
+        if not data:
+            msg = f"The array file is truncated: {path}"
+            raise ValueError(msg)
+        buffer[offset : offset + len(data)] = data
+        offset += len(data)
+
+
+def _codec_from_path(path: Path) -> ArrayCodec:
+    parsed = parse_array_file_name(path.name)
+    return parsed[1] if parsed else array_codecs["none"]
+
+
+_BLOCK_BYTES: Final = 2**24
+_CHUNKED_ARRAY_METADATA_FILE_NAME: Final = "meta.json"
@@ -0,0 +1,193 @@
+import base64
+from collections.abc import Iterator
+from typing import Callable, Final
+
+import numpy as np
+import numpy.typing as npt
+from pydantic_core import to_json
+
+from pydantic_numpy.helper.typing import NumpyArrayBase64TypeData, NumpyArrayTypeData
+from pydantic_numpy.util import iter_c_contiguous_blocks
+
+
+def pd_np_native_numpy_array_to_data_dict_serializer(array_like: npt.ArrayLike) -> NumpyArrayTypeData:
+    """
+    Serialize a NumPy array into a data dictionary format suitable for frontend display or processing.
+
+    This function converts a given NumPy array into a dictionary format, which includes the data type
+    and the data itself. If the array contains datetime or timedelta objects, it converts them into integer
+    representations. Otherwise, the array is converted to a floating-point representation. This is particularly
+    useful for preparing NumPy array data for JSON serialization or similar use cases where NumPy's native
+    data types are not directly compatible.
+
+    Note
+    ----
+    This function is intended for internal use within a package for handling specific serialization needs
+    of NumPy arrays for frontend applications or similar use cases. It should not be used as a general-purpose
+    serialization tool.
+
+    Parameters
+    ----------
+    array_like: np.ndarray
+                  The NumPy array to be serialized. This can be a standard numerical array or an array
+                  of datetime/timedelta objects.
+
+    Returns
+    -------
+    NumpyArrayTypeData
+                   A dictionary with two keys: 'data_type', a string representing the data type of the array,
+                   and 'data', a list of values converted from the array. The conversion is to integer if the
+                   original data type is datetime or timedelta, and to float for other data types.
+
+    Example
+    -------
+    >>> my_array = np.array([1, 2, 3])
+    >>> pd_np_native_numpy_array_to_data_dict_serializer(my_array)
+    {'data_type': 'int64', 'data': [1.0, 2.0, 3.0]}
+    """
+    array = np.array(array_like)
+    return NumpyArrayTypeData(data_type=str(array.dtype), data=_to_json_compatible_array(array).tolist())
+
+
+def pd_np_native_numpy_array_to_base64_data_dict_serializer(array_like: npt.ArrayLike) -> NumpyArrayBase64TypeData:
+    """
+    Serialize a NumPy array into a base64 envelope built directly from the array buffer.
+
+    Unlike pd_np_native_numpy_array_to_data_dict_serializer, no float copy and no Python list is created; the raw
+    bytes of the array (C order) are base64 encoded. The data type is stored with its byte order, e.g. '<f8', so the
+    envelope can be decoded on any platform. Validation recognises the envelope and decodes it with np.frombuffer.
+
+    Parameters
+    ----------
+    array_like: np.ndarray
+                  The NumPy array to be serialized, object arrays are not supported.
+
+    Returns
+    -------
+    NumpyArrayBase64TypeData
+                   A dictionary with four keys: 'data_type', 'shape', 'encoding' (always 'base64'), and 'data', the
+                   base64 encoded bytes of the array.
+
+    Example
+    -------
+    >>> pd_np_native_numpy_array_to_base64_data_dict_serializer(np.array([1, 2], dtype=np.int8))
+    {'data_type': '|i1', 'shape': [2], 'encoding': 'base64', 'data': 'AQI='}
+    """
+    array = np.asarray(array_like)
+    if array.dtype.hasobject:
+        msg = "Object arrays can not be serialized to a base64 envelope"
+        raise ValueError(msg)
+
+    return NumpyArrayBase64TypeData(
+        data_type=array.dtype.str,
+        shape=list(array.shape),
+        encoding="base64",
+        # Viewing as bytes also covers datetime64/timedelta64, which do not support the buffer protocol
+        data=base64.b64encode(np.ascontiguousarray(array).reshape(-1).view(np.uint8).data).decode("ascii"),
+    )
+
+
+def iter_data_dict_json_chunks(
+    array_like: npt.ArrayLike, chunk_size: int, inf_nan_mode: str = "null"
+) -> Iterator[bytes]:
+    """
+    Chunked JSON encoder producing the same document as pd_np_native_numpy_array_to_data_dict_serializer
+
+    At most chunk_size elements are converted to Python objects at a time, the nested list structure of the array
+    is preserved.
+
+    Parameters
+    ----------
+    array_like: np.ndarray
+        The NumPy array to be serialized
+    chunk_size: int
+        Maximum number of array elements encoded per chunk
+    inf_nan_mode: str
+        How to encode inf and NaN, see pydantic's ser_json_inf_nan
+
+    Returns
+    -------
+    Iterator[bytes] of JSON fragments that concatenate into one JSON object
+    """
+    array = np.asarray(array_like)
+
+    yield b'{"data_type":' + to_json(str(array.dtype)) + b',"data":'
+    yield from _iter_json_list_chunks(array, chunk_size, inf_nan_mode)
+    yield b"}"
+
+
+def iter_base64_data_dict_json_chunks(
+    array_like: npt.ArrayLike, chunk_size: int, inf_nan_mode: str = "null"
+) -> Iterator[bytes]:
+    """
+    Chunked JSON encoder producing the same document as pd_np_native_numpy_array_to_base64_data_dict_serializer
+
+    Parameters
+    ----------
+    array_like: np.ndarray
+        The NumPy array to be serialized, object arrays are not supported
+    chunk_size: int
+        Maximum number of array elements encoded per chunk
+    inf_nan_mode: str
+        Unused, the base64 envelope has no floats; accepted for a uniform signature
+
+    Returns
+    -------
+    Iterator[bytes] of JSON fragments that concatenate into one JSON object
+    """
+    array = np.asarray(array_like)
+    if array.dtype.hasobject:
+        msg = "Object arrays can not be serialized to a base64 envelope"
+        raise ValueError(msg)
+
+    yield (
+        b'{"data_type":'
+        + to_json(array.dtype.str)
+        + b',"shape":'
+        + to_json(list(array.shape))
+        + b',"encoding":"base64","data":"'
+    )
+
+    # base64 of a concatenation equals the concatenation of the base64 parts when all but the last are 3-byte aligned
+    remainder = b""
+    for block in iter_c_contiguous_blocks(array, chunk_size):
+        buffer = remainder + block.reshape(-1).view(np.uint8).tobytes()
+        aligned_length = len(buffer) - len(buffer) % 3
+        yield base64.b64encode(buffer[:aligned_length])
+        remainder = buffer[aligned_length:]
+
+    yield base64.b64encode(remainder) + b'"}'
+
+
+streaming_json_encoders: Final[dict[Callable, Callable[[npt.ArrayLike, int, str], Iterator[bytes]]]] = {
+    pd_np_native_numpy_array_to_data_dict_serializer: iter_data_dict_json_chunks,
+    pd_np_native_numpy_array_to_base64_data_dict_serializer: iter_base64_data_dict_json_chunks,
+}
+
+
+def _to_json_compatible_array(array: npt.NDArray) -> npt.NDArray:
+    if issubclass(array.dtype.type, np.timedelta64) or issubclass(array.dtype.type, np.datetime64):
+        return array.astype(int)
+    return array.astype(float)
+
+
+def _iter_json_list_chunks(array: npt.NDArray, chunk_size: int, inf_nan_mode: str) -> Iterator[bytes]:
+    if array.ndim == 0 or array.size <= chunk_size:
+        yield to_json(_to_json_compatible_array(array).tolist(), inf_nan_mode=inf_nan_mode)  # type: ignore[arg-type]
+        return
+
+    yield b"["
+    row_size = array.size // array.shape[0]
+    if row_size > chunk_size:
+        for row_index in range(array.shape[0]):
+            if row_index:
+                yield b","
+            yield from _iter_json_list_chunks(array[row_index], chunk_size, inf_nan_mode)
+    else:
+        rows_per_chunk = chunk_size // row_size
+        for start in range(0, array.shape[0], rows_per_chunk):
+            if start:
+                yield b","
+            rows = _to_json_compatible_array(array[start : start + rows_per_chunk]).tolist()
+            yield to_json(rows, inf_nan_mode=inf_nan_mode)[1:-1]  # type: ignore[arg-type]
+    yield b"]"
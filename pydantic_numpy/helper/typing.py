@@ -1,9 +1,21 @@
 import numpy as np
-from typing_extensions import TypedDict
+from typing_extensions import Literal, TypedDict
 
 SupportedDTypes = type[np.generic]
 
+DumpLayout = Literal["npz", "npy", "chunked", "blob"]
+BulkPool = Literal["thread", "process"]
+MemoryMapMode = Literal["r", "r+", "c"]
+ChecksumAlgorithm = Literal["crc32", "blake2b"]
+
 
 class NumpyArrayTypeData(TypedDict):
     data_type: str
     data: list
+
+
+class NumpyArrayBase64TypeData(TypedDict):
+    data_type: str
+    shape: list[int]
+    encoding: Literal["base64"]
+    data: str
@@ -1,4 +1,9 @@
-from typing import Callable, Optional, Union
+import base64
+import math
+import zipfile
+from collections.abc import Iterable, Mapping
+from itertools import chain
+from typing import Any, Callable, Optional, Union
 
 import numpy as np
 import numpy.typing as npt
@@ -6,17 +11,30 @@ from numpy import floating, integer
 from numpy.lib.npyio import NpzFile
 from pydantic import FilePath
 
-from pydantic_numpy.helper.typing import NumpyArrayTypeData, SupportedDTypes
-from pydantic_numpy.model import MultiArrayNumpyFile
+from pydantic_numpy.helper.cache import ArrayCache
+from pydantic_numpy.helper.io import npz_keys
+from pydantic_numpy.helper.typing import (
+    NumpyArrayBase64TypeData,
+    NumpyArrayTypeData,
+    SupportedDTypes,
+)
+from pydantic_numpy.model import LazyNumpyArray, MultiArrayNumpyFile
 
 
 class PydanticNumpyMultiArrayNumpyFileOnFilePath(Exception):
     pass
 
 
+# Validated arrays of file inputs to annotations created with cached_file_validation, see validate_cached_numpy_array_file
+validated_array_file_cache = ArrayCache(max_bytes=2**28)
+
+
 def create_array_validator(
     dimensions: Optional[int], target_data_type: SupportedDTypes, strict_data_typing: bool
-) -> Callable[[npt.NDArray], npt.NDArray]:
+) -> Callable[
+    [Union[npt.NDArray, LazyNumpyArray, NumpyArrayTypeData, NumpyArrayBase64TypeData]],
+    Union[npt.NDArray, LazyNumpyArray],
+]:
     """
     Creates a validator that ensures the numpy array has the defined dimensions and dtype (data_type).
 
@@ -32,14 +50,19 @@ def create_array_validator(
 
     Returns
     -------
-    Callable[[npt.NDArray], npt.NDArray]
-    Validator for numpy array
+    Callable[[NDArray | LazyNumpyArray | NumpyArrayTypeData | NumpyArrayBase64TypeData], NDArray | LazyNumpyArray]
+    Validator for numpy array, lazy arrays stay lazy
     """
 
-    def array_validator(array_data: Union[npt.NDArray, NumpyArrayTypeData]) -> npt.NDArray:
+    def array_validator(
+        array_data: Union[npt.NDArray, LazyNumpyArray, NumpyArrayTypeData, NumpyArrayBase64TypeData]
+    ) -> Union[npt.NDArray, LazyNumpyArray]:
+        if isinstance(array_data, LazyNumpyArray):
+            return lazy_array_validator(array_data)
+
         array: npt.NDArray
         if isinstance(array_data, dict):
-            array = np.array(array_data["data"], dtype=array_data["data_type"])
+            array = deserialize_numpy_array_from_data_dict(array_data)
         else:
             array = array_data
 
@@ -52,16 +75,119 @@ def create_array_validator(
                 msg = f"The data_type {array.dtype.type} does not coincide with type hint; {target_data_type}"
                 raise ValueError(msg)
 
-            if issubclass(target_data_type, integer) and issubclass(array.dtype.type, floating):
-                array = np.round(array).astype(target_data_type, copy=False)
-            else:
-                array = array.astype(target_data_type, copy=True)
+            array = convert_data_type(array)
 
         return array
 
+    def lazy_array_validator(lazy_array: LazyNumpyArray) -> LazyNumpyArray:
+        if dimensions and lazy_array.ndim != dimensions:
+            msg = f"Array {lazy_array.ndim}-dimensional; the target dimensions is {dimensions}"
+            raise ValueError(msg)
+
+        if target_data_type and lazy_array.dtype.type != target_data_type:
+            if strict_data_typing:
+                msg = f"The data_type {lazy_array.dtype.type} does not coincide with type hint; {target_data_type}"
+                raise ValueError(msg)
+
+            return lazy_array.with_post_load(np.dtype(target_data_type), convert_data_type)
+
+        return lazy_array
+
+    def convert_data_type(array: npt.NDArray) -> npt.NDArray:
+        if issubclass(target_data_type, integer) and issubclass(array.dtype.type, floating):
+            return np.round(array).astype(target_data_type, copy=False)
+        return array.astype(target_data_type, copy=True)
+
     return array_validator
 
 
+def deserialize_numpy_array_from_data_dict(
+    data_dict: Union[NumpyArrayTypeData, NumpyArrayBase64TypeData, Mapping[str, Any]]
+) -> npt.NDArray:
+    """
+    Decode a data dictionary, either NumpyArrayTypeData or the base64 envelope, into a numpy array
+
+    Nested lists are read in a single pass into a preallocated array of the declared data type (np.fromiter with a
+    count); only the list structure is checked, the elements are converted by numpy.
+
+    Parameters
+    ----------
+    data_dict: NumpyArrayTypeData | NumpyArrayBase64TypeData
+
+    Returns
+    -------
+    NDArray
+    """
+    if data_dict.get("encoding") == "base64":
+        if not isinstance(data_dict.get("data"), str) or not isinstance(data_dict.get("shape"), list):
+            msg = "A base64 array data dictionary requires a string 'data' and a list 'shape'"
+            raise ValueError(msg)
+        return deserialize_numpy_array_from_base64_data_dict(data_dict)  # type: ignore[arg-type]
+
+    data_type, data = data_dict.get("data_type"), data_dict.get("data")
+    if not isinstance(data_type, str) or data is None:
+        msg = "An array data dictionary requires a string 'data_type' and 'data'"
+        raise ValueError(msg)
+
+    dtype = np.dtype(data_type)
+    if not isinstance(data, (list, tuple)) or dtype.hasobject or dtype.itemsize == 0:
+        return np.array(data).astype(dtype)
+
+    shape = _nested_sequence_shape(data)
+    try:
+        flat_array = np.fromiter(_flatten_nested_sequence(data, shape), dtype=dtype, count=math.prod(shape))
+    except (TypeError, OverflowError) as e:
+        raise ValueError(f"Array data could not be read as {dtype}: {e}") from e
+
+    return flat_array.reshape(shape)
+
+
+def deserialize_numpy_array_from_base64_data_dict(data_dict: NumpyArrayBase64TypeData) -> npt.NDArray:
+    """
+    Decode a base64 envelope back into a numpy array
+
+    The raw bytes are read with np.frombuffer, no intermediate Python list is built.
+
+    Parameters
+    ----------
+    data_dict: NumpyArrayBase64TypeData
+        Envelope produced by pd_np_native_numpy_array_to_base64_data_dict_serializer
+
+    Returns
+    -------
+    NDArray
+    """
+    buffer = bytearray(base64.b64decode(data_dict["data"], validate=True))
+    return np.frombuffer(buffer, dtype=np.dtype(data_dict["data_type"])).reshape(data_dict["shape"])
+
+
+def _nested_sequence_shape(data: Union[list, tuple]) -> tuple[int, ...]:
+    shape = []
+    level: Any = data
+    while isinstance(level, (list, tuple)):
+        shape.append(len(level))
+        if not level:
+            break
+        level = level[0]
+    return tuple(shape)
+
+
+def _flatten_nested_sequence(data: Union[list, tuple], shape: tuple[int, ...]) -> Iterable:
+    def checked_row(expected_length: int) -> Callable[[Any], Iterable]:
+        def check(row: Any) -> Iterable:
+            if not isinstance(row, (list, tuple)) or len(row) != expected_length:
+                msg = f"Array data is ragged; expected nested lists of shape {shape}"
+                raise ValueError(msg)
+            return row
+
+        return check
+
+    flat: Iterable = data
+    for depth_length in shape[1:]:
+        flat = chain.from_iterable(map(checked_row(depth_length), flat))
+    return flat
+
+
 def validate_numpy_array_file(v: FilePath) -> npt.NDArray:
     """
     Validate file path to numpy file by loading and return the respective numpy array
@@ -93,6 +219,68 @@ def validate_numpy_array_file(v: FilePath) -> npt.NDArray:
     return result
 
 
+def validate_cached_numpy_array_file(
+    v: FilePath,
+    array_validator: Callable[[npt.NDArray], Union[npt.NDArray, LazyNumpyArray]],
+    target: tuple[Optional[int], Optional[SupportedDTypes], bool],
+) -> npt.NDArray:
+    """
+    Validate file path to numpy file through validated_array_file_cache, the file is only loaded and converted again
+    when it was modified
+
+    Parameters
+    ----------
+    v: FilePath
+        Path to the numpy file
+    array_validator: Callable[[NDArray], NDArray | LazyNumpyArray]
+        Validator that checks and converts the loaded array, see create_array_validator
+    target: tuple[int | None, SupportedDTypes | None, bool]
+        Dimensions, data type and strict data typing of array_validator, part of the cache key
+
+    Returns
+    -------
+    NDArray, read-only
+    """
+
+    def load() -> npt.NDArray:
+        array = array_validator(validate_numpy_array_file(v))
+        # Only lazy inputs stay lazy
+        assert isinstance(array, np.ndarray)
+        return array
+
+    return validated_array_file_cache.get(v, target, load)
+
+
+def validate_lazy_numpy_array_file(v: FilePath) -> LazyNumpyArray:
+    """
+    Validate file path to numpy file by reading only the array header, the array is loaded on first use
+
+    Parameters
+    ----------
+    v: FilePath
+        Path to the numpy file
+
+    Returns
+    -------
+    LazyNumpyArray
+    """
+    if not zipfile.is_zipfile(v):
+        return LazyNumpyArray(v)
+
+    keys = npz_keys(v)
+    if len(keys) > 1:
+        msg = (
+            f"The provided file path is a multi array NpzFile, which is not supported; "
+            f"convert to single array NpzFiles.\n"
+            f"Path to multi array file: {v}\n"
+            f"Array keys: {', '.join(keys)}\n"
+            f"Use pydantic_numpy.{MultiArrayNumpyFile.__name__} instead of a PathLike alone"
+        )
+        raise PydanticNumpyMultiArrayNumpyFileOnFilePath(msg)
+
+    return LazyNumpyArray(MultiArrayNumpyFile(path=v, key=keys[0]))
+
+
 def validate_multi_array_numpy_file(v: MultiArrayNumpyFile) -> npt.NDArray:
     """
     Validation function for loading numpy array from a name mapping numpy file
@@ -107,3 +295,20 @@ def validate_multi_array_numpy_file(v: MultiArrayNumpyFile) -> npt.NDArray:
     NDArray from MultiArrayNumpyFile
     """
     return v.load()
+
+
+def validate_lazy_multi_array_numpy_file(v: MultiArrayNumpyFile) -> LazyNumpyArray:
+    """
+    Validation function for a name mapping numpy file that only reads the array header, the array is loaded on first
+    use
+
+    Parameters
+    ----------
+    v: MultiArrayNumpyFile
+        MultiArrayNumpyFile to load lazily
+
+    Returns
+    -------
+    LazyNumpyArray
+    """
+    return LazyNumpyArray(v)
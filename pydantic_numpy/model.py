@@ -1,18 +1,110 @@
+import asyncio
+import hashlib
+import math
+import os
 import pickle as pickle_pkg
+import shutil
+import threading
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, ClassVar, Iterable, Optional
+from types import MappingProxyType
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Union,
+)
+from uuid import uuid4
 
 import compress_pickle
 import numpy as np
 import numpy.typing as npt
-from pydantic import BaseModel, DirectoryPath, FilePath, computed_field, validate_call
-from ruamel.yaml import YAML
+from numpy.lib import format as npy_format
+from numpy.lib.mixins import NDArrayOperatorsMixin
+from pydantic import (
+    BaseModel,
+    DirectoryPath,
+    FilePath,
+    PlainSerializer,
+    PrivateAttr,
+    TypeAdapter,
+    WrapSerializer,
+    computed_field,
+    validate_call,
+)
+from pydantic.fields import FieldInfo
+from pydantic_core import to_json
+from ruamel.yaml import YAML, YAMLError
+from typing_extensions import Self
 
-from pydantic_numpy.util import np_general_all_close
+from pydantic_numpy.helper.cache import ArrayCache
+from pydantic_numpy.helper.codec import ArrayCodec, get_array_codec
+from pydantic_numpy.helper.io import (
+    ArrayInfo,
+    ArrayManifest,
+    NumpyArrayHeader,
+    append_to_array_file,
+    append_to_chunked_array,
+    array_checksum,
+    blob_path,
+    collect_unreferenced_blobs,
+    inspect_array_directory,
+    inspect_npz_file,
+    list_array_files,
+    list_chunked_arrays,
+    load_array_file,
+    load_chunked_array,
+    open_for_replace,
+    read_array_file_header,
+    read_array_manifest,
+    read_chunked_array_metadata,
+    read_chunked_array_region,
+    read_npz_member_header,
+    remove_array_entries,
+    replace_directory,
+    run_concurrently,
+    save_arrays_to_directory,
+    save_blob,
+    save_chunked_arrays_to_directory,
+    write_array_manifest,
+)
+from pydantic_numpy.helper.serialization import streaming_json_encoders
+from pydantic_numpy.helper.typing import (
+    BulkPool,
+    ChecksumAlgorithm,
+    DumpLayout,
+    MemoryMapMode,
+)
+from pydantic_numpy.util import iter_c_contiguous_blocks, np_general_all_close
 
-yaml = YAML()
+_thread_local = threading.local()
+
+_BATCHES_PER_WORKER = 4
+_FINGERPRINT_BLOCK_BYTES = 2**24
+_JSON_ONLY_WHEN_USED = ("json", "json-unless-none")
+
+# Errors of dump and load for a single instance; dump_many and load_many return them in place of the instance
+_BULK_ERRORS = (
+    OSError,
+    ValueError,
+    TypeError,
+    LookupError,
+    AttributeError,
+    AssertionError,
+    RuntimeError,
+    ImportError,
+    pickle_pkg.PickleError,
+    zipfile.BadZipFile,
+    YAMLError,
+)
 
 
 @dataclass(frozen=True)
@@ -21,30 +113,248 @@ class MultiArrayNumpyFile:
     key: str
     cached_load: bool = False
 
+    # Shared by all instances with cached_load; bounded by the bytes of the decompressed arrays
+    cache: ClassVar[ArrayCache] = ArrayCache(max_bytes=2**28)
+
     def load(self) -> npt.NDArray:
         """
         Load the NDArray stored in the given path within the given key
 
+        With cached_load, the array is served from MultiArrayNumpyFile.cache until the file is modified; cached arrays
+        are read-only.
+
         Returns
         -------
         NDArray
         """
-        loaded = _cached_np_array_load(self.path) if self.cached_load else np.load(self.path)
-        try:
-            return loaded[self.key]
-        except IndexError:
+        if self.cached_load:
+            return self.cache.get(self.path, self.key, self._load_uncached)
+        return self._load_uncached()
+
+    def _load_uncached(self) -> npt.NDArray:
+        loaded = np.load(self.path)
+        if isinstance(loaded, np.ndarray):
             msg = f"The given path points to an uncompressed numpy file, which only has one array in it: {self.path}"
             raise AttributeError(msg)
+        with loaded:
+            return loaded[self.key]
+
+
+class LazyNumpyArray(NDArrayOperatorsMixin):
+    """
+    Proxy for an array stored in a .npy file or in a .npz file under a key; np.load is deferred until first use
+
+    Only the header is read on creation, so shape, dtype and ndim are known without reading the array data. The array
+    is loaded and cached on first use: load(), np.asarray, indexing, iteration, arithmetic and comparison operators,
+    numpy functions and ufuncs, or any other ndarray attribute. Results are plain ndarrays.
+    """
+
+    def __init__(
+        self,
+        source: Union[Path, MultiArrayNumpyFile],
+        *,
+        mmap_mode: Optional[MemoryMapMode] = None,
+        dtype: Optional[np.dtype] = None,
+        post_load: Optional[Callable[[npt.NDArray], npt.NDArray]] = None,
+    ):
+        """
+        Parameters
+        ----------
+        source: Path | MultiArrayNumpyFile
+            Path to a .npy file, or a key within a .npz file
+        mmap_mode: MemoryMapMode | None
+            Memory-map a .npy file with this mode when loading, see np.load
+        dtype: np.dtype | None
+            The dtype of the array after post_load; defaults to the dtype in the file header
+        post_load: Callable[[NDArray], NDArray] | None
+            Applied to the array once it is loaded, e.g. a data type conversion
+        """
+        self.source = source
+        self.mmap_mode = mmap_mode
+        self.header = self._read_header(source)
+        self.dtype = dtype or self.header.dtype
+        self._post_load = post_load
+        self._array: Optional[npt.NDArray] = None
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.header.shape
+
+    @property
+    def ndim(self) -> int:
+        return len(self.header.shape)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._array is not None
+
+    def load(self) -> npt.NDArray:
+        """
+        Load the array, the result is cached on the proxy
+
+        Returns
+        -------
+        NDArray
+        """
+        if self._array is None:
+            array = self._load_source()
+            self._array = self._post_load(array) if self._post_load else array
+        return self._array
+
+    def with_post_load(self, dtype: np.dtype, post_load: Callable[[npt.NDArray], npt.NDArray]) -> "LazyNumpyArray":
+        """
+        Create a new, unloaded, proxy of the same source that applies post_load when loaded
+
+        Parameters
+        ----------
+        dtype: np.dtype
+            The dtype of the array after post_load
+        post_load: Callable[[NDArray], NDArray]
+
+        Returns
+        -------
+        LazyNumpyArray
+        """
+        return type(self)(self.source, mmap_mode=self.mmap_mode, dtype=dtype, post_load=post_load)
+
+    def __array__(self, dtype: Optional[npt.DTypeLike] = None, copy: Optional[bool] = None) -> npt.NDArray:
+        array = self.load()
+        if dtype is not None and array.dtype != dtype:
+            return array.astype(dtype)
+        return array.copy() if copy else array
+
+    def __array_ufunc__(self, ufunc: np.ufunc, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        if "out" in kwargs:
+            kwargs["out"] = _load_lazy_arrays(kwargs["out"])
+        return getattr(ufunc, method)(*_load_lazy_arrays(inputs), **kwargs)
+
+    def __array_function__(self, func: Callable, types: Iterable[type], args: Iterable, kwargs: dict[str, Any]) -> Any:
+        return func(*_load_lazy_arrays(args), **_load_lazy_arrays(kwargs))
+
+    def __bool__(self) -> bool:
+        return bool(self.load())
+
+    def __getitem__(self, item: Any) -> Any:
+        return self.load()[item]
+
+    def __len__(self) -> int:
+        if not self.shape:
+            msg = "len() of unsized object"
+            raise TypeError(msg)
+        return self.shape[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.load())
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(source={self.source!r}, shape={self.shape}, dtype={self.dtype})"
+
+    def _load_source(self) -> npt.NDArray:
+        if isinstance(self.source, MultiArrayNumpyFile):
+            return self.source.load()
+        return load_array_file(self.source, mmap_mode=self.mmap_mode)
+
+    @staticmethod
+    def _read_header(source: Union[Path, MultiArrayNumpyFile]) -> NumpyArrayHeader:
+        if isinstance(source, MultiArrayNumpyFile):
+            try:
+                return read_npz_member_header(source.path, source.key)
+            except (KeyError, zipfile.BadZipFile):
+                msg = f"The key {source.key} is not in the multi array numpy file: {source.path}"
+                raise AttributeError(msg)
+        return read_array_file_header(source)
+
+
+class LazyChunkedArray(LazyNumpyArray):
+    """
+    Lazy handle for an array stored in chunks by the "chunked" dump layout
+
+    Indexing with integers, slices and Ellipsis reads and decompresses only the chunks that the selection overlaps,
+    the array is not loaded. Any other use loads, and caches, the whole array like LazyNumpyArray.
+    """
+
+    source: Path
+
+    def __init__(
+        self,
+        source: Path,
+        *,
+        mmap_mode: Optional[MemoryMapMode] = None,
+        dtype: Optional[np.dtype] = None,
+        post_load: Optional[Callable[[npt.NDArray], npt.NDArray]] = None,
+    ):
+        """
+        Parameters
+        ----------
+        source: Path
+            Directory of the chunked array
+        mmap_mode: MemoryMapMode | None
+            Unused, chunks are always read into memory
+        dtype: np.dtype | None
+            The dtype of the array after post_load; defaults to the dtype in the chunk metadata
+        post_load: Callable[[NDArray], NDArray] | None
+            Applied to the loaded array, and to every region read by indexing
+        """
+        self.metadata = read_chunked_array_metadata(source)
+        super().__init__(source, mmap_mode=mmap_mode, dtype=dtype, post_load=post_load)
+
+    def __getitem__(self, item: Any) -> Any:
+        if self._array is not None:
+            return self._array[item]
+
+        region = read_chunked_array_region(self.source, self.metadata, item)
+        if region is None:
+            return self.load()[item]
+        return self._post_load(region) if self._post_load else region
+
+    def _load_source(self) -> npt.NDArray:
+        return load_chunked_array(self.source)
+
+    def _read_header(self, source: Path) -> NumpyArrayHeader:  # type: ignore[override]
+        return NumpyArrayHeader(self.metadata.shape, False, self.metadata.dtype)
 
 
 class NumpyModel(BaseModel):
     _dump_compression: ClassVar[str] = "lz4"
     _dump_numpy_savez_file_name: ClassVar[str] = "arrays.npz"
+    _dump_numpy_array_directory_name: ClassVar[str] = "arrays"
+    _dump_manifest_file_name: ClassVar[str] = "manifest.json"
+    _dump_blob_directory_name: ClassVar[str] = ".pdnp-blobs"
+    _dump_layout: ClassVar[DumpLayout] = "npz"
+    _dump_array_codec: ClassVar[str] = "none"
+    _dump_field_array_codecs: ClassVar[Mapping[str, str]] = MappingProxyType({})
+    _dump_workers: ClassVar[int] = 1
+    _dump_chunk_bytes: ClassVar[int] = 2**22
+    _async_executor: ClassVar[Optional[Executor]] = None
+
+    _pdnp_dump_state: Optional["_DumpState"] = PrivateAttr(default=None)
+    _pdnp_fingerprint: Optional[str] = PrivateAttr(default=None)
     _dump_non_array_file_stem: ClassVar[str] = "object_info"
 
     _directory_suffix: ClassVar[str] = ".pdnp"
 
+    _json_stream_chunk_size: ClassVar[int] = 2**16
+    # Frozen models compare arrays exactly, by fingerprint, and become hashable
+    _exact_equality: ClassVar[bool] = False
+
     def __eq__(self, other: Any) -> bool:
+        """
+        Field by field equality, arrays are compared with np_general_all_close
+
+        Arrays with different shapes or data types are unequal, and arrays that view the same memory in the same way
+        are equal, without comparing elements; nested models and containers are compared recursively. Elements are only
+        compared once all other fields are found equal.
+
+        Frozen models with _exact_equality are equal when their fingerprints are, i.e. arrays must match exactly;
+        this keeps __eq__ consistent with __hash__.
+        """
+        if self is other:
+            return True
         if not isinstance(other, BaseModel):
             return NotImplemented  # delegate to the other item in the comparison
 
@@ -53,27 +363,193 @@ class NumpyModel(BaseModel):
 
         if not (
             self_type == other_type
-            and getattr(self, "__pydantic_private__", None) == getattr(other, "__pydantic_private__", None)
+            and _comparable_private_attributes(self) == _comparable_private_attributes(other)
             and self.__pydantic_extra__ == other.__pydantic_extra__
         ):
             return False
 
         if isinstance(other, NumpyModel):
-            self_ndarray_field_to_array, self_other_field_to_value = self._dump_numpy_split_dict()
-            other_ndarray_field_to_array, other_other_field_to_value = other._dump_numpy_split_dict()
+            if self.model_config.get("frozen") and self._exact_equality:
+                return self.fingerprint() == other.fingerprint()
 
-            return self_other_field_to_value == other_other_field_to_value and _compare_np_array_dicts(
-                self_ndarray_field_to_array, other_ndarray_field_to_array
-            )
+            array_pairs: list[tuple[npt.NDArray, npt.NDArray]] = []
+            return all(
+                _values_equal(getattr(self, field_name), getattr(other, field_name), array_pairs)
+                for field_name in type(self).model_fields
+            ) and all(np_general_all_close(array_a, array_b) for array_a, array_b in array_pairs)
 
         # Self is NumpyModel, other is not; likely unequal; checking anyway.
         return super().__eq__(other)
 
+    def __hash__(self) -> int:
+        if not (self.model_config.get("frozen") and self._exact_equality):
+            msg = f"unhashable type: {type(self).__name__!r}, only frozen NumpyModels with _exact_equality are hashable"
+            raise TypeError(msg)
+        return hash(self.fingerprint())
+
+    def fingerprint(self) -> str:
+        """
+        Digest of the content of the model: field names, and dtype, shape and bytes of every array
+
+        Arrays are hashed block by block, non-contiguous arrays are never copied as a whole; nested NumpyModels
+        contribute their fingerprint, other pydantic models their fields and other values their JSON representation.
+        Values that compare equal have the same fingerprint: dict items and set members are hashed in a canonical
+        order, and 0.0 and -0.0 are the same. Frozen models compute the fingerprint once, their arrays must not be
+        modified in place.
+
+        Returns
+        -------
+        str, hex digest prefixed with "blake2b:"
+        """
+        if (fingerprint := self._pdnp_fingerprint) is not None:
+            return fingerprint
+
+        digest = hashlib.blake2b(digest_size=16)
+        for field_name in type(self).model_fields:
+            digest.update(field_name.encode())
+            _update_fingerprint(digest, getattr(self, field_name))
+        fingerprint = f"blake2b:{digest.hexdigest()}"
+
+        if self.model_config.get("frozen"):
+            self._pdnp_fingerprint = fingerprint
+        return fingerprint
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> Self:
+        """Copy of the model, see BaseModel.model_copy; the memoized fingerprint is dropped when fields are updated"""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._pdnp_fingerprint = None
+        return copied
+
+    def model_dump_json_stream(self, fp: IO[bytes], *, chunk_size: Optional[int] = None) -> None:
+        """
+        Write the JSON representation of the model to a binary file-like object with bounded memory
+
+        See iter_model_dump_json.
+
+        Parameters
+        ----------
+        fp: IO[bytes]
+            Binary file-like object, e.g. an open file or a socket file
+        chunk_size: int | None
+            Maximum number of array elements encoded per chunk, defaults to _json_stream_chunk_size
+        """
+        for chunk in self.iter_model_dump_json(chunk_size=chunk_size):
+            fp.write(chunk)
+
+    def iter_model_dump_json(self, *, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Generate the JSON representation of the model as a sequence of byte chunks
+
+        Array fields that use one of the built-in serializers are encoded chunk by chunk straight from the array
+        buffer, as are nested NumpyModel fields; all other fields go through model_dump_json, and so do array fields
+        with a field_serializer, PlainSerializer or WrapSerializer. Models with a model_serializer are not streamed,
+        they are encoded by model_dump_json as a whole. The concatenated chunks form the same document as
+        model_dump_json.
+
+        Parameters
+        ----------
+        chunk_size: int | None
+            Maximum number of array elements encoded per chunk, defaults to _json_stream_chunk_size
+
+        Returns
+        -------
+        Iterator[bytes]
+        """
+        decorators = type(self).__pydantic_decorators__
+        if decorators.model_serializers:
+            yield self.model_dump_json().encode()
+            return
+
+        chunk_size = chunk_size or self._json_stream_chunk_size
+        inf_nan_mode = self.model_config.get("ser_json_inf_nan", "null")
+        by_alias = self.model_config.get("serialize_by_alias", False)
+        custom_serialized_field_names = {
+            field_name for decorator in decorators.field_serializers.values() for field_name in decorator.info.fields
+        }
+
+        pending_field_names: set[str] = set()
+        first = True
+
+        def flush_pending_fields() -> Iterator[bytes]:
+            nonlocal first
+            if pending_field_names:
+                fragment = self.model_dump_json(include=pending_field_names)[1:-1]
+                pending_field_names.clear()
+                if fragment:
+                    yield fragment.encode() if first else b"," + fragment.encode()
+                    first = False
+
+        yield b"{"
+        for field_name, field_info in type(self).model_fields.items():
+            if field_info.exclude:
+                continue
+
+            value = getattr(self, field_name)
+            if custom_serialized_field_names & {field_name, "*"}:
+                pending_field_names.add(field_name)
+                continue
+            if isinstance(value, (np.ndarray, LazyNumpyArray)) and (encoder := _streaming_json_encoder(field_info)):
+                value_chunks = encoder(value, chunk_size, inf_nan_mode)
+            elif isinstance(value, NumpyModel) and type(value) is field_info.annotation:
+                value_chunks = value.iter_model_dump_json(chunk_size=chunk_size)
+            else:
+                pending_field_names.add(field_name)
+                continue
+
+            yield from flush_pending_fields()
+            key = (field_info.serialization_alias or field_info.alias or field_name) if by_alias else field_name
+            yield (b"" if first else b",") + to_json(key) + b":"
+            yield from value_chunks
+            first = False
+
+        pending_field_names.update(self.__pydantic_extra__ or ())
+        pending_field_names.update(type(self).__pydantic_computed_fields__)
+        yield from flush_pending_fields()
+        yield b"}"
+
     @classmethod
     @validate_call
     def model_directory_path(cls, output_directory: DirectoryPath, object_id: str) -> DirectoryPath:
+        return cls._model_directory_path(output_directory, object_id)
+
+    @classmethod
+    def _model_directory_path(cls, output_directory: Path, object_id: str) -> Path:
         return output_directory / f"{object_id}.{cls.__name__}{cls._directory_suffix}"
 
+    @classmethod
+    @validate_call
+    def inspect(cls, output_directory: DirectoryPath, object_id: str) -> dict[str, ArrayInfo]:
+        """
+        Describe the array fields of a dump without loading or decompressing them
+
+        The description is read from the manifest written by dump. Dumps without a manifest are described from the
+        array file headers, without checksums.
+
+        Parameters
+        ----------
+        output_directory: DirectoryPath
+            The root directory where all model instances of interest are stored
+        object_id: String
+            The ID of the model instance
+
+        Returns
+        -------
+        dict[str, ArrayInfo], shape, dtype, byte size, codec and checksum of every array field, and the blob key with
+        the "blob" layout
+        """
+        object_directory_path = cls._model_directory_path(output_directory, object_id)
+        if (manifest_path := object_directory_path / cls._dump_manifest_file_name).exists():
+            return read_array_manifest(manifest_path).arrays
+        if (array_directory_path := object_directory_path / cls._dump_numpy_array_directory_name).is_dir():
+            return inspect_array_directory(array_directory_path)
+        if (npz_path := object_directory_path / cls._dump_numpy_savez_file_name).exists():
+            return inspect_npz_file(npz_path)
+        if not object_directory_path.is_dir():
+            msg = f"Could not find {cls.__name__} with {object_id} in {output_directory}"
+            raise FileNotFoundError(msg)
+        return {}
+
     @classmethod
     @validate_call
     def load(
@@ -82,6 +558,11 @@ class NumpyModel(BaseModel):
         object_id: str,
         *,
         pre_load_modifier: Optional[Callable[[dict[str, Any]], dict[str, Any]]] = None,
+        mmap_mode: Optional[MemoryMapMode] = None,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        workers: Optional[int] = None,
+        blob_directory: Optional[Path] = None,
     ):
         """
         Load NumpyModel instance
@@ -94,15 +575,227 @@ class NumpyModel(BaseModel):
             The ID of the model instance
         pre_load_modifier: Callable[[dict[str, Any]], dict[str, Any]] | None
             Optional function that modifies the loaded arrays
+        mmap_mode: MemoryMapMode | None
+            Memory-map the arrays with this mode (see np.load) instead of reading them into memory. Only applies to
+            dumps with the "npy" layout, arrays in an npz file are always read into memory.
+        fields: Iterable[str] | None
+            Only read these array fields. The other array fields are LazyNumpyArray proxies, read on first use; with
+            the "chunked" layout they are LazyChunkedArray handles that read only the chunks a slice touches. Non-array
+            fields are always loaded. model_dump returns the proxies as they are, without reading them.
+        exclude: Iterable[str] | None
+            Do not read these array fields, they are LazyNumpyArray proxies read on first use.
+        workers: int | None
+            Number of threads that read and decompress array files, or chunks, concurrently; only applies to dumps
+            with the "npy", "chunked" or "blob" layout. Defaults to _dump_workers.
+        blob_directory: Path | None
+            Blob directory of dumps with the "blob" layout, see dump
 
         Returns
         -------
         NumpyModel instance
         """
-        object_directory_path = cls.model_directory_path(output_directory, object_id)
+        object_directory_path = cls._model_directory_path(output_directory, object_id)
 
-        npz_file = np.load(object_directory_path / cls._dump_numpy_savez_file_name)
+        field_to_value = {
+            **cls._load_non_array_fields(object_directory_path),
+            **cls._load_array_fields(
+                object_directory_path,
+                mmap_mode,
+                fields=None if fields is None else frozenset(fields),
+                exclude=frozenset(exclude or ()),
+                workers=workers or cls._dump_workers,
+                blob_directory=blob_directory,
+            ),
+        }
+        model = cls._from_loaded_fields(field_to_value, pre_load_modifier)
+        if pre_load_modifier is None:
+            model._pdnp_dump_state = _DumpState.of(model, object_directory_path)
+        return model
 
+    @classmethod
+    @validate_call(config={"arbitrary_types_allowed": True})
+    async def aload(
+        cls,
+        output_directory: DirectoryPath,
+        object_id: str,
+        *,
+        pre_load_modifier: Optional[Callable[[dict[str, Any]], dict[str, Any]]] = None,
+        mmap_mode: Optional[MemoryMapMode] = None,
+        fields: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        workers: Optional[int] = None,
+        blob_directory: Optional[Path] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Load NumpyModel instance without blocking the event loop, see load
+
+        The array payload and the non-array fields are read concurrently in the executor, which also runs validation.
+
+        Parameters
+        ----------
+        output_directory: DirectoryPath
+            The root directory where all model instances of interest are stored
+        object_id: String
+            The ID of the model instance
+        pre_load_modifier: Callable[[dict[str, Any]], dict[str, Any]] | None
+            Optional function that modifies the loaded arrays
+        mmap_mode: MemoryMapMode | None
+            See load
+        fields: Iterable[str] | None
+            See load
+        exclude: Iterable[str] | None
+            See load
+        workers: int | None
+            See load
+        blob_directory: Path | None
+            See load
+        executor: Executor | None
+            Executor that runs the blocking work. Defaults to _async_executor, or the event loop's default executor.
+
+        Returns
+        -------
+        NumpyModel instance
+        """
+        loop = asyncio.get_running_loop()
+        executor = executor or cls._async_executor
+        object_directory_path = cls._model_directory_path(output_directory, object_id)
+
+        array_field_to_value, other_field_to_value = await asyncio.gather(
+            loop.run_in_executor(
+                executor,
+                partial(
+                    cls._load_array_fields,
+                    object_directory_path,
+                    mmap_mode,
+                    fields=None if fields is None else frozenset(fields),
+                    exclude=frozenset(exclude or ()),
+                    workers=workers or cls._dump_workers,
+                    blob_directory=blob_directory,
+                ),
+            ),
+            loop.run_in_executor(executor, cls._load_non_array_fields, object_directory_path),
+        )
+        model = await loop.run_in_executor(
+            executor,
+            cls._from_loaded_fields,
+            {**other_field_to_value, **array_field_to_value},
+            pre_load_modifier,
+        )
+        if pre_load_modifier is None:
+            model._pdnp_dump_state = _DumpState.of(model, object_directory_path)
+        return model
+
+    @classmethod
+    def load_many(
+        cls,
+        output_directory: DirectoryPath,
+        object_ids: Iterable[str],
+        *,
+        workers: Optional[int] = None,
+        pool: BulkPool = "thread",
+        **load_kwargs: Any,
+    ) -> list[Union["NumpyModel", Exception]]:
+        """
+        Load many NumpyModel instances, spread over a pool of workers
+
+        Parameters
+        ----------
+        output_directory: DirectoryPath
+            The root directory where all model instances of interest are stored
+        object_ids: Iterable[str]
+            The IDs of the model instances
+        workers: int | None
+            Size of the pool, defaults to the number of CPUs; 1 loads in the calling thread
+        pool: BulkPool
+            "thread" or "process"; with "process" the class must be importable by the worker processes
+        load_kwargs
+            Key-word arguments to pass to the load function, except workers; see _dump_workers
+
+        Returns
+        -------
+        The loaded instances in the order of object_ids; the exception raised by load in place of instances that
+        failed to load
+        """
+        output_directory = TypeAdapter(DirectoryPath).validate_python(output_directory)
+        return _map_batches(partial(_load_batch, cls, output_directory, load_kwargs), list(object_ids), workers, pool)
+
+    @classmethod
+    def _from_loaded_fields(
+        cls,
+        field_to_value: dict[str, Any],
+        pre_load_modifier: Optional[Callable[[dict[str, Any]], dict[str, Any]]] = None,
+    ) -> "NumpyModel":
+        field_to_value = _insert_nested_arrays(field_to_value)
+        if pre_load_modifier:
+            field_to_value = pre_load_modifier(field_to_value)
+        return cls(**field_to_value)
+
+    @classmethod
+    def _load_array_fields(
+        cls,
+        object_directory_path: Path,
+        mmap_mode: Optional[MemoryMapMode] = None,
+        *,
+        fields: Optional[frozenset[str]] = None,
+        exclude: frozenset[str] = frozenset(),
+        workers: int = 1,
+        blob_directory: Optional[Path] = None,
+    ) -> dict[str, Union[npt.NDArray, LazyNumpyArray]]:
+        if unknown_field_names := ((fields or frozenset()) | exclude) - cls.model_fields.keys():
+            msg = f"{cls.__name__} has no fields {', '.join(sorted(unknown_field_names))}"
+            raise ValueError(msg)
+
+        def is_selected(array_key: str) -> bool:
+            field_name = _array_key_field(array_key)
+            return (fields is None or field_name in fields) and field_name not in exclude
+
+        def load_array_files(field_to_path: dict[str, Path]) -> None:
+            selected_fields = [field_name for field_name in field_to_path if is_selected(field_name)]
+            loaded_arrays = run_concurrently(
+                [partial(load_array_file, field_to_path[field_name], mmap_mode) for field_name in selected_fields],
+                workers,
+            )
+            field_to_array.update(zip(selected_fields, loaded_arrays))
+            for field_name, array_path in field_to_path.items():
+                if field_name not in field_to_array:
+                    field_to_array[field_name] = LazyNumpyArray(array_path, mmap_mode=mmap_mode)
+
+        field_to_array: dict[str, Union[npt.NDArray, LazyNumpyArray]] = {}
+        if (array_directory_path := object_directory_path / cls._dump_numpy_array_directory_name).is_dir():
+            load_array_files(list_array_files(array_directory_path))
+
+            for field_name, chunked_array_path in list_chunked_arrays(array_directory_path).items():
+                field_to_array[field_name] = (
+                    load_chunked_array(chunked_array_path, workers)
+                    if is_selected(field_name)
+                    else LazyChunkedArray(chunked_array_path)
+                )
+        elif (npz_path := object_directory_path / cls._dump_numpy_savez_file_name).exists():
+            with np.load(npz_path) as npz_file:
+                for key in npz_file.files:
+                    field_to_array[key] = (
+                        npz_file[key]
+                        if is_selected(key)
+                        else LazyNumpyArray(MultiArrayNumpyFile(path=npz_path, key=key))
+                    )
+        elif (manifest_path := object_directory_path / cls._dump_manifest_file_name).exists():
+            if (manifest := read_array_manifest(manifest_path)).layout == "blob":
+                if mmap_mode == "r+":
+                    msg = "Blobs are shared between dumps, they can not be memory-mapped in 'r+' mode"
+                    raise ValueError(msg)
+                blob_directory = blob_directory or object_directory_path.parent / cls._dump_blob_directory_name
+                field_to_blob_path = {}
+                for field_name, info in manifest.arrays.items():
+                    if info.blob is None:
+                        msg = f"{manifest_path} lists no blob for the array field {field_name}"
+                        raise ValueError(msg)
+                    field_to_blob_path[field_name] = blob_path(blob_directory, info.blob)
+                load_array_files(field_to_blob_path)
+        return field_to_array
+
+    @classmethod
+    def _load_non_array_fields(cls, object_directory_path: Path) -> dict[str, Any]:
         other_path: FilePath
         if (other_path := object_directory_path / cls._dump_compressed_pickle_file_name).exists():  # type: ignore[operator]
             other_field_to_value = compress_pickle.load(other_path)
@@ -111,63 +804,509 @@ class NumpyModel(BaseModel):
                 other_field_to_value = pickle_pkg.load(in_pickle)
         elif (other_path := object_directory_path / cls._dump_non_array_yaml_name).exists():  # type: ignore[operator]
             with open(other_path, "r") as in_yaml:
-                other_field_to_value = yaml.load(in_yaml)
+                other_field_to_value = _yaml().load(in_yaml)
         else:
             other_field_to_value = {}
 
-        field_to_value = {**npz_file, **other_field_to_value}
-        if pre_load_modifier:
-            field_to_value = pre_load_modifier(field_to_value)
-
-        return cls(**field_to_value)
+        return other_field_to_value
 
     @validate_call
     def dump(
-        self, output_directory: Path, object_id: str, *, compress: bool = True, pickle: bool = False
+        self,
+        output_directory: Path,
+        object_id: str,
+        *,
+        compress: bool = True,
+        pickle: bool = False,
+        layout: Optional[DumpLayout] = None,
+        codec: Optional[str] = None,
+        field_codecs: Optional[dict[str, str]] = None,
+        workers: Optional[int] = None,
+        blob_directory: Optional[Path] = None,
+        incremental: bool = False,
+        checksum: Optional[ChecksumAlgorithm] = "crc32",
     ) -> DirectoryPath:
+        """
+        Dump NumpyModel instance, arrays and other fields are stored separately
+
+        Parameters
+        ----------
+        output_directory: Path
+            The root directory where all model instances of interest are stored
+        object_id: String
+            The ID of the model instance
+        compress: bool
+            Compress the npz file and the pickle file
+        pickle: bool
+            Store the non-array fields with pickle instead of YAML, required for arbitrary types
+        layout: DumpLayout | None
+            "npz" stores all arrays in a single npz file. "npy" stores each array in its own uncompressed .npy file,
+            which NumpyModel.load can memory-map. "chunked" splits each array into fixed-shape chunks of at most
+            _dump_chunk_bytes, compressed on their own, which LazyChunkedArray reads selectively. Defaults to
+            _dump_layout. "blob" stores each array once, under its checksum, in a blob directory shared by all dumps;
+            the dump only holds references in its manifest.
+        codec: str | None
+            Name of the codec that compresses each .npy file of the "npy" and "blob" layouts, or each chunk of the
+            "chunked" layout: "none", "zlib", "lz4" or "zstd".
+            Uncompressed files ("none") can be memory-mapped. Defaults to _dump_array_codec.
+        field_codecs: dict[str, str] | None
+            Codec name per array field, overrides codec for these fields. Merged over _dump_field_array_codecs.
+        workers: int | None
+            Number of threads that compress and write the .npy files, or chunks, concurrently. Defaults to
+            _dump_workers.
+        blob_directory: Path | None
+            Blob directory of the "blob" layout, defaults to _dump_blob_directory_name in output_directory. A
+            non-default blob directory must also be passed to load and collect_blob_garbage.
+        incremental: bool
+            Only rewrite the array fields that changed since this instance was last loaded from, or dumped to, the
+            same location with the same "npy", "chunked" or "blob" layout; otherwise, dump in full. A field changes
+            when it is assigned, or when the shape or dtype in the manifest no longer matches, e.g. after append;
+            in-place modifications must be reported with mark_changed. The non-array fields are always rewritten.
+            Unchanged fields keep the codec they were stored with.
+        checksum: ChecksumAlgorithm | None
+            Algorithm of the checksum recorded for every written array in the manifest, see array_checksum. The
+            default "crc32" is fast enough to tell unchanged arrays apart on every dump; None skips the extra pass
+            over the data. The "blob" layout always records "blake2b" checksums, blobs are stored under them.
+
+        Returns
+        -------
+        DirectoryPath of the dumped model instance
+        """
         assert "arbitrary_types_allowed" not in self.model_config or (
             self.model_config["arbitrary_types_allowed"] and pickle
         ), "Arbitrary types are only supported in pickle mode"
 
-        dump_directory_path = self.model_directory_path(output_directory, object_id)
+        dump_directory_path = self._model_directory_path(output_directory, object_id)
         dump_directory_path.mkdir(parents=True, exist_ok=True)
+        manifest_path = dump_directory_path / self._dump_manifest_file_name
+        layout = layout or self._dump_layout
+        workers = workers or self._dump_workers
+        blob_directory = blob_directory or Path(output_directory) / self._dump_blob_directory_name
+
+        previous_manifest = self._incremental_dump_base(dump_directory_path, layout) if incremental else None
+        manifest_path.unlink(missing_ok=True)
 
-        ndarray_field_to_array, other_field_to_value = self._dump_numpy_split_dict()
+        changed_fields = None if previous_manifest is None else self.changed_fields()
+        ndarray_field_to_array, other_field_to_value = self._dump_numpy_split_dict(unloaded_fields=changed_fields)
+        if changed_fields is not None:
+            assert previous_manifest is not None
+            # The dump may have changed on disk since, e.g. NumpyModel.append grew an array in place
+            changed_fields |= _fields_differing_from_manifest(previous_manifest, ndarray_field_to_array)
+            ndarray_field_to_array = {
+                array_key: _load_lazy_arrays(array)
+                for array_key, array in ndarray_field_to_array.items()
+                if _array_key_field(array_key) in changed_fields
+            }
 
-        if ndarray_field_to_array:
-            (np.savez_compressed if compress else np.savez)(
-                dump_directory_path / self._dump_numpy_savez_file_name, **ndarray_field_to_array
+        npz_path = dump_directory_path / self._dump_numpy_savez_file_name
+        array_directory_path = dump_directory_path / self._dump_numpy_array_directory_name
+        field_to_codec = self._array_field_codecs(ndarray_field_to_array, codec, field_codecs)
+        checksum_algorithm: Optional[ChecksumAlgorithm] = "blake2b" if layout == "blob" else checksum
+        checksums: list[Optional[str]] = (
+            run_concurrently(
+                [partial(array_checksum, array, checksum_algorithm) for array in ndarray_field_to_array.values()],
+                workers,
+            )
+            if checksum_algorithm is not None
+            else [None] * len(ndarray_field_to_array)
+        )
+        blob_keys: list[Optional[str]] = [None] * len(ndarray_field_to_array)
+
+        if layout == "blob":
+            npz_path.unlink(missing_ok=True)
+            if array_directory_path.is_dir():
+                shutil.rmtree(array_directory_path)
+            blob_keys = run_concurrently(
+                [
+                    partial(save_blob, blob_directory, array, field_to_codec[field_name], array_checksum_value)
+                    for (field_name, array), array_checksum_value in zip(ndarray_field_to_array.items(), checksums)
+                ],
+                workers,
+            )
+        elif layout == "npy":
+            npz_path.unlink(missing_ok=True)
+            save_arrays_to_directory(
+                array_directory_path,
+                ndarray_field_to_array,
+                field_to_codec,
+                workers,
+                replace_only=changed_fields is not None,
+            )
+        elif layout == "chunked":
+            npz_path.unlink(missing_ok=True)
+            save_chunked_arrays_to_directory(
+                array_directory_path,
+                ndarray_field_to_array,
+                field_to_codec,
+                self._dump_chunk_bytes,
+                workers,
+                replace_only=changed_fields is not None,
+            )
+        else:
+            if compressed_fields := [
+                name for name, field_codec in field_to_codec.items() if field_codec.name != "none"
+            ]:
+                msg = (
+                    "Array codecs require the 'npy', 'chunked' or 'blob' layout, the 'npz' layout is compressed with "
+                    f"compress; fields with a codec: {', '.join(compressed_fields)}"
+                )
+                raise ValueError(msg)
+            if array_directory_path.is_dir():
+                shutil.rmtree(array_directory_path)
+            if ndarray_field_to_array:
+                with open_for_replace(npz_path) as out_npz:
+                    (np.savez_compressed if compress else np.savez)(out_npz, **ndarray_field_to_array)
+
+        field_to_info = {
+            field_name: ArrayInfo(
+                shape=array.shape,
+                dtype=array.dtype,
+                nbytes=array.nbytes,
+                codec=("zlib" if compress else "none") if layout == "npz" else field_to_codec[field_name].name,
+                checksum=array_checksum_value,
+                blob=blob_key,
+            )
+            for (field_name, array), array_checksum_value, blob_key in zip(
+                ndarray_field_to_array.items(), checksums, blob_keys
             )
+        }
+        if previous_manifest is not None:
+            assert changed_fields is not None
+            removed_fields = {
+                array_key for array_key in previous_manifest.arrays if _array_key_field(array_key) in changed_fields
+            } - field_to_info.keys()
+            if layout != "blob":
+                remove_array_entries(array_directory_path, removed_fields)
+            field_to_info = {
+                **{
+                    array_key: info
+                    for array_key, info in previous_manifest.arrays.items()
+                    if array_key not in removed_fields
+                },
+                **field_to_info,
+            }
+        write_array_manifest(manifest_path, layout, field_to_info)
+
+        # A previous dump may have stored the non-array fields in another file, or fields that are arrays now
+        non_array_path = dump_directory_path / (
+            (self._dump_compressed_pickle_file_name if compress else self._dump_pickle_file_name)  # pyright: ignore
+            if pickle
+            else self._dump_non_array_yaml_name
+        )
+        for other_path in (
+            dump_directory_path / self._dump_compressed_pickle_file_name,  # pyright: ignore
+            dump_directory_path / self._dump_pickle_file_name,  # pyright: ignore
+            dump_directory_path / self._dump_non_array_yaml_name,  # pyright: ignore
+        ):
+            if other_path != non_array_path or not other_field_to_value:
+                other_path.unlink(missing_ok=True)
 
         if other_field_to_value:
             if pickle:
                 if compress:
-                    compress_pickle.dump(
-                        other_field_to_value,
-                        dump_directory_path / self._dump_compressed_pickle_file_name,  # pyright: ignore
-                        compression=self._dump_compression,
-                    )
+                    compress_pickle.dump(other_field_to_value, non_array_path, compression=self._dump_compression)
                 else:
-                    with open(dump_directory_path / self._dump_pickle_file_name, "wb") as out_pickle:  # pyright: ignore
+                    with open(non_array_path, "wb") as out_pickle:
                         pickle_pkg.dump(other_field_to_value, out_pickle)
 
             else:
-                with open(dump_directory_path / self._dump_non_array_yaml_name, "w") as out_yaml:  # pyright: ignore
-                    yaml.dump(other_field_to_value, out_yaml)
+                with open(non_array_path, "w") as out_yaml:
+                    _yaml().dump(other_field_to_value, out_yaml)
 
+        self._pdnp_dump_state = _DumpState.of(self, dump_directory_path)
         return dump_directory_path
 
-    def _dump_numpy_split_dict(self) -> tuple[dict, dict]:
-        ndarray_field_to_array = {}
+    def changed_fields(self) -> frozenset[str]:
+        """
+        Names of the fields that changed since the instance was last loaded or dumped
+
+        A field has changed when it was assigned a different value, or reported with mark_changed. All fields have
+        changed if the instance was neither loaded nor dumped.
+
+        Returns
+        -------
+        frozenset[str]
+        """
+        if (dump_state := self._pdnp_dump_state) is None:
+            return frozenset(type(self).model_fields)
+        return dump_state.changed_fields | frozenset(
+            field_name
+            for field_name in type(self).model_fields
+            if self.__dict__.get(field_name) is not dump_state.field_values.get(field_name)
+        )
+
+    def mark_changed(self, *field_names: str) -> None:
+        """
+        Report fields that were modified in place, e.g. by writing into an array, for incremental dumps
+
+        Parameters
+        ----------
+        field_names: str
+            Names of the modified fields
+        """
+        if unknown_field_names := set(field_names) - type(self).model_fields.keys():
+            msg = f"{type(self).__name__} has no fields {', '.join(sorted(unknown_field_names))}"
+            raise ValueError(msg)
+        if (dump_state := self._pdnp_dump_state) is not None:
+            self._pdnp_dump_state = dump_state.with_changed_fields(field_names)
+
+    def _incremental_dump_base(self, dump_directory_path: Path, layout: DumpLayout) -> Optional[ArrayManifest]:
+        """The manifest of the dump to update incrementally, None if the dump must be written in full"""
+        if layout == "npz" or (dump_state := self._pdnp_dump_state) is None:
+            return None
+        if dump_state.location != dump_directory_path.resolve():
+            return None
+        if not (manifest_path := dump_directory_path / self._dump_manifest_file_name).exists():
+            return None
+        if (manifest := read_array_manifest(manifest_path)).layout != layout:
+            return None
+        return manifest
+
+    @classmethod
+    def collect_blob_garbage(
+        cls, output_directory: DirectoryPath, *, blob_directory: Optional[Path] = None, min_age: float = 3600.0
+    ) -> list[Path]:
+        """
+        Remove the blobs of the "blob" layout that no dump in output_directory references anymore
+
+        Parameters
+        ----------
+        output_directory: DirectoryPath
+            The root directory where all model instances of interest are stored, every dump in it is scanned
+        blob_directory: Path | None
+            Blob directory, defaults to _dump_blob_directory_name in output_directory
+        min_age: float
+            Blobs modified less than min_age seconds ago are kept, dumps in progress may not have written their
+            manifest yet
+
+        Returns
+        -------
+        list[Path], the removed blob files
+        """
+        output_directory = TypeAdapter(DirectoryPath).validate_python(output_directory)
+        referenced_keys: set[str] = set()
+        for dump_directory_path in output_directory.iterdir():
+            if (manifest_path := dump_directory_path / cls._dump_manifest_file_name).is_file():
+                if (manifest := read_array_manifest(manifest_path)).layout == "blob":
+                    referenced_keys.update(info.blob for info in manifest.arrays.values() if info.blob is not None)
+
+        return collect_unreferenced_blobs(
+            blob_directory or output_directory / cls._dump_blob_directory_name, referenced_keys, min_age
+        )
+
+    @classmethod
+    def append(
+        cls,
+        output_directory: DirectoryPath,
+        object_id: str,
+        field: str,
+        rows: npt.ArrayLike,
+        *,
+        workers: Optional[int] = None,
+    ) -> tuple[int, ...]:
+        """
+        Append rows along axis 0 to an array field of a dump, in place on disk
+
+        Only the field's own file is written, the other fields are left alone; load returns the concatenated array.
+        Supported are uncompressed fields of the "npy" layout, whose header is rewritten with the new shape, and fields
+        of the "chunked" layout, whose trailing chunks are rewritten or added. The checksum of the field is cleared
+        from the manifest, computing it would read the whole array.
+
+        Parameters
+        ----------
+        output_directory: DirectoryPath
+            The root directory where all model instances of interest are stored
+        object_id: String
+            The ID of the model instance
+        field: str
+            Name of the array field, or path of a nested array, e.g. child.weights
+        rows: ArrayLike
+            Rows to append, with the same shape as the stored array along the other axes; cast to the stored dtype
+        workers: int | None
+            Number of threads that compress and write chunks concurrently, defaults to _dump_workers
+
+        Returns
+        -------
+        tuple[int, ...], the new shape of the stored array
+        """
+        if _array_key_field(field) not in cls.model_fields:
+            msg = f"{cls.__name__} has no field {field!r}"
+            raise ValueError(msg)
+
+        object_directory_path = cls.model_directory_path(output_directory, object_id)
+        if not object_directory_path.is_dir():
+            msg = f"Could not find {cls.__name__} with {object_id} in {output_directory}"
+            raise FileNotFoundError(msg)
+
+        array_directory_path = object_directory_path / cls._dump_numpy_array_directory_name
+        field_to_path = list_array_files(array_directory_path) if array_directory_path.is_dir() else {}
+        rows_array = np.asarray(rows)
+        if (chunked_array_path := array_directory_path / field).is_dir():
+            shape = append_to_chunked_array(chunked_array_path, rows_array, workers or cls._dump_workers)
+        elif (array_path := field_to_path.get(field)) is not None and array_path.suffix == ".npy":
+            shape = append_to_array_file(array_path, rows_array)
+        else:
+            msg = (
+                f"Could not append to {field!r} of {object_id}: only uncompressed fields of the 'npy' layout and "
+                "fields of the 'chunked' layout can grow in place"
+            )
+            raise ValueError(msg)
+
+        if (manifest_path := object_directory_path / cls._dump_manifest_file_name).exists():
+            manifest = read_array_manifest(manifest_path)
+            if (info := manifest.arrays.get(field)) is not None:
+                field_to_info = dict(manifest.arrays)
+                field_to_info[field] = info._replace(
+                    shape=shape, nbytes=math.prod(shape) * info.dtype.itemsize, checksum=None
+                )
+                write_array_manifest(manifest_path, manifest.layout, field_to_info)
+        return shape
+
+    @classmethod
+    def dump_many(
+        cls,
+        models_by_id: Mapping[str, "NumpyModel"],
+        output_directory: Path,
+        *,
+        workers: Optional[int] = None,
+        pool: BulkPool = "thread",
+        **dump_kwargs: Any,
+    ) -> list[Union[DirectoryPath, Exception]]:
+        """
+        Dump many NumpyModel instances, spread over a pool of workers
+
+        Parameters
+        ----------
+        models_by_id: Mapping[str, NumpyModel]
+            Mapping of object ID to model instance, instances of cls or its subclasses; NumpyModel.dump_many accepts
+            instances of any NumpyModel class
+        output_directory: Path
+            The root directory where all model instances of interest are stored, created if missing
+        workers: int | None
+            Size of the pool, defaults to the number of CPUs; 1 dumps in the calling thread
+        pool: BulkPool
+            "thread" or "process"; with "process" the instances must be picklable
+        dump_kwargs
+            Key-word arguments to pass to the dump function, except workers; see _dump_workers
+
+        Returns
+        -------
+        DirectoryPath of every dumped instance in the order of models_by_id; the exception raised by dump in place of
+        instances that failed to dump
+        """
+        if other_classes := {type(model).__name__ for model in models_by_id.values() if not isinstance(model, cls)}:
+            msg = f"{cls.__name__}.dump_many got instances of {', '.join(sorted(other_classes))}"
+            raise TypeError(msg)
+
+        output_directory = Path(output_directory)
+        output_directory.mkdir(parents=True, exist_ok=True)
+        return _map_batches(
+            partial(_dump_batch, output_directory, dump_kwargs), list(models_by_id.items()), workers, pool
+        )
+
+    async def adump(
+        self, output_directory: Path, object_id: str, *, executor: Optional[Executor] = None, **dump_kwargs: Any
+    ) -> DirectoryPath:
+        """
+        Dump NumpyModel instance without blocking the event loop, see dump
+
+        The dump is written to a staging directory in the executor and moved into place once complete, replacing any
+        previous dump of the instance. If the call is cancelled, or fails, the staging directory is removed and the
+        previous dump, if any, is left as it was.
+
+        Parameters
+        ----------
+        output_directory: Path
+            The root directory where all model instances of interest are stored
+        object_id: String
+            The ID of the model instance
+        executor: Executor | None
+            Executor that runs the blocking work. Defaults to _async_executor, or the event loop's default executor.
+        dump_kwargs
+            Key-word arguments to pass to the dump function
+
+        Returns
+        -------
+        DirectoryPath of the dumped model instance
+        """
+        cancelled = threading.Event()
+        commit_lock = threading.Lock()
+        dump_future = asyncio.get_running_loop().run_in_executor(
+            executor or self._async_executor,
+            partial(self._dump_staged, Path(output_directory), object_id, cancelled, commit_lock, dump_kwargs),
+        )
+        try:
+            return await dump_future
+        except asyncio.CancelledError:
+            with commit_lock:
+                cancelled.set()
+            raise
+
+    def _dump_staged(
+        self,
+        output_directory: Path,
+        object_id: str,
+        cancelled: threading.Event,
+        commit_lock: threading.Lock,
+        dump_kwargs: dict[str, Any],
+    ) -> DirectoryPath:
+        staging_directory_path = output_directory / f".{object_id}.{uuid4().hex}.staging"
+        staging_directory_path.mkdir(parents=True)
+        try:
+            if (dump_kwargs.get("layout") or self._dump_layout) == "blob":
+                dump_kwargs = {
+                    "blob_directory": output_directory / self._dump_blob_directory_name,
+                    **dump_kwargs,
+                }
+            staged_dump_directory_path = self.dump(staging_directory_path, object_id, **dump_kwargs)
+            with commit_lock:
+                if cancelled.is_set():
+                    # adump was cancelled while the dump ran; nobody awaits this result any more
+                    raise asyncio.CancelledError
+                dump_directory_path = self._model_directory_path(output_directory, object_id)
+                replace_directory(staged_dump_directory_path, dump_directory_path)
+                self._pdnp_dump_state = _DumpState.of(self, dump_directory_path)
+                return dump_directory_path
+        finally:
+            shutil.rmtree(staging_directory_path, ignore_errors=True)
+
+    def _array_field_codecs(
+        self, field_names: Iterable[str], codec: Optional[str], field_codecs: Optional[dict[str, str]]
+    ) -> dict[str, ArrayCodec]:
+        field_to_codec_name = {**self._dump_field_array_codecs, **(field_codecs or {})}
+        default_codec_name = codec or self._dump_array_codec
+        return {
+            array_key: get_array_codec(
+                field_to_codec_name.get(
+                    array_key, field_to_codec_name.get(_array_key_field(array_key), default_codec_name)
+                )
+            )
+            for array_key in field_names
+        }
+
+    def _dump_numpy_split_dict(self, unloaded_fields: Optional[frozenset[str]] = None) -> tuple[dict, dict]:
+        """
+        Split the fields into arrays and other values, walking nested models, dicts, lists and tuples
+
+        Arrays nested in a field are keyed by their path, e.g. child.weights or layers.0.bias, and replaced by None in
+        the other values; nested models become dicts. Containers without arrays are returned as is, not copied. The
+        fields are those of model_dump, see _model_dump_items.
+        unloaded_fields: only load the LazyNumpyArray values of these fields, the others are returned as is
+        """
+        ndarray_key_to_array: dict[str, Union[npt.NDArray, LazyNumpyArray]] = {}
         other_field_to_value = {}
 
-        for k, v in self.model_dump().items():
-            if isinstance(v, np.ndarray):
-                ndarray_field_to_array[k] = v
-            elif v:
-                other_field_to_value[k] = v
+        for field_name, value in _model_dump_items(self):
+            value = _split_arrays(
+                value,
+                field_name,
+                ndarray_key_to_array,
+                load_lazy=unloaded_fields is None or field_name in unloaded_fields,
+            )
+            if field_name not in ndarray_key_to_array:
+                other_field_to_value[field_name] = value
 
-        return ndarray_field_to_array, other_field_to_value
+        return ndarray_key_to_array, other_field_to_value
 
     @classmethod  # type: ignore[misc]
     @computed_field(return_type=str)
@@ -229,51 +1368,528 @@ def model_agnostic_load(
     return None
 
 
-@lru_cache
-def _cached_np_array_load(path: FilePath):
+async def amodel_agnostic_load(
+    output_directory: DirectoryPath,
+    object_id: str,
+    models: Iterable[type[NumpyModel]],
+    not_found_error: bool = False,
+    **load_kwargs,
+) -> Optional[NumpyModel]:
     """
-    Store the loaded numpy object within LRU cache in case we need it several times
+    Async version of model_agnostic_load, the matching model is loaded with NumpyModel.aload
 
     Parameters
     ----------
-    path: FilePath
-        Path to the numpy file
+    output_directory: DirectoryPath
+        The root directory where all model instances of interest are stored
+    object_id: String
+        The ID of the model instance
+    models: Iterable[type[NumpyModel]]
+        All NumpyModel instances of interest, note that they should have differing names
+    not_found_error: bool
+        If True, throw error when the respective model instance was not found
+    load_kwargs
+        Key-word arguments to pass to the aload function, e.g. executor
 
     Returns
     -------
-    Same as np.load
+    NumpyModel instance if found
     """
-    return np.load(path)
+    for model in models:
+        if model.model_directory_path(output_directory, object_id).exists():
+            return await model.aload(output_directory, object_id, **load_kwargs)
+
+    if not_found_error:
+        raise FileNotFoundError(
+            f"Could not find NumpyModel with {object_id} in {output_directory}."
+            f"Tried from following classes:\n{', '.join(model.__name__ for model in models)}"
+        )
+
+    return None
 
 
-def _compare_np_array_dicts(
-    dict_a: dict[str, npt.NDArray], dict_b: dict[str, npt.NDArray], rtol: float = 1e-05, atol: float = 1e-08
-) -> bool:
+class NumpyModelIndex:
     """
-    Compare two dictionaries containing numpy arrays as values.
+    Map object ID to model class for the NumpyModel dumps in a directory, for O(1) lookups instead of probing the file
+    system for every candidate model like model_agnostic_load does
+
+    The directory is scanned once on creation. refresh() only rescans when the modification time of the directory has
+    changed, and only parses the entries that were added. A lookup that misses refreshes the index before giving up.
+    """
+
+    def __init__(self, output_directory: DirectoryPath, models: Iterable[type[NumpyModel]]):
+        """
+        Parameters
+        ----------
+        output_directory: DirectoryPath
+            The root directory where all model instances of interest are stored
+        models: Iterable[type[NumpyModel]]
+            All NumpyModel classes of interest; if an object ID was dumped by several of them, the first one wins, as
+            with model_agnostic_load
+        """
+        self.output_directory = TypeAdapter(DirectoryPath).validate_python(output_directory)
+        self.models = tuple(models)
+
+        self._model_priority = {model: priority for priority, model in reversed(list(enumerate(self.models)))}
+        self._directory_name_key_to_model = {(model.__name__, model._directory_suffix): model for model in self.models}
+        self._directory_suffixes = {model._directory_suffix for model in self.models}
+
+        self._directory_name_to_entry: dict[str, tuple[str, type[NumpyModel]]] = {}
+        self._object_id_to_models: dict[str, list[type[NumpyModel]]] = {}
+        self._scanned_mtime_ns: Optional[int] = None
+        self.refresh()
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Bring the index up to date with the directory
+
+        Parameters
+        ----------
+        force: bool
+            Rescan even if the modification time of the directory has not changed, e.g. for file systems with a
+            coarse modification time
+        """
+        mtime_ns = self.output_directory.stat().st_mtime_ns
+        if not force and mtime_ns == self._scanned_mtime_ns:
+            return
+
+        with os.scandir(self.output_directory) as entries:
+            directory_names = {entry.name for entry in entries if entry.is_dir()}
+        self._scanned_mtime_ns = mtime_ns
+
+        for removed_directory_name in self._directory_name_to_entry.keys() - directory_names:
+            object_id, model = self._directory_name_to_entry.pop(removed_directory_name)
+            self._object_id_to_models[object_id].remove(model)
+            if not self._object_id_to_models[object_id]:
+                del self._object_id_to_models[object_id]
+
+        for added_directory_name in directory_names - self._directory_name_to_entry.keys():
+            if entry := self._parse_directory_name(added_directory_name):
+                self._directory_name_to_entry[added_directory_name] = entry
+                object_id, model = entry
+                object_models = self._object_id_to_models.setdefault(object_id, [])
+                object_models.append(model)
+                object_models.sort(key=self._model_priority.__getitem__)
+
+    def model_class(self, object_id: str) -> Optional[type[NumpyModel]]:
+        """
+        Look up the model class of an object ID
+
+        Parameters
+        ----------
+        object_id: String
+            The ID of the model instance
+
+        Returns
+        -------
+        The model class the instance was dumped with, None if it is not in the directory
+        """
+        if object_id not in self._object_id_to_models:
+            self.refresh()
+        if object_models := self._object_id_to_models.get(object_id):
+            return object_models[0]
+        return None
+
+    def model_classes(self, object_ids: Iterable[str]) -> list[Optional[type[NumpyModel]]]:
+        """
+        Look up the model classes of many object IDs, see model_class
+
+        Parameters
+        ----------
+        object_ids: Iterable[str]
+
+        Returns
+        -------
+        list[type[NumpyModel] | None]
+        """
+        return [self.model_class(object_id) for object_id in object_ids]
+
+    def load(self, object_id: str, not_found_error: bool = False, **load_kwargs) -> Optional[NumpyModel]:
+        """
+        Load an instance with the model class it was dumped with, see model_agnostic_load
+
+        Parameters
+        ----------
+        object_id: String
+            The ID of the model instance
+        not_found_error: bool
+            If True, throw error when the respective model instance was not found
+        load_kwargs
+            Key-word arguments to pass to the load function
+
+        Returns
+        -------
+        NumpyModel instance if found
+        """
+        if model := self.model_class(object_id):
+            return model.load(self.output_directory, object_id, **load_kwargs)
+
+        if not_found_error:
+            raise FileNotFoundError(
+                f"Could not find NumpyModel with {object_id} in {self.output_directory}."
+                f"Tried from following classes:\n{', '.join(model.__name__ for model in self.models)}"
+            )
+        return None
+
+    def load_many(self, object_ids: Iterable[str], **load_many_kwargs) -> list[Union[NumpyModel, Exception]]:
+        """
+        Load many instances, each with the model class it was dumped with, see NumpyModel.load_many
+
+        Parameters
+        ----------
+        object_ids: Iterable[str]
+            The IDs of the model instances
+        load_many_kwargs
+            Key-word arguments to pass to NumpyModel.load_many, e.g. workers
+
+        Returns
+        -------
+        The loaded instances in the order of object_ids; an exception in place of instances that failed to load, a
+        FileNotFoundError for object IDs that are not in the directory
+        """
+        object_ids = list(object_ids)
+        model_to_positions: dict[type[NumpyModel], list[int]] = {}
+        results: list[Union[NumpyModel, Exception]] = [
+            FileNotFoundError(f"Could not find NumpyModel with {object_id} in {self.output_directory}")
+            for object_id in object_ids
+        ]
+        for position, model in enumerate(self.model_classes(object_ids)):
+            if model:
+                model_to_positions.setdefault(model, []).append(position)
+
+        for model, positions in model_to_positions.items():
+            loaded = model.load_many(
+                self.output_directory, [object_ids[position] for position in positions], **load_many_kwargs
+            )
+            for position, result in zip(positions, loaded):
+                results[position] = result
+        return results
+
+    def __contains__(self, object_id: str) -> bool:
+        return self.model_class(object_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._object_id_to_models))
 
-    Parameters:
-    dict_a, dict_b: dictionaries to compare. They should have same keys.
-    rtol, atol: relative and absolute tolerances for np.isclose()
+    def __len__(self) -> int:
+        return len(self._object_id_to_models)
 
-    Returns:
-    Boolean value for each key, True if corresponding arrays are close, else False.
+    def _parse_directory_name(self, directory_name: str) -> Optional[tuple[str, type[NumpyModel]]]:
+        for directory_suffix in self._directory_suffixes:
+            if directory_name.endswith(directory_suffix):
+                object_id, _, class_name = directory_name.removesuffix(directory_suffix).rpartition(".")
+                if object_id and (model := self._directory_name_key_to_model.get((class_name, directory_suffix))):
+                    return object_id, model
+        return None
+
+
+@dataclass(frozen=True)
+class _DumpState:
+    """Where an instance was last loaded from or dumped to, and its field values at that time"""
+
+    location: Path
+    field_values: dict[str, Any]
+    changed_fields: frozenset[str] = frozenset()
+
+    @classmethod
+    def of(cls, model: NumpyModel, dump_directory_path: Path) -> "_DumpState":
+        return cls(
+            location=dump_directory_path.resolve(),
+            field_values={field_name: model.__dict__.get(field_name) for field_name in type(model).model_fields},
+        )
+
+    def with_changed_fields(self, field_names: Iterable[str]) -> "_DumpState":
+        return _DumpState(self.location, self.field_values, self.changed_fields | frozenset(field_names))
+
+
+def _fields_differing_from_manifest(
+    manifest: ArrayManifest, ndarray_key_to_array: dict[str, Union[npt.NDArray, LazyNumpyArray]]
+) -> frozenset[str]:
+    """Fields with arrays that are missing from the manifest, or stored there with another shape or dtype"""
+    return frozenset(
+        _array_key_field(array_key)
+        for array_key in manifest.arrays.keys() | ndarray_key_to_array.keys()
+        if (info := manifest.arrays.get(array_key)) is None
+        or (array := ndarray_key_to_array.get(array_key)) is None
+        or info.shape != array.shape
+        or info.dtype != array.dtype
+    )
+
+
+def _load_lazy_arrays(value: Any) -> Any:
+    """Replace the LazyNumpyArray items of value, and of the lists, tuples and dicts in it, by their loaded arrays"""
+    if isinstance(value, LazyNumpyArray):
+        return value.load()
+    if type(value) in (list, tuple):
+        return type(value)(map(_load_lazy_arrays, value))
+    if isinstance(value, dict):
+        return {key: _load_lazy_arrays(item) for key, item in value.items()}
+    return value
+
+
+def _comparable_private_attributes(model: BaseModel) -> Optional[dict[str, Any]]:
+    if (private_attributes := getattr(model, "__pydantic_private__", None)) is None:
+        return None
+    return {name: value for name, value in private_attributes.items() if not name.startswith("_pdnp_")}
+
+
+def _yaml() -> YAML:
+    # YAML instances keep state while dumping or loading, so every thread gets its own
+    if (yaml := getattr(_thread_local, "yaml", None)) is None:
+        yaml = _thread_local.yaml = YAML()
+    return yaml
+
+
+def _map_batches(
+    run_batch: Callable[[list[Any]], list[Any]], items: list[Any], workers: Optional[int], pool: BulkPool
+) -> list[Any]:
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(items) <= 1:
+        return run_batch(items)
+
+    batch_size = -(-len(items) // (workers * _BATCHES_PER_WORKER))
+    batches = [items[start : start + batch_size] for start in range(0, len(items), batch_size)]
+    executor_class = ProcessPoolExecutor if pool == "process" else ThreadPoolExecutor
+    with executor_class(max_workers=min(workers, len(batches))) as executor:
+        futures = [executor.submit(run_batch, batch) for batch in batches]
+
+        results: list[Any] = []
+        for batch, future in zip(batches, futures):
+            try:
+                results.extend(future.result())
+            except _BULK_ERRORS as error:
+                results.extend([error] * len(batch))
+        return results
+
+
+def _dump_batch(
+    output_directory: Path, dump_kwargs: dict[str, Any], items: list[tuple[str, NumpyModel]]
+) -> list[Union[Path, Exception]]:
+    results: list[Union[Path, Exception]] = []
+    for object_id, model in items:
+        try:
+            results.append(model.dump(output_directory, object_id, **dump_kwargs))
+        except _BULK_ERRORS as error:
+            results.append(error)
+    return results
+
+
+def _load_batch(
+    model_class: type[NumpyModel], output_directory: Path, load_kwargs: dict[str, Any], object_ids: list[str]
+) -> list[Union[NumpyModel, Exception]]:
+    results: list[Union[NumpyModel, Exception]] = []
+    for object_id in object_ids:
+        try:
+            results.append(model_class.load(output_directory, object_id, **load_kwargs))
+        except _BULK_ERRORS as error:
+            results.append(error)
+    return results
+
+
+def _streaming_json_encoder(field_info: FieldInfo) -> Optional[Callable[[npt.ArrayLike, int, str], Iterator[bytes]]]:
+    encoder = None
+    for metadata in field_info.metadata:
+        if isinstance(metadata, (PlainSerializer, WrapSerializer)):
+            # Applied over the array annotation, the array is not serialized by it
+            return None
+        if serializer := getattr(metadata, "serialize_numpy_array_to_json", None):
+            encoder = streaming_json_encoders.get(serializer)
+    return encoder
+
+
+def _model_dump_items(model: BaseModel) -> Iterator[tuple[str, Any]]:
+    """
+    The items of model.model_dump() without copying the field values, nested models are returned as they are
+
+    Excluded fields are left out. Only the fields with a serializer that applies in python mode, computed fields, and
+    models with a model_serializer go through model_dump.
     """
+    model_class = type(model)
+    decorators = model_class.__pydantic_decorators__
+    if decorators.model_serializers:
+        yield from model.model_dump().items()
+        return
+
+    custom_serialized_field_names = {
+        field_name
+        for decorator in decorators.field_serializers.values()
+        if decorator.info.when_used not in _JSON_ONLY_WHEN_USED
+        for field_name in decorator.info.fields
+    }
+    dumped_field_names = set(model_class.__pydantic_computed_fields__)
+    for field_name, field_info in model_class.model_fields.items():
+        if field_info.exclude:
+            continue
+        if custom_serialized_field_names & {field_name, "*"} or any(
+            isinstance(metadata, (PlainSerializer, WrapSerializer)) and metadata.when_used not in _JSON_ONLY_WHEN_USED
+            for metadata in field_info.metadata
+        ):
+            dumped_field_names.add(field_name)
+        else:
+            yield field_name, getattr(model, field_name)
+
+    yield from (model.__pydantic_extra__ or {}).items()
+    if dumped_field_names:
+        yield from model.model_dump(include=dumped_field_names).items()
+
+
+def _array_key_field(array_key: str) -> str:
+    """The field of an array key of a dump, arrays nested in a field are keyed by their path, e.g. child.weights"""
+    return array_key.partition(".")[0]
+
+
+def _split_arrays(
+    value: Any, path: str, ndarray_key_to_array: dict[str, Union[npt.NDArray, LazyNumpyArray]], load_lazy: bool
+) -> Any:
+    """Move the arrays in value to ndarray_key_to_array under their path, return what remains of value"""
+    if isinstance(value, np.ndarray):
+        ndarray_key_to_array[path] = value
+        return None
+    if isinstance(value, LazyNumpyArray):
+        ndarray_key_to_array[path] = value.load() if load_lazy else value
+        return None
+
+    if isinstance(value, BaseModel):
+        return {
+            name: _split_arrays(item, f"{path}.{name}", ndarray_key_to_array, load_lazy)
+            for name, item in _model_dump_items(value)
+        }
+
+    array_count = len(ndarray_key_to_array)
+    if isinstance(value, dict) and all(isinstance(key, str) and "." not in key for key in value):
+        split_value: Any = {
+            key: _split_arrays(item, f"{path}.{key}", ndarray_key_to_array, load_lazy) for key, item in value.items()
+        }
+    elif type(value) in (list, tuple):
+        # Lists, so that the arrays can be put back in place on load
+        split_value = [
+            _split_arrays(item, f"{path}.{index}", ndarray_key_to_array, load_lazy) for index, item in enumerate(value)
+        ]
+    else:
+        return value
+    return split_value if len(ndarray_key_to_array) > array_count else value
+
+
+def _insert_nested_arrays(field_to_value: dict[str, Any]) -> dict[str, Any]:
+    """Inverse of _split_arrays, put the arrays keyed by a path back into the loaded field values"""
+    if not (nested_array_keys := [array_key for array_key in field_to_value if "." in array_key]):
+        return field_to_value
 
-    keys1 = frozenset(dict_a.keys())
-    keys2 = frozenset(dict_b.keys())
+    field_to_value = dict(field_to_value)
+    for array_key in nested_array_keys:
+        array = field_to_value.pop(array_key)
+        field_name, *path, leaf = array_key.split(".")
+        node = field_to_value.setdefault(field_name, {})
+        for part in path:
+            node = node[int(part)] if isinstance(node, list) else node.setdefault(part, {})
+        node[int(leaf) if isinstance(node, list) else leaf] = array
+    return field_to_value
 
-    if keys1 != keys2:
-        return False
 
-    for key in keys1:
-        arr_a = dict_a[key]
-        arr_b = dict_b[key]
+def _update_fingerprint(digest: "hashlib.blake2b", value: Any) -> None:
+    if isinstance(value, (np.ndarray, LazyNumpyArray)):
+        array = np.asarray(value)
+        if array.dtype.hasobject:
+            digest.update(to_json([str(array.dtype), array.shape, array.tolist()], serialize_unknown=True))
+            return
 
-        if arr_a.shape != arr_b.shape or not np_general_all_close(arr_a, arr_b, rtol, atol):
+        digest.update(f"{npy_format.dtype_to_descr(array.dtype)}{array.shape}".encode())
+        for block in iter_c_contiguous_blocks(array, _FINGERPRINT_BLOCK_BYTES // max(array.itemsize, 1)):
+            if array.dtype.kind in "fc":
+                block = block + 0.0  # -0.0 becomes 0.0
+            digest.update(block.reshape(-1).view(np.uint8).data)
+    elif isinstance(value, NumpyModel):
+        digest.update(value.fingerprint().encode())
+    elif isinstance(value, BaseModel):
+        digest.update(f"<{type(value).__qualname__}".encode())
+        for field_name in type(value).model_fields:
+            digest.update(field_name.encode())
+            _update_fingerprint(digest, getattr(value, field_name))
+        _update_fingerprint(digest, value.__pydantic_extra__)
+        digest.update(b">")
+    elif isinstance(value, dict):
+        # Ordered by item digest, equal dicts may have been filled in a different order
+        digest.update(b"{")
+        for item_digest in sorted(_fingerprint_digest(key, item) for key, item in value.items()):
+            digest.update(item_digest)
+        digest.update(b"}")
+    elif isinstance(value, (set, frozenset)):
+        digest.update(b"{{")
+        for item_digest in sorted(_fingerprint_digest(item) for item in value):
+            digest.update(item_digest)
+        digest.update(b"}}")
+    elif isinstance(value, float) and value.is_integer():
+        # Like hash, integral floats equal their int; this also maps -0.0 to 0
+        _update_fingerprint(digest, int(value))
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"[" if isinstance(value, list) else b"(")
+        for item in value:
+            _update_fingerprint(digest, item)
+        digest.update(b"]")
+    else:
+        digest.update(to_json(value, serialize_unknown=True))
+        digest.update(b",")
+
+
+def _fingerprint_digest(*values: Any) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        _update_fingerprint(digest, value)
+    return digest.digest()
+
+
+def _values_equal(value_a: Any, value_b: Any, array_pairs: list[tuple[npt.NDArray, npt.NDArray]]) -> bool:
+    """Compare everything but array elements, the array pairs whose elements remain to be compared are appended"""
+    if value_a is value_b:
+        return True
+
+    a_is_array = isinstance(value_a, (np.ndarray, LazyNumpyArray))
+    if a_is_array or isinstance(value_b, (np.ndarray, LazyNumpyArray)):
+        if not (a_is_array and isinstance(value_b, (np.ndarray, LazyNumpyArray))):
+            return False
+        if value_a.shape != value_b.shape or value_a.dtype != value_b.dtype:
             return False
 
-    return True
+        array_a, array_b = np.asarray(value_a), np.asarray(value_b)
+        if not (
+            array_a.__array_interface__["data"][0] == array_b.__array_interface__["data"][0]
+            and array_a.strides == array_b.strides
+        ):
+            array_pairs.append((array_a, array_b))
+        return True
+
+    if isinstance(value_a, dict) and isinstance(value_b, dict):
+        return value_a.keys() == value_b.keys() and all(
+            _values_equal(value_a[key], value_b[key], array_pairs) for key in value_a
+        )
+    if isinstance(value_a, (list, tuple)) and isinstance(value_b, (list, tuple)):
+        return (
+            type(value_a) is type(value_b)
+            and len(value_a) == len(value_b)
+            and all(_values_equal(item_a, item_b, array_pairs) for item_a, item_b in zip(value_a, value_b))
+        )
+    if isinstance(value_a, BaseModel) and not isinstance(value_a, NumpyModel) and isinstance(value_b, BaseModel):
+        # Other pydantic models may hold arrays too, whose truth value BaseModel.__eq__ can not take
+        return (
+            type(value_a) is type(value_b)
+            and _values_equal(
+                _comparable_private_attributes(value_a), _comparable_private_attributes(value_b), array_pairs
+            )
+            and _values_equal(value_a.__pydantic_extra__, value_b.__pydantic_extra__, array_pairs)
+            and all(
+                _values_equal(getattr(value_a, field_name), getattr(value_b, field_name), array_pairs)
+                for field_name in type(value_a).model_fields
+            )
+        )
+    return bool(value_a == value_b)
 
 
-__all__ = ["NumpyModel", "MultiArrayNumpyFile", "model_agnostic_load"]
+__all__ = [
+    "NumpyModel",
+    "MultiArrayNumpyFile",
+    "LazyNumpyArray",
+    "LazyChunkedArray",
+    "model_agnostic_load",
+    "NumpyModelIndex",
+    "amodel_agnostic_load",
+]
@@ -1,8 +1,334 @@
-from pydantic_numpy.typing.i_dimensional import *
-from pydantic_numpy.typing.ii_dimensional import *
-from pydantic_numpy.typing.iii_dimensional import *
-from pydantic_numpy.typing.n_dimensional import *
-from pydantic_numpy.typing.strict_data_type.i_dimensional import *
-from pydantic_numpy.typing.strict_data_type.ii_dimensional import *
-from pydantic_numpy.typing.strict_data_type.iii_dimensional import *
-from pydantic_numpy.typing.strict_data_type.n_dimensional import *
+"""
+Array type hints; the module that defines a type hint is imported on first access, see typegen/generate_typing.py
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from pydantic_numpy.typing.i_dimensional import *
+    from pydantic_numpy.typing.ii_dimensional import *
+    from pydantic_numpy.typing.iii_dimensional import *
+    from pydantic_numpy.typing.n_dimensional import *
+    from pydantic_numpy.typing.strict_data_type.i_dimensional import *
+    from pydantic_numpy.typing.strict_data_type.ii_dimensional import *
+    from pydantic_numpy.typing.strict_data_type.iii_dimensional import *
+    from pydantic_numpy.typing.strict_data_type.n_dimensional import *
+
+_NAME_TO_MODULE: Final[dict[str, str]] = {
+    "NpNDArray": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayInt64": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayInt32": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayInt16": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayInt8": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayUint64": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayUint32": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayUint16": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayUint8": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayFpLongDouble": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayFp64": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayFp32": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayFp16": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayComplexLongDouble": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayComplex128": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayComplex64": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayBool": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayDatetime64": "pydantic_numpy.typing.n_dimensional",
+    "NpNDArrayTimedelta64": "pydantic_numpy.typing.n_dimensional",
+    "Np1DArray": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayInt64": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayInt32": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayInt16": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayInt8": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayUint64": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayUint32": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayUint16": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayUint8": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayFpLongDouble": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayFp64": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayFp32": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayFp16": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayComplexLongDouble": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayComplex128": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayComplex64": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayBool": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayDatetime64": "pydantic_numpy.typing.i_dimensional",
+    "Np1DArrayTimedelta64": "pydantic_numpy.typing.i_dimensional",
+    "Np2DArray": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayInt64": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayInt32": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayInt16": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayInt8": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayUint64": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayUint32": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayUint16": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayUint8": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayFpLongDouble": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayFp64": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayFp32": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayFp16": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayComplexLongDouble": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayComplex128": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayComplex64": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayBool": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayDatetime64": "pydantic_numpy.typing.ii_dimensional",
+    "Np2DArrayTimedelta64": "pydantic_numpy.typing.ii_dimensional",
+    "Np3DArray": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayInt64": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayInt32": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayInt16": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayInt8": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayUint64": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayUint32": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayUint16": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayUint8": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayFpLongDouble": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayFp64": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayFp32": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayFp16": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayComplexLongDouble": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayComplex128": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayComplex64": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayBool": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayDatetime64": "pydantic_numpy.typing.iii_dimensional",
+    "Np3DArrayTimedelta64": "pydantic_numpy.typing.iii_dimensional",
+    "NpStrictNDArrayInt64": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayInt32": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayInt16": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayInt8": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayUint64": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayUint32": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayUint16": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayUint8": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayFpLongDouble": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayFp64": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayFp32": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayFp16": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayComplexLongDouble": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayComplex128": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayComplex64": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayBool": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayDatetime64": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrictNDArrayTimedelta64": "pydantic_numpy.typing.strict_data_type.n_dimensional",
+    "NpStrict1DArrayInt64": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayInt32": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayInt16": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayInt8": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayUint64": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayUint32": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayUint16": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayUint8": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayFpLongDouble": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayFp64": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayFp32": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayFp16": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayComplexLongDouble": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayComplex128": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayComplex64": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayBool": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayDatetime64": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict1DArrayTimedelta64": "pydantic_numpy.typing.strict_data_type.i_dimensional",
+    "NpStrict2DArrayInt64": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayInt32": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayInt16": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayInt8": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayUint64": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayUint32": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayUint16": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayUint8": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayFpLongDouble": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayFp64": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayFp32": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayFp16": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayComplexLongDouble": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayComplex128": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayComplex64": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayBool": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayDatetime64": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict2DArrayTimedelta64": "pydantic_numpy.typing.strict_data_type.ii_dimensional",
+    "NpStrict3DArrayInt64": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayInt32": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayInt16": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayInt8": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayUint64": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayUint32": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayUint16": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayUint8": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayFpLongDouble": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayFp64": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayFp32": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayFp16": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayComplexLongDouble": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayComplex128": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayComplex64": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayBool": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayDatetime64": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+    "NpStrict3DArrayTimedelta64": "pydantic_numpy.typing.strict_data_type.iii_dimensional",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = importlib.import_module(_NAME_TO_MODULE[name])
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    globals().update({type_name: getattr(module, type_name) for type_name in module.__all__})
+    return globals()[name]
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_NAME_TO_MODULE})
+
+
+__all__ = [
+    "NpNDArray",
+    "NpNDArrayInt64",
+    "NpNDArrayInt32",
+    "NpNDArrayInt16",
+    "NpNDArrayInt8",
+    "NpNDArrayUint64",
+    "NpNDArrayUint32",
+    "NpNDArrayUint16",
+    "NpNDArrayUint8",
+    "NpNDArrayFpLongDouble",
+    "NpNDArrayFp64",
+    "NpNDArrayFp32",
+    "NpNDArrayFp16",
+    "NpNDArrayComplexLongDouble",
+    "NpNDArrayComplex128",
+    "NpNDArrayComplex64",
+    "NpNDArrayBool",
+    "NpNDArrayDatetime64",
+    "NpNDArrayTimedelta64",
+    "Np1DArray",
+    "Np1DArrayInt64",
+    "Np1DArrayInt32",
+    "Np1DArrayInt16",
+    "Np1DArrayInt8",
+    "Np1DArrayUint64",
+    "Np1DArrayUint32",
+    "Np1DArrayUint16",
+    "Np1DArrayUint8",
+    "Np1DArrayFpLongDouble",
+    "Np1DArrayFp64",
+    "Np1DArrayFp32",
+    "Np1DArrayFp16",
+    "Np1DArrayComplexLongDouble",
+    "Np1DArrayComplex128",
+    "Np1DArrayComplex64",
+    "Np1DArrayBool",
+    "Np1DArrayDatetime64",
+    "Np1DArrayTimedelta64",
+    "Np2DArray",
+    "Np2DArrayInt64",
+    "Np2DArrayInt32",
+    "Np2DArrayInt16",
+    "Np2DArrayInt8",
+    "Np2DArrayUint64",
+    "Np2DArrayUint32",
+    "Np2DArrayUint16",
+    "Np2DArrayUint8",
+    "Np2DArrayFpLongDouble",
+    "Np2DArrayFp64",
+    "Np2DArrayFp32",
+    "Np2DArrayFp16",
+    "Np2DArrayComplexLongDouble",
+    "Np2DArrayComplex128",
+    "Np2DArrayComplex64",
+    "Np2DArrayBool",
+    "Np2DArrayDatetime64",
+    "Np2DArrayTimedelta64",
+    "Np3DArray",
+    "Np3DArrayInt64",
+    "Np3DArrayInt32",
+    "Np3DArrayInt16",
+    "Np3DArrayInt8",
+    "Np3DArrayUint64",
+    "Np3DArrayUint32",
+    "Np3DArrayUint16",
+    "Np3DArrayUint8",
+    "Np3DArrayFpLongDouble",
+    "Np3DArrayFp64",
+    "Np3DArrayFp32",
+    "Np3DArrayFp16",
+    "Np3DArrayComplexLongDouble",
+    "Np3DArrayComplex128",
+    "Np3DArrayComplex64",
+    "Np3DArrayBool",
+    "Np3DArrayDatetime64",
+    "Np3DArrayTimedelta64",
+    "NpStrictNDArrayInt64",
+    "NpStrictNDArrayInt32",
+    "NpStrictNDArrayInt16",
+    "NpStrictNDArrayInt8",
+    "NpStrictNDArrayUint64",
+    "NpStrictNDArrayUint32",
+    "NpStrictNDArrayUint16",
+    "NpStrictNDArrayUint8",
+    "NpStrictNDArrayFpLongDouble",
+    "NpStrictNDArrayFp64",
+    "NpStrictNDArrayFp32",
+    "NpStrictNDArrayFp16",
+    "NpStrictNDArrayComplexLongDouble",
+    "NpStrictNDArrayComplex128",
+    "NpStrictNDArrayComplex64",
+    "NpStrictNDArrayBool",
+    "NpStrictNDArrayDatetime64",
+    "NpStrictNDArrayTimedelta64",
+    "NpStrict1DArrayInt64",
+    "NpStrict1DArrayInt32",
+    "NpStrict1DArrayInt16",
+    "NpStrict1DArrayInt8",
+    "NpStrict1DArrayUint64",
+    "NpStrict1DArrayUint32",
+    "NpStrict1DArrayUint16",
+    "NpStrict1DArrayUint8",
+    "NpStrict1DArrayFpLongDouble",
+    "NpStrict1DArrayFp64",
+    "NpStrict1DArrayFp32",
+    "NpStrict1DArrayFp16",
+    "NpStrict1DArrayComplexLongDouble",
+    "NpStrict1DArrayComplex128",
+    "NpStrict1DArrayComplex64",
+    "NpStrict1DArrayBool",
+    "NpStrict1DArrayDatetime64",
+    "NpStrict1DArrayTimedelta64",
+    "NpStrict2DArrayInt64",
+    "NpStrict2DArrayInt32",
+    "NpStrict2DArrayInt16",
+    "NpStrict2DArrayInt8",
+    "NpStrict2DArrayUint64",
+    "NpStrict2DArrayUint32",
+    "NpStrict2DArrayUint16",
+    "NpStrict2DArrayUint8",
+    "NpStrict2DArrayFpLongDouble",
+    "NpStrict2DArrayFp64",
+    "NpStrict2DArrayFp32",
+    "NpStrict2DArrayFp16",
+    "NpStrict2DArrayComplexLongDouble",
+    "NpStrict2DArrayComplex128",
+    "NpStrict2DArrayComplex64",
+    "NpStrict2DArrayBool",
+    "NpStrict2DArrayDatetime64",
+    "NpStrict2DArrayTimedelta64",
+    "NpStrict3DArrayInt64",
+    "NpStrict3DArrayInt32",
+    "NpStrict3DArrayInt16",
+    "NpStrict3DArrayInt8",
+    "NpStrict3DArrayUint64",
+    "NpStrict3DArrayUint32",
+    "NpStrict3DArrayUint16",
+    "NpStrict3DArrayUint8",
+    "NpStrict3DArrayFpLongDouble",
+    "NpStrict3DArrayFp64",
+    "NpStrict3DArrayFp32",
+    "NpStrict3DArrayFp16",
+    "NpStrict3DArrayComplexLongDouble",
+    "NpStrict3DArrayComplex128",
+    "NpStrict3DArrayComplex64",
+    "NpStrict3DArrayBool",
+    "NpStrict3DArrayDatetime64",
+    "NpStrict3DArrayTimedelta64",
+]
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 import numpy as np
 import numpy.typing as npt
 from numpy._core._exceptions import UFuncTypeError
@@ -24,6 +26,37 @@ def np_general_all_close(arr_a: npt.NDArray, arr_b: npt.NDArray, rtol: float = 1
     return _np_general_all_close(arr_a, arr_b, rtol, atol)
 
 
+def iter_c_contiguous_blocks(array: npt.NDArray, max_elements: int) -> Iterator[npt.NDArray]:
+    """
+    Iterate over an array in C order, in C-contiguous blocks of at most max_elements elements
+
+    Non-contiguous arrays are never copied as a whole, only one block at a time. Rows larger than max_elements are
+    split recursively along their own leading axis.
+
+    Parameters
+    ----------
+    array: npt.NDArray
+    max_elements: int
+        Upper bound for the number of elements in a block, rows of a 1D array are never split
+
+    Returns
+    -------
+    Iterator over C-contiguous blocks, their concatenation in C order equals the array
+    """
+    if array.ndim == 0 or array.size <= max_elements:
+        yield np.ascontiguousarray(array)
+        return
+
+    row_size = array.size // array.shape[0]
+    if row_size > max_elements and array.ndim > 1:
+        for row in array:
+            yield from iter_c_contiguous_blocks(row, max_elements)
+    else:
+        rows_per_block = max(max_elements // max(row_size, 1), 1)
+        for start in range(0, array.shape[0], rows_per_block):
+            yield np.ascontiguousarray(array[start : start + rows_per_block])
+
+
 if Version.parse(np.version.version) < Version.parse("1.25.0"):
 
     def _np_general_all_close(arr_a: npt.NDArray, arr_b: npt.NDArray, rtol: float = 1e-05, atol: float = 1e-08) -> bool:
@@ -1,7 +1,30 @@
+from typing import Annotated
+
+import numpy as np
+from typing_extensions import TypeAlias
+
 from pydantic_numpy import NpNDArray
+from pydantic_numpy.helper.annotation import (
+    NpArrayPydanticAnnotation,
+    pd_np_native_numpy_array_json_schema_from_base64_type_data,
+)
+from pydantic_numpy.helper.serialization import (
+    pd_np_native_numpy_array_to_base64_data_dict_serializer,
+)
 from pydantic_numpy.model import NumpyModel
 from pydantic_numpy.typing import Np1DArray
 
+Np2DArrayFp32Base64: TypeAlias = Annotated[
+    np.ndarray[tuple[int, int], np.dtype[np.float32]],
+    NpArrayPydanticAnnotation.factory(
+        data_type=np.float32,
+        dimensions=2,
+        strict_data_typing=False,
+        serialize_numpy_array_to_json=pd_np_native_numpy_array_to_base64_data_dict_serializer,
+        json_schema_from_type_data=pd_np_native_numpy_array_json_schema_from_base64_type_data,
+    ),
+]
+
 
 class NpNDArrayModel(NumpyModel):
     array: NpNDArray
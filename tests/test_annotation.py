@@ -2,10 +2,20 @@ from typing import Annotated, Any
 
 import numpy as np
 import orjson
-from pydantic import BaseModel
+import pytest
+from pydantic import BaseModel, ValidationError
 from typing_extensions import TypeAlias
 
-from pydantic_numpy.helper.annotation import NpArrayPydanticAnnotation
+from pydantic_numpy.helper.annotation import (
+    NpArrayPydanticAnnotation,
+    np_array_pydantic_annotated_typing,
+    pd_np_native_numpy_array_json_schema_from_base64_type_data,
+)
+from pydantic_numpy.helper.serialization import (
+    pd_np_native_numpy_array_to_base64_data_dict_serializer,
+)
+from pydantic_numpy.typing import NpNDArray
+from tests.model import Np2DArrayFp32Base64
 
 
 def test_custom_serializer():
@@ -29,3 +39,92 @@ def test_custom_serializer():
     assert "arr" in model_dict
     assert isinstance(model_dict["arr"], list)
     assert len(model_dict["arr"]) == 42
+
+
+class Base64Model(BaseModel):
+    arr: Np2DArrayFp32Base64
+
+
+def test_annotated_typing_base64_json_schema():
+    class AnnotatedBase64Model(BaseModel):
+        arr: np_array_pydantic_annotated_typing(
+            np.float32,
+            2,
+            serialize_numpy_array_to_json=pd_np_native_numpy_array_to_base64_data_dict_serializer,
+            json_schema_from_type_data=pd_np_native_numpy_array_json_schema_from_base64_type_data,
+        )
+
+    field_schema = AnnotatedBase64Model.model_json_schema(mode="serialization")["properties"]["arr"]
+    assert field_schema == Base64Model.model_json_schema(mode="serialization")["properties"]["arr"]
+    assert {"encoding", "shape"} <= set(field_schema["properties"])
+
+
+def test_base64_serializer_envelope():
+    model_dict = orjson.loads(Base64Model(arr=np.ones((2, 3))).model_dump_json())
+
+    assert model_dict["arr"]["encoding"] == "base64"
+    assert model_dict["arr"]["shape"] == [2, 3]
+    assert np.dtype(model_dict["arr"]["data_type"]) == np.float32
+    assert isinstance(model_dict["arr"]["data"], str)
+
+
+def test_base64_round_trip_non_contiguous():
+    array = np.arange(12, dtype=np.float32).reshape(3, 4).T
+    model = Base64Model(arr=array)
+    json_str = model.model_dump_json()
+
+    from_json = Base64Model.model_validate_json(json_str).arr
+    from_dict = Base64Model(arr=orjson.loads(json_str)["arr"]).arr
+
+    for round_trip_result in (from_json, from_dict):
+        assert round_trip_result.dtype == np.float32
+        assert round_trip_result.flags.writeable
+        np.testing.assert_array_equal(round_trip_result, array)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.array([1, 2, 3], dtype=np.int16),
+        np.array([[True, False]]),
+        np.array(["2020-01-01", "2021-06-01"], dtype="datetime64[ns]"),
+        np.array([1 + 2j], dtype=np.complex64),
+    ],
+)
+def test_base64_deserialize_preserves_dtype(array: np.ndarray):
+    envelope = pd_np_native_numpy_array_to_base64_data_dict_serializer(array)
+
+    class AnyArrayModel(BaseModel):
+        arr: NpNDArray
+
+    round_trip_result = AnyArrayModel(arr=envelope).arr
+    assert round_trip_result.dtype == array.dtype
+    np.testing.assert_array_equal(round_trip_result, array)
+
+
+def test_base64_shape_mismatch():
+    envelope = pd_np_native_numpy_array_to_base64_data_dict_serializer(np.ones((2, 3), dtype=np.float32))
+    envelope["shape"] = [4, 3]
+
+    with pytest.raises(ValidationError):
+        Base64Model(arr=envelope)
+
+
+def test_factory_memoized():
+    annotation = NpArrayPydanticAnnotation.factory(data_type=np.float32, dimensions=2)
+
+    assert NpArrayPydanticAnnotation.factory(dimensions=2, data_type=np.float32) is annotation
+    assert NpArrayPydanticAnnotation.factory(data_type=np.float32, dimensions=2, lazy=True) is not annotation
+    assert np_array_pydantic_annotated_typing(np.float32, 2) is np_array_pydantic_annotated_typing(np.float32, 2)
+
+
+def test_core_schema_shared_between_fields():
+    array_type = np_array_pydantic_annotated_typing(np.float32, 2)
+
+    class TwoFieldModel(BaseModel):
+        a: array_type
+        b: array_type
+
+    model = TwoFieldModel(a=[[1.0]], b=np.ones((1, 1), dtype=np.float64))
+    assert model.b.dtype == np.float32
+    assert len(TwoFieldModel.__pydantic_core_schema__["definitions"]) == 1
@@ -0,0 +1,139 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pydantic import Field, ValidationError
+
+from pydantic_numpy.batch import NumpyModelBatch
+from pydantic_numpy.model import LazyNumpyArray, NumpyModel
+from pydantic_numpy.typing import Np1DArrayFp32, Np2DArrayInt64
+
+TEST_BATCH_OBJECT_ID = "test"
+
+
+class RecordModel(NumpyModel):
+    position: Np1DArrayFp32
+    grid: Np2DArrayInt64
+    weight: float
+    label: str = "label"
+
+
+RecordBatch = NumpyModelBatch[RecordModel]
+
+
+@pytest.fixture
+def records() -> list[RecordModel]:
+    return [
+        RecordModel(
+            position=np.full(3, index, dtype=np.float32),
+            grid=np.full((2, 2), index),
+            weight=index / 2,
+            label=f"record_{index}",
+        )
+        for index in range(5)
+    ]
+
+
+def test_batch_class() -> None:
+    assert NumpyModelBatch[RecordModel] is RecordBatch
+    assert RecordBatch.model_class is RecordModel
+    assert RecordBatch.__name__ == "RecordModelBatch"
+
+    with pytest.raises(TypeError, match="already a batch"):
+        RecordBatch[RecordModel]
+
+
+def test_batch_from_models(records: list[RecordModel]) -> None:
+    batch = RecordBatch.from_models(records)
+
+    assert len(batch) == 5
+    assert batch.position.shape == (5, 3) and batch.position.dtype == np.float32
+    assert batch.grid.shape == (5, 2, 2)
+    assert batch.weight.dtype == np.float64
+    assert batch.label == [record.label for record in records]
+
+    assert batch[2] == records[2]
+    assert isinstance(batch[2].weight, float)
+    assert list(batch.iter_models()) == records
+
+    with pytest.raises(ValueError, match="at least one"):
+        RecordBatch.from_models([])
+
+
+def test_batch_validates_columns() -> None:
+    batch = RecordBatch(
+        position=np.zeros((4, 3), dtype=np.float64), grid=np.zeros((4, 2, 2)), weight=[1, 2, 3, 4], label=list("abcd")
+    )
+    assert batch.position.dtype == np.float32
+    assert batch.grid.dtype == np.int64
+
+    with pytest.raises(ValidationError):
+        RecordBatch(position=np.zeros(4), grid=np.zeros((4, 2, 2)), weight=np.ones(4), label=list("abcd"))
+
+    with pytest.raises(ValidationError, match="same length"):
+        RecordBatch(position=np.zeros((4, 3)), grid=np.zeros((3, 2, 2)), weight=np.ones(4), label=list("abcd"))
+
+
+def test_batch_slicing(records: list[RecordModel]) -> None:
+    batch = RecordBatch.from_models(records)
+
+    sliced = batch[1:3]
+    assert isinstance(sliced, RecordBatch)
+    assert np.shares_memory(sliced.position, batch.position)
+    assert list(sliced.iter_models()) == records[1:3]
+
+    selected = batch[np.array([4, 0])]
+    assert selected.label == ["record_4", "record_0"]
+    assert list(batch[batch.weight > 1].iter_models()) == records[3:]
+
+
+def test_io_batch(tmp_path: Path, records: list[RecordModel]) -> None:
+    batch = RecordBatch.from_models(records)
+    dump_directory_path = batch.dump(tmp_path, TEST_BATCH_OBJECT_ID)
+
+    assert [path.name for path in dump_directory_path.iterdir() if path.suffix == ".npz"] == ["arrays.npz"]
+    assert RecordBatch.load(tmp_path, TEST_BATCH_OBJECT_ID) == batch
+
+    lazy_batch = RecordBatch.load(tmp_path, TEST_BATCH_OBJECT_ID, exclude=["position", "grid", "weight"])
+    assert isinstance(lazy_batch.position, LazyNumpyArray)
+    assert lazy_batch[3] == records[3]
+
+
+class CountedModel(NumpyModel):
+    position: Np1DArrayFp32
+    count: int = Field(ge=0)
+    share: float = Field(gt=0, le=1)
+    active: bool = True
+
+
+CountedBatch = NumpyModelBatch[CountedModel]
+
+
+def test_batch_scalar_columns_validate_like_fields() -> None:
+    positions = np.zeros((3, 3))
+    batch = CountedBatch(position=positions, count=[0, 2.0, 5], share=[0.5, 1, 1e-3], active=[1, 0, True])
+    np.testing.assert_array_equal(batch.count, [0, 2, 5])
+    assert batch.count.dtype == np.int64 and batch.active.dtype == np.bool_
+    assert CountedModel.model_validate(batch[1].model_dump()) == batch[1]
+
+    for invalid_columns in (
+        {"count": [0, -1, 5]},
+        {"count": [0, 1.7, 5]},
+        {"share": np.array([0.5, 0.0, 1.0])},
+        {"share": [0.5, 1.5, 1.0]},
+        {"active": [0, 2, 1]},
+        {"count": np.zeros((3, 1), dtype=int)},
+    ):
+        with pytest.raises(ValidationError):
+            CountedBatch(**{"position": positions, "count": [0, 1, 2], "share": [1, 1, 1], **invalid_columns})
+
+
+def test_batch_subclass() -> None:
+    class LabelledBatch(NumpyModelBatch):
+        def labels(self) -> list[str]:
+            return self.label
+
+    labelled_batch_class = LabelledBatch[RecordModel]
+    assert labelled_batch_class is not RecordBatch and issubclass(labelled_batch_class, LabelledBatch)
+    assert LabelledBatch[RecordModel] is labelled_batch_class
+    assert NumpyModelBatch[RecordModel] is RecordBatch
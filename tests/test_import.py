@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+import pytest
+
+import pydantic_numpy
+import pydantic_numpy.typing
+
+
+def _imported_modules_after(statement: str) -> set[str]:
+    output = subprocess.check_output(
+        [sys.executable, "-c", f"import sys; {statement}; print(*sorted(sys.modules), sep=chr(10))"], text=True
+    )
+    return set(output.split())
+
+
+def test_typing_modules_imported_on_first_access():
+    modules = _imported_modules_after("import pydantic_numpy.typing")
+    assert not {module for module in modules if module.startswith("pydantic_numpy.typing.")}
+
+    modules = _imported_modules_after("from pydantic_numpy.typing import Np2DArrayFp32")
+    assert {module for module in modules if module.startswith("pydantic_numpy.typing.")} == {
+        "pydantic_numpy.typing.ii_dimensional"
+    }
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "from pydantic_numpy import NpNDArray",
+        "from pydantic_numpy import *; np_array_pydantic_annotated_typing, batch, model, typing",
+        "import pydantic_numpy; pydantic_numpy.NpNDArrayFp32; pydantic_numpy.typing",
+        "import pydantic_numpy; assert not hasattr(pydantic_numpy, 'NpUnknownArray')",
+    ],
+)
+def test_package_names_in_clean_interpreter(statement: str):
+    subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+def test_typing_name_table():
+    for name in pydantic_numpy.typing.__all__:
+        assert getattr(pydantic_numpy.typing, name) is getattr(
+            sys.modules[pydantic_numpy.typing._NAME_TO_MODULE[name]], name
+        )
+    assert set(pydantic_numpy.typing.__all__) <= set(dir(pydantic_numpy.typing))
+    assert pydantic_numpy.NpNDArrayFp32 is pydantic_numpy.typing.NpNDArrayFp32
+
+
+def test_unknown_typing_name():
+    for module in (pydantic_numpy, pydantic_numpy.typing):
+        with pytest.raises(AttributeError):
+            module.NpUnknownArray
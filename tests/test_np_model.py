@@ -1,17 +1,47 @@
+import asyncio
+import importlib.util
 import platform
+import shutil
+import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Annotated, Optional
 
 import numpy as np
 import pytest
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    SerializerFunctionWrapHandler,
+    ValidationError,
+    field_serializer,
+    model_serializer,
+)
 
-from pydantic_numpy.model import NumpyModel, model_agnostic_load
-from pydantic_numpy.typing import NpNDArray
+from pydantic_numpy.helper.io import array_checksum
+from pydantic_numpy.model import (
+    LazyChunkedArray,
+    LazyNumpyArray,
+    NumpyModel,
+    NumpyModelIndex,
+    amodel_agnostic_load,
+    model_agnostic_load,
+)
+from pydantic_numpy.typing import NpNDArray, NpNDArrayDatetime64
 from tests.model import (
+    Np2DArrayFp32Base64,
     NpNDArrayModelWithNonArray,
     NpNDArrayModelWithNonArrayWithArbitrary,
 )
 
+requires_zstandard = pytest.mark.skipif(
+    importlib.util.find_spec("zstandard") is None, reason="the zstd codec requires the zstd extra"
+)
+
 TEST_MODEL_OBJECT_ID = "test"
 OTHER_TEST_MODEL_OBJECT_ID = "other_test"
 NON_ARRAY_VALUE = 5
@@ -98,3 +128,789 @@ if platform.system() != "Windows":
         reread_data = numpy_model.model_validate_json(ser)
 
         assert numpy_model == reread_data
+
+
+class NestedStreamingModel(NumpyModel):
+    weights: Np2DArrayFp32Base64
+    non_array: int = NON_ARRAY_VALUE
+
+
+class StreamingModel(NumpyModel):
+    array: NpNDArray
+    timestamps: NpNDArrayDatetime64
+    nested: NestedStreamingModel
+    label: str = "label"
+
+
+@pytest.fixture
+def streaming_model() -> StreamingModel:
+    return StreamingModel(
+        array=np.arange(60.0).reshape(3, 4, 5).transpose(2, 0, 1),
+        timestamps=np.array(["2020-01-01", "2021-06-01"], dtype="datetime64[s]"),
+        nested=NestedStreamingModel(weights=np.array([[1.0, np.nan, np.inf]]).T),
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1000])
+def test_iter_model_dump_json_matches_model_dump_json(streaming_model: StreamingModel, chunk_size: int) -> None:
+    chunks = list(streaming_model.iter_model_dump_json(chunk_size=chunk_size))
+
+    assert b"".join(chunks) == streaming_model.model_dump_json().encode()
+    if chunk_size == 1:
+        assert len(chunks) > streaming_model.array.size
+
+
+class FieldSerializerStreamingModel(StreamingModel):
+    summed: Annotated[NpNDArray, PlainSerializer(lambda array: float(array.sum()), when_used="json")]
+
+    @field_serializer("array")
+    def serialize_array_shape(self, array: np.ndarray) -> list[int]:
+        return list(array.shape)
+
+
+class ModelSerializerStreamingModel(StreamingModel):
+    @model_serializer(mode="wrap")
+    def serialize_with_version(self, handler: SerializerFunctionWrapHandler) -> dict:
+        return {"version": 1, **handler(self)}
+
+
+@pytest.mark.parametrize("model_class", [FieldSerializerStreamingModel, ModelSerializerStreamingModel])
+def test_iter_model_dump_json_custom_serializers(streaming_model: StreamingModel, model_class: type) -> None:
+    model = model_class(**dict(streaming_model), summed=np.ones(3))
+
+    assert b"".join(model.iter_model_dump_json(chunk_size=2)) == model.model_dump_json().encode()
+
+
+def test_model_dump_json_stream(streaming_model: StreamingModel) -> None:
+    with tempfile.TemporaryFile() as fp:
+        streaming_model.model_dump_json_stream(fp, chunk_size=3)
+        fp.seek(0)
+
+        assert StreamingModel.model_validate_json(fp.read()).model_dump_json() == streaming_model.model_dump_json()
+
+
+def test_io_npy_layout_memory_mapped(numpy_model: NpNDArrayModelWithNonArray, tmp_path: Path) -> None:
+    dump_directory_path = numpy_model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy")
+    assert (dump_directory_path / "arrays" / "array.npy").exists()
+    assert not (dump_directory_path / "arrays.npz").exists()
+
+    loaded = NpNDArrayModelWithNonArray.load(tmp_path, TEST_MODEL_OBJECT_ID, mmap_mode="r")
+
+    assert isinstance(loaded.array, np.memmap)
+    assert loaded == numpy_model
+
+
+@pytest.mark.parametrize("codec", ["none", "zlib"])
+def test_io_redump_memory_mapped_model_in_place(tmp_path: Path, codec: str) -> None:
+    model = NpNDArrayModelWithNonArray(array=np.arange(100_000.0), non_array=NON_ARRAY_VALUE)
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy", codec=codec)
+
+    loaded = NpNDArrayModelWithNonArray.load(tmp_path, TEST_MODEL_OBJECT_ID, mmap_mode="r")
+    loaded.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy", codec=codec)
+
+    assert loaded == model
+    assert NpNDArrayModelWithNonArray.load(tmp_path, TEST_MODEL_OBJECT_ID) == model
+
+
+def test_io_layout_switch_removes_stale_arrays(numpy_model: NpNDArrayModelWithNonArray, tmp_path: Path) -> None:
+    numpy_model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy")
+    dump_directory_path = numpy_model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npz")
+
+    assert not (dump_directory_path / "arrays").exists()
+    assert NpNDArrayModelWithNonArray.load(tmp_path, TEST_MODEL_OBJECT_ID) == numpy_model
+
+
+class TwoArrayModel(NumpyModel):
+    array_a: NpNDArray
+    array_b: NpNDArray
+    non_array: int = NON_ARRAY_VALUE
+
+
+@pytest.mark.parametrize("layout", ["npz", "npy"])
+@pytest.mark.parametrize("load_kwargs", [{"fields": ["array_a", "non_array"]}, {"exclude": ["array_b"]}])
+def test_io_selective_load(tmp_path: Path, layout: str, load_kwargs: dict) -> None:
+    model = TwoArrayModel(array_a=np.arange(3), array_b=np.ones((2, 2)), non_array=7)
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout=layout)
+
+    loaded = TwoArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID, **load_kwargs)
+
+    assert isinstance(loaded.array_a, np.ndarray)
+    assert isinstance(loaded.array_b, LazyNumpyArray)
+    assert not loaded.array_b.is_loaded
+    assert loaded.array_b.shape == (2, 2)
+    assert loaded.non_array == 7
+
+    assert loaded == model
+    assert loaded.array_b.is_loaded
+    np.testing.assert_array_equal(loaded.array_b * 2 - 1, model.array_b * 2 - 1)
+    assert (loaded.array_b == model.array_b).all()
+
+
+def test_io_selective_load_unknown_field(tmp_path: Path) -> None:
+    TwoArrayModel(array_a=np.arange(3), array_b=np.ones(3)).dump(tmp_path, TEST_MODEL_OBJECT_ID)
+
+    with pytest.raises(ValueError, match="no fields array_c"):
+        TwoArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID, fields=["array_a", "array_c"])
+    with pytest.raises(ValueError, match="no fields array_c"):
+        asyncio.run(TwoArrayModel.aload(tmp_path, TEST_MODEL_OBJECT_ID, exclude=["array_c"]))
+
+
+def test_io_compressed_npy_layout_parallel(tmp_path: Path) -> None:
+    model = TwoArrayModel(array_a=np.arange(20_000).reshape(100, 200)[:, ::3], array_b=np.ones((2, 2), order="F"))
+    dump_directory_path = model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy", codec="zlib", workers=4)
+    assert sorted(path.name for path in (dump_directory_path / "arrays").iterdir()) == [
+        "array_a.npy.zlib",
+        "array_b.npy.zlib",
+    ]
+
+    loaded = TwoArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID, workers=4)
+    assert loaded == model
+
+    lazy_loaded = TwoArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID, exclude=["array_a"])
+    assert isinstance(lazy_loaded.array_a, LazyNumpyArray)
+    assert lazy_loaded.array_a.shape == (100, 67)
+    assert lazy_loaded == model
+
+
+def test_io_codec_switch_removes_stale_arrays(tmp_path: Path) -> None:
+    model = TwoArrayModel(array_a=np.arange(3), array_b=np.ones((2, 2)))
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy", codec="zlib")
+    dump_directory_path = model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy")
+
+    assert sorted(path.name for path in (dump_directory_path / "arrays").iterdir()) == ["array_a.npy", "array_b.npy"]
+    assert TwoArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID) == model
+
+
+@pytest.mark.parametrize(
+    "codec, suffix",
+    [("none", ""), ("zlib", ".zlib"), ("lz4", ".lz4"), pytest.param("zstd", ".zst", marks=requires_zstandard)],
+)
+def test_io_array_codecs(tmp_path: Path, codec: str, suffix: str) -> None:
+    model = TwoArrayModel(array_a=np.arange(30_000, dtype=np.int16).reshape(100, 300), array_b=np.array(1.5))
+    dump_directory_path = model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy", codec=codec)
+
+    assert (dump_directory_path / "arrays" / f"array_a.npy{suffix}").exists()
+    assert model_agnostic_load(tmp_path, TEST_MODEL_OBJECT_ID, models=[TwoArrayModel]) == model
+
+
+class PerFieldCodecModel(TwoArrayModel):
+    _dump_layout = "npy"
+    _dump_array_codec = "lz4"
+    _dump_field_array_codecs = {"array_b": "zstd"}
+
+
+@requires_zstandard
+def test_io_per_field_array_codecs(tmp_path: Path) -> None:
+    model = PerFieldCodecModel(array_a=np.arange(3), array_b=np.ones((2, 2)))
+
+    dump_directory_path = model.dump(tmp_path, TEST_MODEL_OBJECT_ID)
+    assert sorted(path.name for path in (dump_directory_path / "arrays").iterdir()) == [
+        "array_a.npy.lz4",
+        "array_b.npy.zst",
+    ]
+    assert PerFieldCodecModel.load(tmp_path, TEST_MODEL_OBJECT_ID) == model
+
+    dump_directory_path = model.dump(tmp_path, TEST_MODEL_OBJECT_ID, field_codecs={"array_a": "none"})
+    assert sorted(path.name for path in (dump_directory_path / "arrays").iterdir()) == [
+        "array_a.npy",
+        "array_b.npy.zst",
+    ]
+    assert PerFieldCodecModel.load(tmp_path, TEST_MODEL_OBJECT_ID) == model
+
+
+def test_io_codec_requires_npy_layout(tmp_path: Path) -> None:
+    model = TwoArrayModel(array_a=np.arange(3), array_b=np.ones((2, 2)))
+    with pytest.raises(ValueError, match="npy"):
+        model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npz", codec="zlib")
+    with pytest.raises(ValueError, match="array_b"):
+        model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npz", field_codecs={"array_b": "lz4"})
+
+
+def test_io_unknown_codec(tmp_path: Path) -> None:
+    model = TwoArrayModel(array_a=np.arange(3), array_b=np.ones((2, 2)))
+    with pytest.raises(ValueError, match="Unknown array codec"):
+        model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy", codec="brotli")
+
+
+class ChunkedModel(TwoArrayModel):
+    _dump_layout = "chunked"
+    _dump_chunk_bytes = 256
+
+
+@pytest.mark.parametrize("codec", ["none", pytest.param("zstd", marks=requires_zstandard)])
+def test_io_chunked_layout(tmp_path: Path, codec: str) -> None:
+    model = ChunkedModel(array_a=np.arange(1000, dtype=np.float64).reshape(40, 25), array_b=np.array(3))
+    dump_directory_path = model.dump(tmp_path, TEST_MODEL_OBJECT_ID, codec=codec, workers=2)
+
+    array_a_path = dump_directory_path / "arrays" / "array_a"
+    assert (array_a_path / "meta.json").exists()
+    assert len(list(array_a_path.iterdir())) > 2
+    assert ChunkedModel.load(tmp_path, TEST_MODEL_OBJECT_ID, workers=2) == model
+
+
+def test_io_chunked_partial_read(tmp_path: Path) -> None:
+    array_a = np.arange(1000, dtype=np.float64).reshape(40, 25)
+    model = ChunkedModel(array_a=array_a, array_b=np.ones(3))
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID)
+
+    loaded = ChunkedModel.load(tmp_path, TEST_MODEL_OBJECT_ID, fields=[])
+    assert isinstance(loaded.array_a, LazyChunkedArray)
+    assert loaded.array_a.shape == (40, 25)
+
+    for key in [(3, 4), (slice(5, 17), slice(None, None, 3)), (Ellipsis, -1), (slice(None, None, -7),), -2]:
+        np.testing.assert_array_equal(loaded.array_a[key], array_a[key])
+    assert not loaded.array_a.is_loaded
+    np.testing.assert_array_equal(loaded.array_a[[0, 2]], array_a[[0, 2]])
+
+    assert loaded == model
+
+
+def test_io_chunked_layout_switch(tmp_path: Path) -> None:
+    model = ChunkedModel(array_a=np.arange(30).reshape(5, 6), array_b=np.ones(3))
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID)
+    dump_directory_path = model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy")
+
+    assert sorted(path.name for path in (dump_directory_path / "arrays").iterdir()) == ["array_a.npy", "array_b.npy"]
+    assert ChunkedModel.load(tmp_path, TEST_MODEL_OBJECT_ID) == model
+
+
+@pytest.mark.parametrize("layout", ["npz", "npy"])
+def test_io_async_roundtrip(tmp_path: Path, layout: str) -> None:
+    model = TwoArrayModel(array_a=np.arange(3), array_b=np.ones((2, 2)), non_array=7)
+
+    async def roundtrip() -> tuple[NumpyModel, NumpyModel]:
+        with ThreadPoolExecutor(2) as executor:
+            await model.adump(tmp_path, TEST_MODEL_OBJECT_ID, executor=executor, layout=layout)
+            await model.adump(tmp_path, TEST_MODEL_OBJECT_ID, executor=executor, layout=layout)
+            return await asyncio.gather(
+                TwoArrayModel.aload(tmp_path, TEST_MODEL_OBJECT_ID, executor=executor),
+                amodel_agnostic_load(tmp_path, TEST_MODEL_OBJECT_ID, models=[TwoArrayModel], executor=executor),
+            )
+
+    assert asyncio.run(roundtrip()) == [model, model]
+    assert list(tmp_path.iterdir()) == [TwoArrayModel.model_directory_path(tmp_path, TEST_MODEL_OBJECT_ID)]
+
+
+class BlockingDumpModel(TwoArrayModel):
+    def dump(self, *args, **kwargs) -> Path:
+        dump_started.set()
+        release_dump.wait(timeout=10)
+        return super().dump(*args, **kwargs)
+
+
+dump_started, release_dump = threading.Event(), threading.Event()
+
+
+def test_io_async_dump_creates_output_directory(tmp_path: Path) -> None:
+    model = TwoArrayModel(array_a=np.arange(3), array_b=np.ones(3))
+    output_directory = tmp_path / "new" / "dumps"
+
+    dump_directory_path = asyncio.run(model.adump(output_directory, TEST_MODEL_OBJECT_ID))
+
+    assert dump_directory_path.parent == output_directory
+    assert [path.name for path in output_directory.iterdir()] == [dump_directory_path.name]
+    assert asyncio.run(TwoArrayModel.aload(output_directory, TEST_MODEL_OBJECT_ID)) == model
+
+
+def test_io_async_dump_cancelled(tmp_path: Path) -> None:
+    model = BlockingDumpModel(array_a=np.arange(3), array_b=np.ones((2, 2)))
+    executor = ThreadPoolExecutor(1)
+
+    async def cancelled_dump() -> None:
+        dump_task = asyncio.create_task(model.adump(tmp_path, TEST_MODEL_OBJECT_ID, executor=executor))
+        await asyncio.get_running_loop().run_in_executor(None, dump_started.wait)
+        dump_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await dump_task
+
+    asyncio.run(cancelled_dump())
+    release_dump.set()
+    executor.shutdown(wait=True)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_io_dump_many_load_many(tmp_path: Path, pool: str) -> None:
+    models_by_id = {
+        f"object_{index}": NpNDArrayModelWithNonArray(array=np.arange(index), non_array=index) for index in range(1, 10)
+    }
+    models_by_id["arbitrary"] = NpNDArrayModelWithNonArrayWithArbitrary(
+        array=np.zeros(2), non_array=0, my_arbitrary_slice=slice(1)
+    )
+
+    dump_results = NumpyModel.dump_many(models_by_id, tmp_path, workers=3, pool=pool)
+    assert dump_results[:-1] == [
+        NpNDArrayModelWithNonArray.model_directory_path(tmp_path, object_id) for object_id in list(models_by_id)[:-1]
+    ]
+    assert isinstance(dump_results[-1], AssertionError)
+
+    load_results = NpNDArrayModelWithNonArray.load_many(
+        tmp_path, [*reversed(list(models_by_id)[:-1]), "missing"], workers=3, pool=pool
+    )
+    assert load_results[:-1] == [*reversed(list(models_by_id.values())[:-1])]
+    assert isinstance(load_results[-1], Exception)
+
+
+def test_io_dump_many_load_many_validate_arguments(tmp_path: Path) -> None:
+    model = TwoArrayModel(array_a=np.arange(3), array_b=np.ones(3))
+
+    (dump_result,) = TwoArrayModel.dump_many({"a": model}, tmp_path, layout="npq")
+    assert isinstance(dump_result, ValidationError)
+    (load_result,) = TwoArrayModel.load_many(tmp_path, ["a"], mmap_mode="q")
+    assert isinstance(load_result, ValidationError)
+
+    with pytest.raises(TypeError, match="TwoArrayModel.dump_many got instances of NpNDArrayModelWithNonArray"):
+        TwoArrayModel.dump_many({"a": NpNDArrayModelWithNonArray(array=np.zeros(1), non_array=0)}, tmp_path)
+
+
+def test_io_dump_many_reports_missing_codec_package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    models_by_id = {
+        "lz4": TwoArrayModel(array_a=np.arange(3), array_b=np.ones(3)),
+        "zstd": PerFieldCodecModel(array_a=np.arange(3), array_b=np.ones(3)),
+    }
+
+    dump_path, dump_error = TwoArrayModel.dump_many(models_by_id, tmp_path)
+    assert dump_path == TwoArrayModel.model_directory_path(tmp_path, "lz4")
+    assert isinstance(dump_error, ImportError)
+
+
+def test_numpy_model_index(tmp_path: Path) -> None:
+    model_a = NpNDArrayModelWithNonArray(array=np.arange(3), non_array=1)
+    model_b = TwoArrayModel(array_a=np.arange(2), array_b=np.ones(2))
+    model_a.dump(tmp_path, "a.with.dots")
+    model_b.dump(tmp_path, "b")
+    (tmp_path / "unrelated").mkdir()
+
+    index = NumpyModelIndex(tmp_path, [NpNDArrayModelWithNonArray, TwoArrayModel])
+    assert sorted(index) == ["a.with.dots", "b"]
+    assert index.model_classes(["a.with.dots", "b", "c"]) == [NpNDArrayModelWithNonArray, TwoArrayModel, None]
+    assert index.load("a.with.dots") == model_a
+    assert index.load("c") is None
+    with pytest.raises(FileNotFoundError):
+        index.load("c", not_found_error=True)
+
+    model_b.dump(tmp_path, "c")
+    shutil.rmtree(NpNDArrayModelWithNonArray.model_directory_path(tmp_path, "a.with.dots"))
+    index.refresh(force=True)
+    assert sorted(index) == ["b", "c"]
+
+    load_results = index.load_many(["c", "a.with.dots", "b"])
+    assert load_results[0] == model_b and load_results[2] == model_b
+    assert isinstance(load_results[1], FileNotFoundError)
+
+
+@pytest.mark.parametrize(
+    "layout, codec", [("npz", None), pytest.param("npy", "zstd", marks=requires_zstandard), ("chunked", "lz4")]
+)
+def test_inspect(tmp_path: Path, layout: str, codec: Optional[str]) -> None:
+    model = TwoArrayModel(array_a=np.arange(6, dtype=np.int32).reshape(2, 3), array_b=np.ones(4))
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout=layout, codec=codec, checksum=None)
+    assert TwoArrayModel.inspect(tmp_path, TEST_MODEL_OBJECT_ID)["array_a"].checksum is None
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout=layout, codec=codec, checksum="blake2b")
+    assert TwoArrayModel.inspect(tmp_path, TEST_MODEL_OBJECT_ID)["array_a"].checksum == array_checksum(model.array_a)
+
+    dump_directory_path = model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout=layout, codec=codec)
+    array_a_info = TwoArrayModel.inspect(tmp_path, TEST_MODEL_OBJECT_ID)["array_a"]
+    assert array_a_info.shape == (2, 3)
+    assert array_a_info.dtype == np.int32
+    assert array_a_info.nbytes == 24
+    assert array_a_info.codec == (codec or "zlib")
+    assert array_a_info.checksum == array_checksum(np.arange(6, dtype=np.int32).reshape(2, 3), "crc32")
+
+    (dump_directory_path / "manifest.json").unlink()
+    assert TwoArrayModel.inspect(tmp_path, TEST_MODEL_OBJECT_ID)["array_a"] == array_a_info._replace(checksum=None)
+
+
+def test_array_checksum() -> None:
+    array = np.arange(12, dtype=np.float64).reshape(3, 4)
+
+    assert array_checksum(array) == array_checksum(np.asfortranarray(array))
+    assert array_checksum(array) != array_checksum(array.reshape(4, 3))
+    assert array_checksum(array) != array_checksum(array.astype(np.float32))
+    assert array_checksum(array[:, ::2]) == array_checksum(np.ascontiguousarray(array[:, ::2]))
+    assert array_checksum(np.array([object()])) is None
+
+    assert array_checksum(array, "crc32").startswith("crc32:")
+    assert array_checksum(array, "crc32") == array_checksum(np.asfortranarray(array), "crc32")
+    assert array_checksum(array, "crc32") != array_checksum(array.reshape(4, 3), "crc32")
+
+
+def test_io_blob_layout_deduplicates(tmp_path: Path) -> None:
+    shared = np.arange(1000, dtype=np.float64)
+    model_a = TwoArrayModel(array_a=shared, array_b=np.ones(3))
+    model_b = TwoArrayModel(array_a=shared.copy(), array_b=np.zeros(3))
+    model_a.dump(tmp_path, "a", layout="blob", codec="lz4")
+    model_b.dump(tmp_path, "b", layout="blob", codec="lz4")
+
+    blob_paths = sorted((tmp_path / ".pdnp-blobs").glob("*/*"))
+    assert len(blob_paths) == 3
+    assert not (TwoArrayModel.model_directory_path(tmp_path, "a") / "arrays.npz").exists()
+
+    loaded_b = TwoArrayModel.load(tmp_path, "b", exclude=["array_a"], mmap_mode="r")
+    assert isinstance(loaded_b.array_a, LazyNumpyArray)
+    assert loaded_b == model_b
+    with pytest.raises(ValueError, match="r\\+"):
+        TwoArrayModel.load(tmp_path, "b", mmap_mode="r+")
+
+    shutil.rmtree(TwoArrayModel.model_directory_path(tmp_path, "a"))
+    (tmp_path / ".pdnp-blobs" / ".DS_Store").touch()
+    assert TwoArrayModel.collect_blob_garbage(tmp_path) == []
+    removed_paths = TwoArrayModel.collect_blob_garbage(tmp_path, min_age=0)
+    assert [path.name for path in removed_paths] == [f"{array_checksum(np.ones(3)).partition(':')[2]}.npy.lz4"]
+    assert TwoArrayModel.load(tmp_path, "b") == model_b
+
+
+def test_io_async_blob_layout(tmp_path: Path) -> None:
+    model = TwoArrayModel(array_a=np.arange(3), array_b=np.ones(3))
+    asyncio.run(model.adump(tmp_path, TEST_MODEL_OBJECT_ID, layout="blob"))
+
+    assert len(list((tmp_path / ".pdnp-blobs").glob("*/*"))) == 2
+    assert TwoArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID) == model
+
+
+@pytest.mark.parametrize("layout", ["npy", "chunked", "blob"])
+def test_io_incremental_dump(tmp_path: Path, layout: str) -> None:
+    model = TwoArrayModel(array_a=np.arange(1000), array_b=np.ones(3), non_array=1)
+    assert model.changed_fields() == {"array_a", "array_b", "non_array"}
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout=layout)
+    assert model.changed_fields() == frozenset()
+
+    loaded = TwoArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID, exclude=["array_a"])
+    array_a_info = TwoArrayModel.inspect(tmp_path, TEST_MODEL_OBJECT_ID)["array_a"]
+    loaded.array_b = np.zeros(3)
+    loaded.non_array = 2
+    assert loaded.changed_fields() == {"array_b", "non_array"}
+
+    loaded.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout=layout, incremental=True)
+    assert not loaded.array_a.is_loaded
+    assert TwoArrayModel.inspect(tmp_path, TEST_MODEL_OBJECT_ID)["array_a"] == array_a_info
+    assert TwoArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID) == loaded
+
+    loaded.array_b[0] = 5
+    loaded.mark_changed("array_b")
+    loaded.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout=layout, incremental=True)
+    assert TwoArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID).array_b[0] == 5
+
+
+def test_io_incremental_dump_rewrites_only_changed_files(tmp_path: Path) -> None:
+    model = TwoArrayModel(array_a=np.arange(1000), array_b=np.ones(3))
+    dump_directory_path = model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy")
+    array_a_stat = (dump_directory_path / "arrays" / "array_a.npy").stat()
+
+    model.array_b = np.zeros(3)
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy", incremental=True)
+    assert (dump_directory_path / "arrays" / "array_a.npy").stat().st_mtime_ns == array_a_stat.st_mtime_ns
+
+    model.dump(tmp_path, OTHER_TEST_MODEL_OBJECT_ID, layout="npy", incremental=True)
+    assert TwoArrayModel.load(tmp_path, OTHER_TEST_MODEL_OBJECT_ID) == model
+
+
+@pytest.mark.parametrize("layout", ["npy", "chunked"])
+def test_io_incremental_dump_after_append(tmp_path: Path, layout: str) -> None:
+    model = TwoArrayModel(array_a=np.arange(6).reshape(3, 2), array_b=np.ones(3))
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout=layout)
+    loaded = TwoArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID)
+
+    TwoArrayModel.append(tmp_path, TEST_MODEL_OBJECT_ID, field="array_a", rows=np.zeros((2, 2), dtype=int))
+    loaded.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout=layout, incremental=True)
+    assert TwoArrayModel.inspect(tmp_path, TEST_MODEL_OBJECT_ID)["array_a"].shape == (3, 2)
+    assert TwoArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID) == loaded
+
+
+def test_mark_changed_unknown_field() -> None:
+    with pytest.raises(ValueError, match="unknown"):
+        TwoArrayModel(array_a=np.arange(3), array_b=np.ones(3)).mark_changed("unknown")
+
+
+def test_io_append_npy_in_place(tmp_path: Path) -> None:
+    model = TwoArrayModel(array_a=np.arange(12.0).reshape(4, 3), array_b=np.ones(3))
+    dump_directory_path = model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy")
+    array_a_path = dump_directory_path / "arrays" / "array_a.npy"
+    array_a_inode = array_a_path.stat().st_ino
+    array_b_mtime = (dump_directory_path / "arrays" / "array_b.npy").stat().st_mtime_ns
+
+    rows = np.full((2, 3), -1)
+    assert TwoArrayModel.append(tmp_path, TEST_MODEL_OBJECT_ID, field="array_a", rows=rows) == (6, 3)
+    assert array_a_path.stat().st_ino == array_a_inode
+    assert (dump_directory_path / "arrays" / "array_b.npy").stat().st_mtime_ns == array_b_mtime
+
+    loaded = TwoArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID)
+    np.testing.assert_array_equal(loaded.array_a, np.concatenate([model.array_a, rows]))
+    assert loaded.array_a.dtype == model.array_a.dtype
+    assert TwoArrayModel.inspect(tmp_path, TEST_MODEL_OBJECT_ID)["array_a"].shape == (6, 3)
+
+
+@pytest.mark.parametrize("n_rows", [1, 5, 40])
+def test_io_append_chunked(tmp_path: Path, n_rows: int) -> None:
+    model = ChunkedModel(array_a=np.arange(50).reshape(25, 2), array_b=np.ones(3))
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID)
+
+    rows = np.arange(2 * n_rows).reshape(n_rows, 2)
+    ChunkedModel.append(tmp_path, TEST_MODEL_OBJECT_ID, field="array_a", rows=rows)
+
+    loaded = ChunkedModel.load(tmp_path, TEST_MODEL_OBJECT_ID, exclude=["array_a"])
+    expected = np.concatenate([model.array_a, rows])
+    np.testing.assert_array_equal(loaded.array_a[-n_rows - 3 :], expected[-n_rows - 3 :])
+    np.testing.assert_array_equal(ChunkedModel.load(tmp_path, TEST_MODEL_OBJECT_ID).array_a, expected)
+
+
+def test_io_append_rejections(tmp_path: Path) -> None:
+    model = TwoArrayModel(array_a=np.arange(12).reshape(4, 3), array_b=np.ones(3))
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy")
+    model.dump(tmp_path, OTHER_TEST_MODEL_OBJECT_ID, layout="npy", codec="lz4")
+
+    with pytest.raises(ValueError, match="shape"):
+        TwoArrayModel.append(tmp_path, TEST_MODEL_OBJECT_ID, field="array_a", rows=np.ones((1, 2)))
+    with pytest.raises(TypeError):
+        TwoArrayModel.append(tmp_path, TEST_MODEL_OBJECT_ID, field="array_a", rows=np.ones((1, 3)))
+    with pytest.raises(ValueError, match="unknown"):
+        TwoArrayModel.append(tmp_path, TEST_MODEL_OBJECT_ID, field="unknown", rows=np.ones((1, 3)))
+    with pytest.raises(ValueError, match="in place"):
+        TwoArrayModel.append(tmp_path, OTHER_TEST_MODEL_OBJECT_ID, field="array_a", rows=np.ones((1, 3), dtype=int))
+    with pytest.raises(FileNotFoundError):
+        TwoArrayModel.append(tmp_path, "missing", field="array_a", rows=np.ones((1, 3), dtype=int))
+
+
+def test_equality_compares_fields_in_place() -> None:
+    array = np.arange(6.0).reshape(2, 3)
+    model = TwoArrayModel(array_a=array, array_b=np.ones(3))
+
+    assert model == TwoArrayModel(array_a=array, array_b=np.ones(3))
+    assert model == TwoArrayModel(array_a=array + 1e-9, array_b=np.ones(3))
+    assert model != TwoArrayModel(array_a=array.astype(np.float32), array_b=np.ones(3))
+    assert model != TwoArrayModel(array_a=array.T, array_b=np.ones(3))
+    assert model != TwoArrayModel(array_a=array, array_b=np.ones(3), non_array=0)
+
+
+def test_equality_nested_models() -> None:
+    def streaming_model(weight: float) -> StreamingModel:
+        return StreamingModel(
+            array=np.arange(3),
+            timestamps=np.array(["2024-01-01"], dtype="datetime64[D]"),
+            nested=NestedStreamingModel(weights=np.full((2, 2), weight, dtype=np.float32)),
+        )
+
+    assert streaming_model(1.0) == streaming_model(1.0)
+    assert streaming_model(1.0) != streaming_model(2.0)
+
+
+class PlainArrayModel(BaseModel):
+    weights: NpNDArray
+
+
+class PlainNestingModel(NumpyModel):
+    plain: PlainArrayModel
+
+
+def test_equality_nested_pydantic_models() -> None:
+    def plain_nesting_model(weight: float) -> PlainNestingModel:
+        return PlainNestingModel(plain=PlainArrayModel(weights=np.full(3, weight)))
+
+    assert plain_nesting_model(1.0) == plain_nesting_model(1.0)
+    assert plain_nesting_model(1.0) == plain_nesting_model(1.0 + 1e-12)
+    assert plain_nesting_model(1.0) != plain_nesting_model(2.0)
+
+
+class FrozenModel(TwoArrayModel):
+    model_config = ConfigDict(frozen=True)
+    _exact_equality = True
+
+
+def test_fingerprint() -> None:
+    array = np.arange(24.0).reshape(4, 6)
+    model = TwoArrayModel(array_a=array[:, ::2], array_b=np.ones(3))
+
+    assert model.fingerprint().startswith("blake2b:")
+    assert model.fingerprint() == TwoArrayModel(array_a=array[:, ::2].copy(), array_b=np.ones(3)).fingerprint()
+    assert model.fingerprint() != TwoArrayModel(array_a=array[:, 1::2], array_b=np.ones(3)).fingerprint()
+    assert model.fingerprint() != TwoArrayModel(array_a=array[:, ::2], array_b=np.ones(3), non_array=1).fingerprint()
+    assert model.fingerprint() != TwoArrayModel(array_a=array[:, ::2], array_b=np.ones(3, np.float32)).fingerprint()
+
+    model.array_b = np.zeros(3)
+    assert model.fingerprint() == TwoArrayModel(array_a=array[:, ::2], array_b=np.zeros(3)).fingerprint()
+
+
+def test_frozen_model_hash() -> None:
+    model = FrozenModel(array_a=np.arange(3.0), array_b=np.ones(3))
+    same_model = FrozenModel(array_a=np.arange(3.0), array_b=np.ones(3))
+    close_model = FrozenModel(array_a=np.arange(3.0) + 1e-9, array_b=np.ones(3))
+
+    assert model == same_model and hash(model) == hash(same_model)
+    assert model != close_model
+    assert len({model, same_model, close_model}) == 2
+
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(TwoArrayModel(array_a=np.arange(3.0), array_b=np.ones(3)))
+
+
+class FrozenToleranceModel(TwoArrayModel):
+    model_config = ConfigDict(frozen=True)
+
+
+def test_frozen_model_without_exact_equality() -> None:
+    model = FrozenToleranceModel(array_a=np.arange(3.0), array_b=np.ones(3))
+
+    assert model == FrozenToleranceModel(array_a=np.arange(3.0) + 1e-9, array_b=np.ones(3))
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(model)
+
+
+class CanonicalFingerprintModel(NumpyModel):
+    model_config = ConfigDict(frozen=True)
+    _exact_equality = True
+
+    array: NpNDArray
+    mapping: dict[str, int]
+    members: frozenset[str]
+    value: float
+    plain: PlainArrayModel
+
+
+def test_fingerprint_of_equal_values() -> None:
+    def canonical_model(array: np.ndarray, mapping: dict[str, int], members: list[str], value: float):
+        return CanonicalFingerprintModel(
+            array=array, mapping=mapping, members=frozenset(members), value=value, plain=PlainArrayModel(weights=array)
+        )
+
+    model = canonical_model(np.zeros(3), {"a": 1, "b": 2}, [f"member_{index}" for index in range(20)], 0.0)
+    equal_model = canonical_model(
+        np.array([0.0, -0.0, 0.0]), {"b": 2, "a": 1}, [f"member_{index}" for index in reversed(range(20))], -0.0
+    )
+
+    assert model == equal_model and hash(model) == hash(equal_model)
+    assert model != canonical_model(np.zeros(3), {"a": 1, "b": 3}, ["member_0"], 0.0)
+    assert model != canonical_model(np.zeros(3), {"a": 1, "b": 2}, [f"member_{index}" for index in range(20)], 0.5)
+
+
+def test_frozen_model_copy_fingerprint() -> None:
+    model = FrozenModel(array_a=np.arange(3.0), array_b=np.ones(3))
+    model_hash = hash(model)
+
+    updated = model.model_copy(update={"array_a": np.zeros(3)})
+    assert updated != model and hash(updated) != model_hash
+    assert updated.fingerprint() == FrozenModel(array_a=np.zeros(3), array_b=np.ones(3)).fingerprint()
+    assert model.model_copy(deep=True) == model
+
+
+class TreeModel(NumpyModel):
+    child: NestedStreamingModel
+    layers: list[NpNDArray]
+    named: dict[str, NpNDArray]
+    label: str = "label"
+
+
+@pytest.fixture
+def tree_model() -> TreeModel:
+    return TreeModel(
+        child=NestedStreamingModel(weights=np.ones((2, 2), dtype=np.float32), non_array=0),
+        layers=[np.arange(3), np.zeros((2, 2))],
+        named={"bias": np.full(4, 2.0)},
+    )
+
+
+@pytest.mark.parametrize("layout", ["npz", "npy", "chunked", "blob"])
+def test_io_nested_arrays(tmp_path: Path, tree_model: TreeModel, layout: str) -> None:
+    dump_directory_path = tree_model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout=layout)
+
+    assert TreeModel.inspect(tmp_path, TEST_MODEL_OBJECT_ID).keys() == {
+        "child.weights",
+        "layers.0",
+        "layers.1",
+        "named.bias",
+    }
+    assert "!!" not in (dump_directory_path / "object_info.yaml").read_text()
+
+    loaded = TreeModel.load(tmp_path, TEST_MODEL_OBJECT_ID, exclude=["layers"])
+    assert isinstance(loaded.layers[0], LazyNumpyArray)
+    assert loaded.child.non_array == 0
+    assert loaded == tree_model
+
+
+def test_io_nested_arrays_incremental(tmp_path: Path, tree_model: TreeModel) -> None:
+    dump_directory_path = tree_model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy")
+    layer_stat = (dump_directory_path / "arrays" / "layers.0.npy").stat()
+
+    tree_model.child = NestedStreamingModel(weights=np.zeros((3, 3), dtype=np.float32))
+    tree_model.named = {}
+    tree_model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy", incremental=True)
+
+    assert (dump_directory_path / "arrays" / "layers.0.npy").stat().st_mtime_ns == layer_stat.st_mtime_ns
+    assert "named.bias" not in TreeModel.inspect(tmp_path, TEST_MODEL_OBJECT_ID)
+    assert TreeModel.load(tmp_path, TEST_MODEL_OBJECT_ID) == tree_model
+
+
+class OptionalArrayModel(NumpyModel):
+    array: Optional[NpNDArray] = None
+    scale: float = 1.0
+    cache_hint: str = Field("hint", exclude=True)
+
+    @field_serializer("scale")
+    def serialize_scale(self, scale: float) -> float:
+        return round(scale, 2)
+
+
+class OnlyOptionalArrayModel(NumpyModel):
+    array: Optional[NpNDArray] = None
+
+
+@pytest.mark.parametrize("first_pickle, second_pickle", [(False, False), (False, True), (True, False)])
+def test_io_redump_over_previous_dump(tmp_path: Path, first_pickle: bool, second_pickle: bool) -> None:
+    OnlyOptionalArrayModel(array=None).dump(tmp_path, TEST_MODEL_OBJECT_ID, pickle=first_pickle)
+    model = OnlyOptionalArrayModel(array=np.zeros(3))
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID, pickle=second_pickle)
+
+    loaded = OnlyOptionalArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID)
+    assert loaded == model and loaded.array is not None
+
+
+def test_io_dump_applies_model_serialization(tmp_path: Path) -> None:
+    dump_directory_path = OptionalArrayModel(scale=0.123456, cache_hint="other").dump(tmp_path, TEST_MODEL_OBJECT_ID)
+
+    assert "cache_hint" not in (dump_directory_path / "object_info.yaml").read_text()
+    loaded = OptionalArrayModel.load(tmp_path, TEST_MODEL_OBJECT_ID)
+    assert loaded.scale == 0.12 and loaded.cache_hint == "hint"
+
+
+class SerializedChildModel(BaseModel):
+    weights: NpNDArray
+    offset: float
+    cache_hint: str = Field("hint", exclude=True)
+
+    @field_serializer("offset")
+    def serialize_offset(self, offset: float) -> float:
+        return round(offset, 2)
+
+
+class SerializedParentModel(NumpyModel):
+    child: SerializedChildModel
+    metadata: dict[str, list[int]]
+
+
+def test_dump_split_walks_fields_without_copies(tmp_path: Path) -> None:
+    model = SerializedParentModel(
+        child=SerializedChildModel(weights=np.ones(3), offset=0.123456, cache_hint="other"), metadata={"a": [1, 2]}
+    )
+
+    ndarray_key_to_array, other_field_to_value = model._dump_numpy_split_dict()
+    assert ndarray_key_to_array["child.weights"] is model.child.weights
+    assert other_field_to_value["metadata"] is model.metadata
+    assert other_field_to_value["child"] == {"weights": None, "offset": 0.12}
+
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID)
+    loaded = SerializedParentModel.load(tmp_path, TEST_MODEL_OBJECT_ID)
+    assert loaded.child.offset == 0.12 and loaded.child.cache_hint == "hint"
+
+
+class DeferredBuildModel(TwoArrayModel):
+    model_config = ConfigDict(defer_build=True)
+
+
+def test_deferred_schema_build(tmp_path: Path) -> None:
+    assert not DeferredBuildModel.__pydantic_complete__
+
+    model = DeferredBuildModel(array_a=np.arange(3), array_b=np.ones(3))
+    model.dump(tmp_path, TEST_MODEL_OBJECT_ID, layout="npy")
+    assert DeferredBuildModel.load(tmp_path, TEST_MODEL_OBJECT_ID) == model
+    assert DeferredBuildModel.inspect(tmp_path, TEST_MODEL_OBJECT_ID).keys() == {"array_a", "array_b"}
@@ -1,5 +1,6 @@
 import platform
 import tempfile
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
@@ -10,9 +11,15 @@ import pytest
 from numpy.testing import assert_almost_equal
 from pydantic import ValidationError
 
-from pydantic_numpy.helper.validation import PydanticNumpyMultiArrayNumpyFileOnFilePath
-from pydantic_numpy.model import MultiArrayNumpyFile
-from pydantic_numpy.typing import Np1DArrayInt64
+from pydantic_numpy import np_array_pydantic_annotated_typing
+from pydantic_numpy.helper.cache import ArrayCache, ArrayCacheStats
+from pydantic_numpy.helper.validation import (
+    PydanticNumpyMultiArrayNumpyFileOnFilePath,
+    deserialize_numpy_array_from_data_dict,
+    validated_array_file_cache,
+)
+from pydantic_numpy.model import LazyNumpyArray, MultiArrayNumpyFile
+from pydantic_numpy.typing import Np1DArrayInt64, NpNDArray
 from pydantic_numpy.util import np_general_all_close
 from tests.helper.cache import get_numpy_type_model
 from tests.helper.testing_groups import (
@@ -145,3 +152,175 @@ if platform.system() == "Linux":
 
         with pytest.raises(ValidationError):
             get_numpy_type_model(pydantic_typing)(array_field=bad_numpy_array)
+
+
+@pytest.mark.parametrize(
+    "data_dict, expected",
+    [
+        ({"data_type": "int16", "data": [[1.0, 2.0], [3.0, 4.0]]}, np.array([[1, 2], [3, 4]], dtype=np.int16)),
+        ({"data_type": "float32", "data": [[[1.0]], [[2.0]]]}, np.array([[[1.0]], [[2.0]]], dtype=np.float32)),
+        ({"data_type": "datetime64[s]", "data": [0, 86400]}, np.array(["1970-01-01", "1970-01-02"], "datetime64[s]")),
+        ({"data_type": "bool", "data": [1.0, 0.0]}, np.array([True, False])),
+        ({"data_type": "float64", "data": []}, np.array([], dtype=np.float64)),
+        ({"data_type": "float64", "data": 5.0}, np.array(5.0)),
+    ],
+)
+def test_deserialize_data_dict(data_dict: dict, expected: np.ndarray):
+    array = deserialize_numpy_array_from_data_dict(data_dict)
+
+    assert array.dtype == expected.dtype
+    assert array.shape == expected.shape
+    assert np.all(array == expected)
+
+
+@pytest.mark.parametrize(
+    "bad_data_dict",
+    [
+        {"data_type": "float64", "data": [[1.0, 2.0], [3.0]]},
+        {"data_type": "float64", "data": [[1.0], 2.0]},
+        {"data_type": "float64", "data": [1.0, [2.0]]},
+        {"data_type": "int8", "data": [1000]},
+        {"data_type": "float64"},
+        {"data": [1.0]},
+    ],
+)
+def test_deserialize_bad_data_dict(bad_data_dict: dict):
+    with pytest.raises(ValidationError):
+        get_numpy_type_model(NpNDArray)(array_field=bad_data_dict)
+
+
+LazyNp2DArrayInt32 = np_array_pydantic_annotated_typing(data_type=np.int32, dimensions=2, lazy=True)
+LazyNpStrictNDArrayFp32 = np_array_pydantic_annotated_typing(data_type=np.float32, strict_data_typing=True, lazy=True)
+
+
+def test_lazy_file_path_validation_reads_header_only(tmp_path: Path):
+    np.save(tmp_path / "array.npy", np.array([[0.6, 1.4]]))
+    lazy_array = get_numpy_type_model(LazyNp2DArrayInt32)(array_field=tmp_path / "array.npy").array_field
+
+    assert isinstance(lazy_array, LazyNumpyArray)
+    assert not lazy_array.is_loaded
+    assert lazy_array.shape == (1, 2)
+    assert lazy_array.dtype == np.int32
+
+    np.testing.assert_array_equal(lazy_array[0], np.array([1, 1], dtype=np.int32))
+    assert lazy_array.is_loaded
+    assert lazy_array.load().dtype == np.int32
+
+
+def test_lazy_multi_array_numpy_file(tmp_path: Path):
+    np.savez_compressed(tmp_path / "arrays.npz", a=np.ones((2, 3), dtype=np.int32), b=np.ones(2))
+    model = get_numpy_type_model(LazyNp2DArrayInt32)
+    lazy_array = model(array_field=MultiArrayNumpyFile(path=tmp_path / "arrays.npz", key="a")).array_field
+
+    assert not lazy_array.is_loaded
+    assert np.asarray(lazy_array).sum() == 6
+
+    with pytest.raises(ValidationError):
+        model(array_field=MultiArrayNumpyFile(path=tmp_path / "arrays.npz", key="b"))
+
+
+def test_lazy_strict_data_type_checked_from_header(tmp_path: Path):
+    np.save(tmp_path / "array.npy", np.ones(3, dtype=np.float64))
+
+    with pytest.raises(ValidationError):
+        get_numpy_type_model(LazyNpStrictNDArrayFp32)(array_field=tmp_path / "array.npy")
+
+
+def test_lazy_array_accepted_by_eager_type(tmp_path: Path):
+    np.save(tmp_path / "array.npy", np.ones(3, dtype=np.float64))
+    lazy_array = LazyNumpyArray(tmp_path / "array.npy")
+
+    validated = get_numpy_type_model(Np1DArrayInt64)(array_field=lazy_array).array_field
+
+    assert isinstance(validated, LazyNumpyArray)
+    assert validated.dtype == np.int64
+    assert not lazy_array.is_loaded
+    np.testing.assert_array_equal(validated.load(), np.ones(3, dtype=np.int64))
+
+
+def test_lazy_array_behaves_like_ndarray(tmp_path: Path):
+    array = np.arange(4.0)
+    np.save(tmp_path / "array.npy", array)
+    lazy_array = LazyNumpyArray(tmp_path / "array.npy")
+
+    np.testing.assert_array_equal(lazy_array * 2, array * 2)
+    np.testing.assert_array_equal(1 + lazy_array, array + 1)
+    np.testing.assert_array_equal(-lazy_array, -array)
+    np.testing.assert_array_equal(lazy_array > 1, array > 1)
+    np.testing.assert_array_equal(lazy_array == array, np.ones(4, dtype=bool))
+    np.testing.assert_array_equal(lazy_array + lazy_array, array * 2)
+    assert isinstance(lazy_array * 2, np.ndarray)
+
+    assert np.sum(lazy_array) == 6
+    np.testing.assert_array_equal(np.stack([lazy_array, array]), np.stack([array, array]))
+    np.testing.assert_array_equal(np.sqrt(lazy_array), np.sqrt(array))
+
+    out = np.empty(4)
+    np.add(lazy_array, 1, out=out)
+    np.testing.assert_array_equal(out, array + 1)
+
+    with pytest.raises(ValueError, match="ambiguous"):
+        bool(lazy_array)
+    assert bool(LazyNumpyArray(tmp_path / "array.npy")[1:2])
+
+
+def test_multi_array_numpy_file_cached_load(tmp_path: Path):
+    MultiArrayNumpyFile.cache.clear()
+    np.savez_compressed(tmp_path / "arrays.npz", a=np.ones(3), b=np.zeros(2))
+    multi_array_file = MultiArrayNumpyFile(path=tmp_path / "arrays.npz", key="a", cached_load=True)
+
+    array = multi_array_file.load()
+    assert multi_array_file.load() is array
+    assert not array.flags.writeable
+    assert MultiArrayNumpyFile.cache.stats() == ArrayCacheStats(hits=1, misses=1, evictions=0, entries=1, nbytes=24)
+
+    np.savez_compressed(tmp_path / "arrays.npz", a=np.full(4, 2.0))
+    np.testing.assert_array_equal(multi_array_file.load(), np.full(4, 2.0))
+    assert MultiArrayNumpyFile.cache.stats().nbytes == 32
+
+
+def test_array_cache_evicts_least_recently_used(tmp_path: Path):
+    cache = ArrayCache(max_bytes=200)
+    paths = []
+    for index in range(3):
+        paths.append(tmp_path / f"{index}.npy")
+        np.save(paths[-1], np.arange(10))
+
+    for path in [paths[0], paths[1], paths[0], paths[2]]:
+        cache.get(path, "", partial(np.load, path))
+    assert cache.stats() == ArrayCacheStats(hits=1, misses=3, evictions=1, entries=2, nbytes=160)
+
+    cache.get(paths[0], "", partial(np.load, paths[0]))
+    assert cache.stats().hits == 2
+
+    np.save(paths[1], np.arange(100))
+    assert cache.get(paths[1], "", partial(np.load, paths[1])).size == 100
+    assert cache.stats().entries == 2
+
+
+def test_cached_file_validation(tmp_path: Path):
+    validated_array_file_cache.clear()
+    np.save(tmp_path / "array.npy", np.ones((2, 3), dtype=np.float64))
+    model = get_numpy_type_model(np_array_pydantic_annotated_typing(np.int32, 2, cached_file_validation=True))
+
+    array = model(array_field=tmp_path / "array.npy").array_field
+    assert array.dtype == np.int32
+    assert not array.flags.writeable
+    assert model(array_field=tmp_path / "array.npy").array_field is array
+
+    other_model = get_numpy_type_model(np_array_pydantic_annotated_typing(np.float32, cached_file_validation=True))
+    assert other_model(array_field=tmp_path / "array.npy").array_field.dtype == np.float32
+    assert validated_array_file_cache.stats().entries == 2
+
+    np.save(tmp_path / "array.npy", np.zeros((3, 3), dtype=np.float64))
+    np.testing.assert_array_equal(model(array_field=tmp_path / "array.npy").array_field, np.zeros((3, 3)))
+
+    with pytest.raises(ValidationError):
+        get_numpy_type_model(np_array_pydantic_annotated_typing(np.int32, 1, cached_file_validation=True))(
+            array_field=tmp_path / "array.npy"
+        )
+
+
+def test_cached_file_validation_not_lazy():
+    with pytest.raises(ValueError, match="Lazy"):
+        np_array_pydantic_annotated_typing(np.int32, lazy=True, cached_file_validation=True)
@@ -30,6 +30,40 @@ def write_annotations(output_folder: Path, strict: bool) -> None:
             f.write(generate_template(dimensions, contents, all_types))
 
 
+def write_package_init(package_folder: Path) -> None:
+    """
+    Generate and write the __init__ of the typing package, which imports the annotation modules on first access
+
+    The name table maps every annotation to the module that defines it; static type checkers see star imports of all
+    modules instead.
+
+    Parameters
+    ----------
+    package_folder : Path
+        path of the typing package, the annotations of both write_annotations calls are listed
+
+    Returns
+    -------
+    None
+    """
+    package = ".".join(package_folder.parts)
+    name_to_module = {
+        full_type_name: f"{package}{'.strict_data_type' if strict else ''}.{filename.removesuffix('.py')}"
+        for strict in (False, True)
+        for dimensions, filename in _DIMENSIONS_TO_FILENAME.items()
+        for full_type_name in _list_all_types(dimensions, strict)
+    }
+    # Sorted like isort, so the formatter leaves the generated file unchanged
+    star_imports = "\n".join(f"from {module} import *" for module in sorted(set(name_to_module.values())))
+    name_table = "\n".join(_indent(f"{_quote(name)}: {_quote(module)},") for name, module in name_to_module.items())
+    all_types = "\n".join(_indent(f"{_quote(name)},") for name in name_to_module)
+
+    filename = package_folder / "__init__.py"
+    print(f"Writing {filename}..")
+    with open(filename, "w") as f:
+        f.write(_generate_package_init_template(star_imports, name_table, all_types))
+
+
 _DATA_TYPES: Final = {
     "": "None",
     "Int64": "np.int64",
@@ -155,6 +189,44 @@ __all__ = [
     return template
 
 
+def _generate_package_init_template(star_imports: str, name_table: str, all_types: str) -> str:
+    template = f'''"""
+Array type hints; the module that defines a type hint is imported on first access, see typegen/generate_typing.py
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+{_indent(star_imports)}
+
+_NAME_TO_MODULE: Final[dict[str, str]] = {{
+{name_table}
+}}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = importlib.import_module(_NAME_TO_MODULE[name])
+    except KeyError:
+        msg = f"module {{__name__!r}} has no attribute {{name!r}}"
+        raise AttributeError(msg) from None
+
+    globals().update({{type_name: getattr(module, type_name) for type_name in module.__all__}})
+    return globals()[name]
+
+
+def __dir__() -> list[str]:
+    return sorted({{*globals(), *_NAME_TO_MODULE}})
+
+
+__all__ = [
+{all_types}
+]
+'''
+    return template
+
+
 def _list_all_types(dimensions: int, strict: bool) -> list[str]:
     return [
         _type_name_with_prefix(dimensions, type_name, strict)
@@ -166,3 +238,4 @@ def _list_all_types(dimensions: int, strict: bool) -> list[str]:
 if __name__ == "__main__":
     write_annotations(Path("pydantic_numpy/typing"), strict=False)
     write_annotations(Path("pydantic_numpy/typing/strict_data_type"), strict=True)
+    write_package_init(Path("pydantic_numpy/typing"))